@@ -1,7 +1,8 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 
-from .models import User
+from .deletion import schedule_deletion
+from .models import DeletionJob, User
 
 
 @admin.register(User)
@@ -24,3 +25,22 @@ class UserAdmin(BaseUserAdmin):
         ),
     )
     search_fields = ("email",)
+
+    # Deleting an account cascades widely; hide it now and let a
+    # DeletionJob remove the rows in batches (accounts/deletion.py).
+    def delete_model(self, request, obj):
+        schedule_deletion(obj, requested_by=request.user)
+
+    def delete_queryset(self, request, queryset):
+        for user in queryset:
+            schedule_deletion(user, requested_by=request.user)
+
+
+@admin.register(DeletionJob)
+class DeletionJobAdmin(admin.ModelAdmin):
+    list_display = ("target", "object_id", "status", "current_step", "updated_at")
+    list_filter = ("status", "target")
+    readonly_fields = [field.name for field in DeletionJob._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
@@ -0,0 +1,152 @@
+# accounts/deletion.py
+"""
+Chunked, resumable cascade deletes.
+
+Deleting a busy listing or a long-lived account in one ``obj.delete()``
+collects and removes every dependent row in a single transaction, holding
+locks for as long as that takes. Instead:
+
+1. `schedule_deletion(obj)` soft-hides ``obj`` straight away (the model's
+   ``hide_for_deletion()``: a listing gets ``deleted_at`` and drops out of
+   every query, a user is deactivated), records a `DeletionJob` and queues
+   it on the background pool once the request commits.
+2. `run_job(id)` walks the CASCADE graph under the object leaves-first
+   (`plan_for`) and deletes each dependent model in batches of BATCH_SIZE
+   primary keys, one short transaction per batch. Every batch goes through
+   the ORM, so signals (counters, rollups, search index, caches) still run.
+   The object itself goes last.
+3. Progress – rows deleted per model, current step – is saved on the job
+   after each batch (admin, ``GET /api/deletion-jobs/<id>/``).
+
+Every step just re-selects "rows still pointing at the object", so a job
+interrupted anywhere resumes by starting over: finished steps cost one
+empty query. `manage.py process_deletion_jobs` (cron) picks up jobs whose
+worker died – pending, or running without a heartbeat for STALE_AFTER.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import List, Optional, Tuple, Type
+
+from django.apps import apps
+from django.db import IntegrityError, models, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from backend.background import run_after_commit
+
+from .models import DeletionJob
+
+log = logging.getLogger(__name__)
+
+BATCH_SIZE = 500
+STALE_AFTER = timedelta(minutes=5)
+
+Step = Tuple[Type[models.Model], str]  # (model, lookup from it to the root pk)
+
+
+def plan_for(model: Type[models.Model]) -> List[Step]:
+    """Every model that CASCADE-depends on ``model``, leaves first."""
+    steps: List[Step] = []
+
+    def walk(parent, path: str, seen: frozenset) -> None:
+        for rel in parent._meta.related_objects:
+            child = rel.related_model
+            # m2m rows (auto-created through tables) go with their parent's
+            # batch; SET_NULL / PROTECT / … are left to the ORM.
+            if rel.on_delete is not models.CASCADE or child._meta.auto_created:
+                continue
+            if child in seen:
+                continue
+            lookup = f"{rel.field.name}__{path}" if path else rel.field.name
+            walk(child, lookup, seen | {child})
+            steps.append((child, lookup))
+
+    walk(model, "", frozenset({model}))
+    return steps
+
+
+def schedule_deletion(obj: models.Model, requested_by=None) -> DeletionJob:
+    """Hide ``obj`` now and delete it (and its dependents) in the background."""
+    with transaction.atomic():
+        obj.hide_for_deletion()
+        try:
+            with transaction.atomic():
+                job = DeletionJob.objects.create(
+                    target=obj._meta.label,
+                    object_id=obj.pk,
+                    requested_by_id=getattr(requested_by, "pk", None),
+                )
+        except IntegrityError:  # already being deleted
+            job = DeletionJob.objects.get(
+                target=obj._meta.label,
+                object_id=obj.pk,
+                status__in=[DeletionJob.Status.PENDING, DeletionJob.Status.RUNNING],
+            )
+        run_after_commit(run_job, job.pk)
+    return job
+
+
+def _claim(job_id: int) -> Optional[DeletionJob]:
+    """Atomically take a job that's pending or whose worker went quiet."""
+    now = timezone.now()
+    claimed = (
+        DeletionJob.objects.filter(pk=job_id)
+        .filter(
+            Q(status=DeletionJob.Status.PENDING)
+            | Q(status=DeletionJob.Status.RUNNING, updated_at__lt=now - STALE_AFTER)
+        )
+        .update(status=DeletionJob.Status.RUNNING, updated_at=now)
+    )
+    return DeletionJob.objects.get(pk=job_id) if claimed else None
+
+
+def _delete_batches(job: DeletionJob, model, lookup: str, value) -> None:
+    label = model._meta.label
+    job.current_step = label
+    while True:
+        with transaction.atomic():
+            pks = list(
+                model._base_manager.filter(**{lookup: value})
+                .order_by()
+                .values_list("pk", flat=True)[:BATCH_SIZE]
+            )
+            if not pks:
+                return
+            model._base_manager.filter(pk__in=pks).delete()
+        job.deleted[label] = job.deleted.get(label, 0) + len(pks)
+        job.save(update_fields=["current_step", "deleted", "updated_at"])
+
+
+def run_job(job_id: int) -> None:
+    job = _claim(job_id)
+    if job is None:
+        return  # finished, or another worker has it
+    model = apps.get_model(job.target)
+    try:
+        for child, lookup in plan_for(model):
+            _delete_batches(job, child, lookup, job.object_id)
+        _delete_batches(job, model, "pk", job.object_id)
+    except Exception as exc:
+        log.exception("Deletion job %s failed", job.pk)
+        job.status = DeletionJob.Status.FAILED
+        job.error = f"{type(exc).__name__}: {exc}"
+        job.save(update_fields=["status", "error", "updated_at"])
+        return
+    job.status = DeletionJob.Status.DONE
+    job.current_step = ""
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "current_step", "finished_at", "updated_at"])
+
+
+def resumable_jobs():
+    """Jobs a sweeper should (re)start: pending, or running without a heartbeat."""
+    stale = Q(
+        status=DeletionJob.Status.RUNNING,
+        updated_at__lt=timezone.now() - STALE_AFTER,
+    )
+    return DeletionJob.objects.filter(
+        Q(status=DeletionJob.Status.PENDING) | stale
+    ).order_by("created_at")
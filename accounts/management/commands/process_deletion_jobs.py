@@ -0,0 +1,37 @@
+"""
+Run (or resume) background cascade deletes.
+
+    python manage.py process_deletion_jobs                  # pending + stalled jobs
+    python manage.py process_deletion_jobs --retry-failed   # …and failed ones too
+
+Jobs normally run on the web process that scheduled them; schedule this
+every few minutes from cron so jobs lost to a restart or crash still
+finish. Resuming is safe at any point (see accounts/deletion.py).
+"""
+
+from django.core.management.base import BaseCommand
+
+from accounts.deletion import resumable_jobs, run_job
+from accounts.models import DeletionJob
+
+
+class Command(BaseCommand):
+    help = "Run pending, stalled (and optionally failed) deletion jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--retry-failed", action="store_true")
+
+    def handle(self, *args, **options):
+        if options["retry_failed"]:
+            DeletionJob.objects.filter(status=DeletionJob.Status.FAILED).update(
+                status=DeletionJob.Status.PENDING, error=""
+            )
+        ids = list(resumable_jobs().values_list("pk", flat=True))
+        for job_id in ids:
+            run_job(job_id)
+        done = DeletionJob.objects.filter(
+            pk__in=ids, status=DeletionJob.Status.DONE
+        ).count()
+        self.stdout.write(
+            self.style.SUCCESS(f"Processed {len(ids)} deletion jobs ({done} done).")
+        )
@@ -39,3 +39,67 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     def __str__(self) -> str:
         return f"{self.email} ({self.role})"
+
+    def hide_for_deletion(self) -> None:
+        """
+        Soft-delete step of `accounts.deletion.schedule_deletion`: lock the
+        account out (JWT auth rejects inactive users) and hide its listings
+        at once; rows are removed later in batches.
+        """
+        from internships.models import Internship
+
+        User.objects.filter(pk=self.pk).update(is_active=False)
+        self.is_active = False
+        Internship.hide_for_deletion_many(
+            Internship.objects.filter(employer__user=self)
+        )
+
+
+class DeletionJob(models.Model):
+    """
+    Progress of one background cascade delete (see accounts/deletion.py).
+
+    Deliberately has no foreign key to the object being deleted – or to
+    the user who asked – so the job row outlives both.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    target = models.CharField(
+        max_length=100
+    )  # model label, e.g. "internships.Internship"
+    object_id = models.BigIntegerField()
+    requested_by_id = models.BigIntegerField(null=True, blank=True)
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    current_step = models.CharField(max_length=200, blank=True)
+    deleted = models.JSONField(default=dict, blank=True)  # model label -> rows
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)  # heartbeat while running
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("-created_at",)
+        constraints = [
+            # At most one live job per object
+            models.UniqueConstraint(
+                fields=["target", "object_id"],
+                condition=models.Q(status__in=["pending", "running"]),
+                name="deletionjob_live_unique",
+            ),
+        ]
+        indexes = [
+            # process_deletion_jobs: unfinished / stalled jobs
+            models.Index(
+                fields=["status", "updated_at"], name="deletionjob_status_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"Delete {self.target}#{self.object_id} ({self.status})"
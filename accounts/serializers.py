@@ -4,6 +4,8 @@ from rest_framework import serializers
 from rest_framework.validators import UniqueValidator
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
+from .models import DeletionJob
+
 User = get_user_model()
 
 
@@ -54,3 +56,23 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         token = super().get_token(user)
         token["role"] = user.role
         return token
+
+
+class DeletionJobSerializer(serializers.ModelSerializer):
+    """Progress of a background delete (accounts/deletion.py)."""
+
+    class Meta:
+        model = DeletionJob
+        fields = (
+            "id",
+            "target",
+            "object_id",
+            "status",
+            "current_step",
+            "deleted",
+            "error",
+            "created_at",
+            "updated_at",
+            "finished_at",
+        )
+        read_only_fields = fields
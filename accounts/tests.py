@@ -1 +1,90 @@
-# Create your tests here.
+import io
+from unittest import mock
+
+from django.core.management import call_command
+
+from accounts import deletion
+from accounts.deletion import run_job, schedule_deletion
+from accounts.models import DeletionJob, User
+from internships.applications import apply
+from internships.models import Application, Internship
+from internships.tests.utils import (
+    APITestCase,
+    make_employer,
+    make_internship,
+    make_user,
+)
+
+
+def _run_now(fn, *args):
+    return fn(*args)
+
+
+@mock.patch("backend.background.run_in_background", _run_now)
+class DeletionJobTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.employer = make_employer()
+        self.listing = make_internship(self.employer)
+        for i in range(3):
+            apply(self.listing.pk, make_user(f"i{i}@example.com").pk)
+
+    def test_delete_endpoint_hides_now_and_removes_in_batches(self):
+        self.client.force_authenticate(self.employer.user)
+        url = f"/api/internships/{self.listing.pk}/"
+        with mock.patch.object(deletion, "BATCH_SIZE", 2):
+            with self.captureOnCommitCallbacks() as callbacks:
+                response = self.client.delete(url)
+            self.assertEqual(response.status_code, 202)
+            # Hidden before the background job has run
+            self.assertEqual(self.client.get(url).status_code, 404)
+            self.assertFalse(Internship.objects.filter(pk=self.listing.pk).exists())
+            self.assertTrue(
+                Internship._base_manager.filter(pk=self.listing.pk).exists()
+            )
+            for callback in callbacks:
+                callback()
+
+        self.assertFalse(Internship._base_manager.filter(pk=self.listing.pk).exists())
+        self.assertFalse(Application.objects.exists())
+        job = self.client.get(f"/api/deletion-jobs/{response.data['id']}/").data
+        self.assertEqual(job["status"], "done")
+        self.assertEqual(job["deleted"]["internships.Application"], 3)
+
+    def test_user_deletion_deactivates_and_cascades(self):
+        user = self.employer.user
+        with self.captureOnCommitCallbacks(execute=True):
+            job = schedule_deletion(user)
+        job.refresh_from_db()
+        self.assertEqual(job.status, DeletionJob.Status.DONE)
+        self.assertFalse(User.objects.filter(pk=user.pk).exists())
+        self.assertFalse(Internship._base_manager.exists())
+
+    def test_scheduling_twice_reuses_the_job(self):
+        first = schedule_deletion(self.listing)
+        self.assertEqual(schedule_deletion(self.listing).pk, first.pk)
+
+    def test_failed_job_is_retried_by_the_sweeper(self):
+        job = schedule_deletion(self.listing)
+        with mock.patch.object(
+            deletion, "_delete_batches", side_effect=RuntimeError("boom")
+        ), self.assertLogs("accounts.deletion", "ERROR"):
+            run_job(job.pk)
+        job.refresh_from_db()
+        self.assertEqual(job.status, DeletionJob.Status.FAILED)
+        self.assertIn("boom", job.error)
+
+        call_command("process_deletion_jobs", stdout=io.StringIO())
+        job.refresh_from_db()
+        self.assertEqual(job.status, DeletionJob.Status.FAILED)  # not retried
+        call_command("process_deletion_jobs", "--retry-failed", stdout=io.StringIO())
+        job.refresh_from_db()
+        self.assertEqual(job.status, DeletionJob.Status.DONE)
+        self.assertFalse(Internship._base_manager.filter(pk=self.listing.pk).exists())
+
+    def test_progress_is_private_to_the_requester(self):
+        job = schedule_deletion(self.listing, requested_by=self.employer.user)
+        self.client.force_authenticate(make_user("other@example.com"))
+        self.assertEqual(
+            self.client.get(f"/api/deletion-jobs/{job.pk}/").status_code, 404
+        )
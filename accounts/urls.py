@@ -1,6 +1,6 @@
 from django.urls import path
 
-from .views import LoginView, RefreshView, RegisterView
+from .views import DeletionJobDetail, LoginView, RefreshView, RegisterView
 
 app_name = "accounts"
 
@@ -14,4 +14,11 @@ urlpatterns = [
     # refresh
     path("auth/refresh/", RefreshView.as_view(), name="token_refresh"),
     path("auth/refresh", RefreshView.as_view()),
+    # background delete progress
+    path(
+        "deletion-jobs/<int:pk>/",
+        DeletionJobDetail.as_view(),
+        name="deletion-job-detail",
+    ),
+    path("deletion-jobs/<int:pk>", DeletionJobDetail.as_view()),
 ]
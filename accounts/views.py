@@ -1,7 +1,12 @@
 from rest_framework import generics, permissions
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
-from .serializers import CustomTokenObtainPairSerializer, RegisterSerializer
+from .models import DeletionJob
+from .serializers import (
+    CustomTokenObtainPairSerializer,
+    DeletionJobSerializer,
+    RegisterSerializer,
+)
 
 
 class RegisterView(generics.CreateAPIView):
@@ -27,3 +32,18 @@ class LoginView(TokenObtainPairView):
 
 class RefreshView(TokenRefreshView):
     permission_classes = [permissions.AllowAny]
+
+
+class DeletionJobDetail(generics.RetrieveAPIView):
+    """
+    GET /api/deletion-jobs/<id>/   -> progress of a delete you requested
+                                      (staff: any job)
+    """
+
+    serializer_class = DeletionJobSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        if self.request.user.is_staff:
+            return DeletionJob.objects.all()
+        return DeletionJob.objects.filter(requested_by_id=self.request.user.pk)
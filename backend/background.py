@@ -0,0 +1,66 @@
+# backend/background.py
+"""
+Fire-and-forget background work for request handlers.
+
+• `run_after_commit(fn, *args)` – queue ``fn(*args)`` on a small in-process
+  thread pool once the current transaction commits (immediately when there
+  is none), so the task never sees uncommitted – or rolled-back – rows.
+• `debounce(key, delay, fn, *args)` – trailing-edge debounce: run ``fn``
+  ``delay`` seconds after the *last* call for ``key``. The winning call is
+  tracked in the shared cache, so bursts are coalesced across processes.
+• Tasks must be idempotent and take ids, not model instances: they can run
+  late, run twice, or be lost on a worker restart. Anything that must
+  eventually happen also needs a management command that re-does it.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from django.core.cache import cache
+from django.db import close_old_connections, transaction
+
+log = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="background")
+
+
+def _run(fn: Callable[..., Any], *args: Any) -> Any:
+    try:
+        return fn(*args)
+    except Exception:  # noqa: BLE001 – nobody is waiting on the result
+        log.exception("Background task %s failed", getattr(fn, "__name__", fn))
+    finally:
+        # Pool threads get their own DB connection; don't leak it.
+        close_old_connections()
+
+
+def run_in_background(fn: Callable[..., Any], *args: Any) -> Future:
+    return _executor.submit(_run, fn, *args)
+
+
+def run_after_commit(fn: Callable[..., Any], *args: Any, using=None) -> None:
+    transaction.on_commit(lambda: run_in_background(fn, *args), using=using)
+
+
+def debounce(key: str, delay: float, fn: Callable[..., Any], *args: Any) -> None:
+    token = uuid.uuid4().hex
+    cache_key = f"debounce:{key}"
+
+    def fire():
+        # Only the most recent caller for this key still holds the token.
+        if cache.get(cache_key) == token:
+            cache.delete(cache_key)
+            run_in_background(fn, *args)
+
+    def arm():
+        cache.set(cache_key, token, delay * 10)
+        timer = threading.Timer(delay, fire)
+        timer.daemon = True
+        timer.start()
+
+    transaction.on_commit(arm)
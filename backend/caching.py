@@ -0,0 +1,184 @@
+# backend/caching.py
+"""
+Versioned, stampede-safe response cache for read-heavy DRF views.
+
+• Invalidation – every cached entry embeds the current *version* of the
+  namespaces it depends on ("internships", "employers", "skills", …).
+  Model signals call `bump_version(ns)`, which makes all old keys
+  unreachable at once; they simply age out of Redis. Nothing is deleted by
+  pattern.
+• Stampede protection – `get_or_compute`:
+    – hard miss: single flight. One caller takes a short lock and rebuilds;
+      the others poll briefly for its result instead of hitting the DB.
+    – soft expiry: probabilistic early recompute ("XFetch"). As an entry
+      nears its TTL, one caller refreshes it ahead of time while everyone
+      else keeps getting the cached value.
+
+Usage:
+
+    class SkillListView(CachedResponseMixin, generics.ListAPIView):
+        cache_namespaces = ("skills",)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import random
+import time
+from typing import Any, Callable, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+VERSION_KEY = "cache-version:{}"
+LOCK_TIMEOUT = 10  # seconds a rebuild may hold the single-flight lock
+WAIT_TIMEOUT = 2.0  # seconds a loser waits for the winner's result
+WAIT_INTERVAL = 0.05
+XFETCH_BETA = 1.0  # >1 refreshes earlier, <1 later
+
+
+# ───────────────────────── namespace versions ─────────────────────────
+def _initial_version() -> int:
+    # Time-based seed: if a version key is ever evicted, the new value can't
+    # collide with one that older cache entries were written under.
+    return int(time.time() * 1000)
+
+
+def get_versions(namespaces: Iterable[str]) -> str:
+    """Return a compact "v1.v2…" token for ``namespaces`` (one cache round trip)."""
+    keys = [VERSION_KEY.format(ns) for ns in namespaces]
+    found = cache.get_many(keys)
+    versions = []
+    for key in keys:
+        if key not in found:
+            cache.add(key, _initial_version(), None)
+            found[key] = cache.get(key)
+        versions.append(str(found[key]))
+    return ".".join(versions)
+
+
+def bump_version(*namespaces: str) -> None:
+    """Invalidate every cached entry that depends on any of ``namespaces``."""
+    for ns in namespaces:
+        key = VERSION_KEY.format(ns)
+        try:
+            cache.incr(key)
+        except ValueError:  # never set (or evicted)
+            cache.add(key, _initial_version(), None)
+
+
+# ───────────────────────── stampede-safe fetch ─────────────────────────
+def _store(key: str, compute: Callable[[], Any], timeout: int) -> Any:
+    started = time.monotonic()
+    value = compute()
+    cost = time.monotonic() - started
+    cache.set(key, (value, cost, time.time() + timeout), timeout)
+    return value
+
+
+def get_or_compute(key: str, compute: Callable[[], Any], timeout: int) -> Any:
+    """
+    Return the cached value for ``key`` or build it with ``compute()``.
+
+    Entries are stored as (value, compute_seconds, expires_at) so the XFetch
+    rule can refresh expensive entries proportionally earlier.
+    """
+    lock_key = f"{key}:lock"
+    entry = cache.get(key)
+    if entry is not None:
+        value, cost, expires_at = entry
+        early = cost * XFETCH_BETA * -math.log(1.0 - random.random())
+        if time.time() + early < expires_at:
+            return value
+        if not cache.add(lock_key, 1, LOCK_TIMEOUT):
+            return value  # someone is already refreshing; serve current copy
+        try:
+            return _store(key, compute, timeout)
+        finally:
+            cache.delete(lock_key)
+
+    if cache.add(lock_key, 1, LOCK_TIMEOUT):
+        try:
+            return _store(key, compute, timeout)
+        finally:
+            cache.delete(lock_key)
+
+    # Another worker is rebuilding this key – wait for its result.
+    deadline = time.monotonic() + WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(WAIT_INTERVAL)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry[0]
+    return compute()  # winner is stuck or died; don't wait any longer
+
+
+# ───────────────────────── DRF view mixin ─────────────────────────
+class CachedResponseMixin:
+    """
+    Cache successful GET responses of a generic view.
+
+    Attributes:
+      cache_namespaces – namespaces whose version is part of the key
+      cache_timeout    – seconds (defaults to settings.API_CACHE_TIMEOUT)
+      cache_per_user   – include the user id in the key (for /me endpoints)
+    """
+
+    cache_namespaces: tuple[str, ...] = ()
+    cache_timeout: int | None = None
+    cache_per_user = False
+
+    def cache_varies_on_user(self, request) -> bool:
+        return self.cache_per_user
+
+    def get_cache_key(self, request) -> str:
+        params = sorted(request.query_params.lists())
+        user = request.user.pk if self.cache_varies_on_user(request) else None
+        # With ConditionalGetMixin, the ETag this body will be sent with: data
+        # the namespaces don't version (counters, applications) still moves it,
+        # so a new ETag never goes out on a body cached under the old one.
+        etag = getattr(self, "validator_etag", None)
+        # Host is part of the key: paginated bodies embed absolute links.
+        raw = (
+            f"{request.get_host()}{request.path}|{params}|{user}"
+            f"|{request.accepted_renderer.format}|{etag}"
+        )
+        digest = hashlib.sha1(raw.encode()).hexdigest()
+        versions = get_versions(self.cache_namespaces)
+        return f"api:{type(self).__name__}:{versions}:{digest}"
+
+    def get(self, request, *args, **kwargs):
+        if not self.cache_namespaces:
+            return super().get(request, *args, **kwargs)
+
+        computed = []
+
+        def compute():
+            response = super(CachedResponseMixin, self).get(request, *args, **kwargs)
+            computed.append(response)
+            if response.status_code != 200:
+                raise _Uncacheable(response)
+            return response.data
+
+        timeout = self.cache_timeout or settings.API_CACHE_TIMEOUT
+        try:
+            data = get_or_compute(self.get_cache_key(request), compute, timeout)
+        except _Uncacheable as exc:
+            return exc.response
+        if computed:
+            response = computed[0]
+            response["X-Cache"] = "MISS"
+            return response
+        response = Response(data)
+        response["X-Cache"] = "HIT"
+        return response
+
+
+class _Uncacheable(Exception):
+    """Raised inside compute() so non-200 responses are never stored."""
+
+    def __init__(self, response):
+        super().__init__(response.status_code)
+        self.response = response
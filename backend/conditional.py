@@ -0,0 +1,94 @@
+# backend/conditional.py
+"""
+Conditional GET (ETag / Last-Modified) for DRF views.
+
+A view mixes in `ConditionalGetMixin` and implements `get_validator()`,
+which returns the *inputs* of the validator – e.g. (max updated_at, row
+count) for a list – from one cheap query. When the client's
+If-None-Match / If-Modified-Since still matches, the view answers
+`304 Not Modified` without loading rows or running serializers.
+
+The ETag also covers the host, path, query string, renderer and (optionally)
+the user, so two different responses can never share a tag.
+
+Combined with `CachedResponseMixin` (listed after this mixin), the ETag is
+part of the response-cache key as well, so a cached body is only ever sent
+with the ETag it was built under.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date
+
+Validator = Tuple[Sequence[Any], Optional[datetime]]
+
+
+class ConditionalGetMixin:
+    """
+    Attributes:
+      conditional_per_user – the representation depends on request.user
+    """
+
+    conditional_per_user = False
+
+    def get_validator(self, request) -> Optional[Validator]:
+        """Return (etag_parts, last_modified) or None to skip validation."""
+        return None
+
+    def _etag(self, request, parts: Sequence[Any]) -> str:
+        user = request.user.pk if self.conditional_per_user else None
+        raw = repr(
+            (
+                request.get_host(),
+                request.path,
+                sorted(request.query_params.lists()),
+                request.accepted_renderer.format,
+                user,
+                [p.isoformat() if hasattr(p, "isoformat") else p for p in parts],
+            )
+        )
+        # Weak: equal data, but the bytes depend on the renderer settings.
+        return f'W/"{hashlib.sha1(raw.encode()).hexdigest()}"'
+
+    def _finalize_headers(self, response, etag: str, last_modified) -> None:
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        # Let browsers keep the body but revalidate on every poll.
+        patch_cache_control(response, no_cache=True)
+        if self.conditional_per_user:
+            patch_cache_control(response, private=True)
+            patch_vary_headers(response, ["Authorization"])
+
+    def get(self, request, *args, **kwargs):
+        validator = self.get_validator(request)
+        if validator is None:
+            return super().get(request, *args, **kwargs)
+
+        parts, modified = validator
+        etag = self._etag(request, parts)
+        self.validator_etag = etag  # read by CachedResponseMixin.get_cache_key
+        last_modified = int(modified.timestamp()) if modified else None
+
+        # 304 for a matching If-None-Match / If-Modified-Since (412 for a
+        # failed If-Match); None means "render normally".
+        conditional = get_conditional_response(
+            request._request, etag=etag, last_modified=last_modified
+        )
+        if conditional is not None:
+            self._finalize_headers(conditional, etag, last_modified)
+            return conditional
+
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == 200:
+            self._finalize_headers(response, etag, last_modified)
+        return response
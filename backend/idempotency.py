@@ -0,0 +1,108 @@
+# backend/idempotency.py
+"""
+`Idempotency-Key` support for unsafe DRF endpoints.
+
+A client that may retry (double-click, flaky network, deadline-day
+timeouts) sends a unique ``Idempotency-Key`` header. The first response for
+that (user, key) is stored in the cache for IDEMPOTENCY_TTL seconds; a retry
+gets the stored response back – marked ``Idempotent-Replayed: true`` –
+instead of running the handler again.
+
+• Same key, different endpoint / body  -> 422
+• Same key while the first request is still running -> 409
+• 5xx responses are not stored, so a retry after a crash really retries.
+
+Usage:
+
+    class ApplyView(IdempotentMixin, generics.GenericAPIView):
+        def post(self, request, pk): ...
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+IDEMPOTENCY_TTL = 60 * 60  # seconds
+LOCK_TIMEOUT = 30
+MAX_KEY_LENGTH = 255
+
+
+def _fingerprint(request) -> str:
+    body = json.dumps(request.data, sort_keys=True, default=str)
+    return hashlib.sha256(f"{request.path}|{body}".encode()).hexdigest()
+
+
+class _Replay(Exception):
+    def __init__(self, response):
+        super().__init__(response.status_code)
+        self.response = response
+
+
+class IdempotentMixin:
+    idempotent_methods = ("POST",)
+
+    def _idempotency_key(self, request):
+        key = request.headers.get(IDEMPOTENCY_HEADER, "").strip()
+        if not key or request.method not in self.idempotent_methods:
+            return None
+        digest = hashlib.sha256(key[:MAX_KEY_LENGTH].encode()).hexdigest()
+        return f"idempotency:{request.user.pk}:{digest}"
+
+    def initial(self, request, *args, **kwargs):
+        self._idempotency_cache_key = None
+        super().initial(request, *args, **kwargs)  # auth, permissions, throttles
+        key = self._idempotency_key(request)
+        if key is None:
+            return
+        stored = cache.get(key)
+        if stored is not None:
+            raise _Replay(self._replayed(request, stored))
+        if not cache.add(f"{key}:lock", 1, LOCK_TIMEOUT):
+            raise _Replay(
+                Response(
+                    {"detail": "A request with this Idempotency-Key is in progress."},
+                    status=status.HTTP_409_CONFLICT,
+                )
+            )
+        self._idempotency_cache_key = key
+
+    def _replayed(self, request, stored) -> Response:
+        if stored["fingerprint"] != _fingerprint(request):
+            return Response(
+                {"detail": "Idempotency-Key was already used for another request."},
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+        response = Response(stored["data"], status=stored["status"])
+        response["Idempotent-Replayed"] = "true"
+        return response
+
+    def handle_exception(self, exc):
+        if isinstance(exc, _Replay):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        # Runs for every outcome – including exceptions already turned into
+        # responses – so it's the one place to store the result.
+        response = super().finalize_response(request, response, *args, **kwargs)
+        key = getattr(self, "_idempotency_cache_key", None)
+        if key is not None:
+            if response.status_code < 500:
+                cache.set(
+                    key,
+                    {
+                        "fingerprint": _fingerprint(request),
+                        "status": response.status_code,
+                        "data": response.data,
+                    },
+                    IDEMPOTENCY_TTL,
+                )
+            cache.delete(f"{key}:lock")
+            self._idempotency_cache_key = None
+        return response
@@ -0,0 +1,84 @@
+# backend/metrics.py
+"""
+Tiny shared counters for operational metrics.
+
+• Counters live in the default cache (Redis in prod), so every worker
+  process adds to the same totals; `incr()` is one INCRBY.
+• Modules register the counters / hit ratios they report at import time;
+  `GET /api/metrics/` (staff only) returns a snapshot of all of them.
+• Gauges (current values such as a queue depth) are registered as a
+  function that reads the value when the snapshot is taken.
+
+    metrics.register_ratio("internship_fragments")   # …hit / …miss
+    metrics.incr("internship_fragments.hit", 18)
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, List
+
+from django.core.cache import cache
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+KEY = "metrics:{}"
+
+_counters: List[str] = []
+_ratios: List[str] = []
+_gauges: Dict[str, Callable[[], object]] = {}
+
+
+def register_counter(name: str) -> None:
+    if name not in _counters:
+        _counters.append(name)
+
+
+def register_ratio(prefix: str) -> None:
+    """Report ``<prefix>.hit``, ``<prefix>.miss`` and their hit ratio."""
+    if prefix not in _ratios:
+        _ratios.append(prefix)
+        register_counter(f"{prefix}.hit")
+        register_counter(f"{prefix}.miss")
+
+
+def register_gauge(name: str, read: Callable[[], object]) -> None:
+    _gauges[name] = read
+
+
+def incr(name: str, amount: int = 1) -> None:
+    if amount <= 0:
+        return
+    key = KEY.format(name)
+    try:
+        cache.incr(key, amount)
+    except ValueError:  # first hit since the counter was created / evicted
+        if not cache.add(key, amount, None):
+            cache.incr(key, amount)
+
+
+def snapshot() -> Dict[str, object]:
+    found = cache.get_many([KEY.format(name) for name in _counters])
+    counters = {name: found.get(KEY.format(name), 0) for name in _counters}
+    ratios = {}
+    for prefix in _ratios:
+        hits, misses = counters[f"{prefix}.hit"], counters[f"{prefix}.miss"]
+        total = hits + misses
+        ratios[f"{prefix}.hit_ratio"] = round(hits / total, 4) if total else None
+    gauges = {name: read() for name, read in _gauges.items()}
+    return {"counters": counters, "ratios": ratios, "gauges": gauges}
+
+
+def reset() -> None:
+    cache.delete_many([KEY.format(name) for name in _counters])
+
+
+class MetricsView(APIView):
+    """
+    GET /api/metrics/   -> current counters, hit ratios and gauges (staff only)
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response(snapshot())
@@ -0,0 +1,189 @@
+# backend/pagination.py
+"""
+Shared DRF pagination classes.
+
+• KeysetPagination – opaque-cursor pagination over a unique, composite
+  ordering such as ("-posted_at", "-id"). Every page is a single indexed
+  range scan (`WHERE posted_at <= x AND (posted_at < x OR (posted_at = x
+  AND id < y))  LIMIT n` – the range starts at the cursor), so page 500
+  costs the same as page 1, and rows inserted while a client is paging
+  never shift later pages (no duplicates, no skips).
+• OffsetPagination – classic ?page=N&page_size=M for admin-style tables that
+  need random access and a total count.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from typing import Any, List, Optional, Sequence
+
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def _encode_value(value: Any) -> Any:
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination keyed on *all* columns of ``ordering``.
+
+    Subclasses set ``ordering`` to a tuple whose last element is unique (the
+    primary key), and back it with a matching composite index.
+    """
+
+    ordering: Sequence[str] = ("-id",)
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    # ---------------------------------------------------------------- cursor
+    def encode_cursor(self, obj, reverse: bool) -> str:
+        values = [
+            _encode_value(getattr(obj, field.lstrip("-"))) for field in self.ordering
+        ]
+        raw = json.dumps({"v": values, "r": reverse}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, request) -> Optional[dict]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            cursor = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            if len(cursor["v"]) != len(self.ordering):
+                raise ValueError
+            return {"values": cursor["v"], "reverse": bool(cursor.get("r"))}
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+    # ---------------------------------------------------------------- query
+    def get_page_size(self, request) -> int:
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def _keyset_filter(self, values: List[Any], reverse: bool) -> Q:
+        """
+        Expand the row comparison `(a, b, c) > (x, y, z)` into
+        `a >= x AND (a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z))`,
+        honouring each column's direction.
+
+        The OR alone is not an index range, so the planner would filter it row
+        by row; the redundant leading `a >= x` is what it seeks the index to.
+        """
+        condition = Q()
+        equal_prefix = Q()
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip("-")
+            descending = field.startswith("-") != reverse
+            lookup = f"{name}__lt" if descending else f"{name}__gt"
+            condition |= equal_prefix & Q(**{lookup: value})
+            equal_prefix &= Q(**{name: value})
+
+        leading = self.ordering[0]
+        descending = leading.startswith("-") != reverse
+        lookup = f"{leading.lstrip('-')}__{'lte' if descending else 'gte'}"
+        return Q(**{lookup: values[0]}) & condition
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None):
+        self.request = request
+        self.page_size_value = self.get_page_size(request)
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor["reverse"])
+
+        ordering = self.ordering
+        if reverse:
+            ordering = [f[1:] if f.startswith("-") else f"-{f}" for f in self.ordering]
+        queryset = queryset.order_by(*ordering)
+        if cursor:
+            queryset = queryset.filter(self._keyset_filter(cursor["values"], reverse))
+
+        rows = list(queryset[: self.page_size_value + 1])
+        has_more = len(rows) > self.page_size_value
+        rows = rows[: self.page_size_value]
+        if reverse:
+            rows.reverse()
+
+        self.page = rows
+        self.has_next = has_more if not reverse else True
+        self.has_previous = has_more if reverse else cursor is not None
+        return rows
+
+    # ---------------------------------------------------------------- links
+    def _link(self, obj, reverse: bool) -> str:
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url, self.cursor_query_param, self.encode_cursor(obj, reverse)
+        )
+
+    def get_next_link(self) -> Optional[str]:
+        if not (self.has_next and self.page):
+            return None
+        return self._link(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous:
+            return None
+        if not self.page:
+            url = self.request.build_absolute_uri()
+            return remove_query_param(url, self.cursor_query_param)
+        return self._link(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Opaque cursor from a previous `next` / `previous` link.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"Results per page (max {self.max_page_size}).",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+
+class OffsetPagination(PageNumberPagination):
+    """Opt-in ?page=N pagination (returns `count`; deep pages get slower)."""
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
@@ -66,10 +66,13 @@ MIDDLEWARE = [
 ]
 
 # ───────────────────────────────────────────────────────────────
-# URLs / WSGI
+# URLs / WSGI / ASGI
 # ───────────────────────────────────────────────────────────────
 ROOT_URLCONF = "backend.urls"
 WSGI_APPLICATION = "backend.wsgi.application"
+# Served by uvicorn (backend/asgi.py) so the agent chat endpoints stream
+# from one event loop per worker; WSGI still works but buffers those streams.
+ASGI_APPLICATION = "backend.asgi.application"
 
 # ───────────────────────────────────────────────────────────────
 # Templates
@@ -121,6 +124,49 @@ else:
         }
     }
 
+# Seconds a cached API read (backend/caching.py) may be served; entries are
+# also invalidated early by model signals bumping their namespace version.
+API_CACHE_TIMEOUT = config("API_CACHE_TIMEOUT", default=60, cast=int)
+
+# ───────────────────────────────────────────────────────────────
+# Internships
+#   • INTERNSHIPS_DENORMALIZED_COUNTS – read `Internship.applications_count`
+#     (kept up to date by signals) instead of a COUNT(...) annotation
+#   • INTERNSHIP_COUNTERS_FLUSH_INTERVAL – seconds between writes of the
+#     buffered view / impression counters (internships/counters.py)
+# ───────────────────────────────────────────────────────────────
+INTERNSHIPS_DENORMALIZED_COUNTS = config(
+    "INTERNSHIPS_DENORMALIZED_COUNTS", default=False, cast=bool
+)
+INTERNSHIP_COUNTERS_FLUSH_INTERVAL = config(
+    "INTERNSHIP_COUNTERS_FLUSH_INTERVAL", default=30, cast=int
+)
+
+# ───────────────────────────────────────────────────────────────
+# OpenAI concurrency governor (pipeline_agents/governor.py)
+#   • LLM_MAX_CONCURRENCY – simultaneous upstream calls, all workers together
+#   • LLM_CLASS_CONCURRENCY – per-class budgets within that total
+#   • LLM_QUEUE_TIMEOUT – seconds a call may wait for a slot before failing
+# ───────────────────────────────────────────────────────────────
+LLM_MAX_CONCURRENCY = config("LLM_MAX_CONCURRENCY", default=16, cast=int)
+LLM_CLASS_CONCURRENCY = {
+    "interactive": config("LLM_INTERACTIVE_CONCURRENCY", default=16, cast=int),
+    "tts": config("LLM_TTS_CONCURRENCY", default=6, cast=int),
+    "batch": config("LLM_BATCH_CONCURRENCY", default=2, cast=int),
+}
+LLM_QUEUE_TIMEOUT = {"interactive": 20, "tts": 10, "batch": 300}
+
+# ───────────────────────────────────────────────────────────────
+# Agent chat memory (pipeline_agents/memory.py)
+#   • AGENT_HISTORY_TOKEN_BUDGET – (estimated) tokens of recent messages sent
+#     verbatim each turn; older ones are folded into a stored summary
+#   • AGENT_HISTORY_MAX_MESSAGES – most rows read per turn
+# ───────────────────────────────────────────────────────────────
+AGENT_HISTORY_TOKEN_BUDGET = config(
+    "AGENT_HISTORY_TOKEN_BUDGET", default=2000, cast=int
+)
+AGENT_HISTORY_MAX_MESSAGES = config("AGENT_HISTORY_MAX_MESSAGES", default=40, cast=int)
+
 # ───────────────────────────────────────────────────────────────
 # Password validation
 # ───────────────────────────────────────────────────────────────
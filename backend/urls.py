@@ -6,6 +6,7 @@ Routes exposed:
 • /                   – simple “health-check” landing
 • /admin/             – Django admin
 • /api/…              – accounts, profiles, employers, internships, voice
+• /api/metrics/       – operational counters (staff only)
 • /api/schema/        – OpenAPI JSON
 • /api/docs/          – Swagger UI
 """
@@ -17,6 +18,8 @@ from django.http import HttpResponse
 from django.urls import include, path
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from backend.metrics import MetricsView
+
 
 # ───────────────────────────────────────────────────────────────
 # Landing page so “/” doesn’t 404 in dev / tunnels
@@ -39,6 +42,8 @@ urlpatterns = [
     path("api/", include("employers.urls")),
     path("api/", include("internships.urls")),
     path("api/", include("voice.urls")),
+    # ---------- Ops ----------
+    path("api/metrics/", MetricsView.as_view(), name="metrics"),
     # ---------- API schema & docs ----------
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
     path(
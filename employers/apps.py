@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class EmployersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "employers"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,31 @@
+"""
+Generate logo thumbnails synchronously (backfill / repair).
+
+    python manage.py generate_logo_thumbnails          # employers missing them
+    python manage.py generate_logo_thumbnails --all    # every employer with a logo
+"""
+
+from django.core.management.base import BaseCommand
+
+from employers.models import Employer
+from employers.thumbnails import generate_logo_thumbnails
+
+
+class Command(BaseCommand):
+    help = "Render content-hashed logo thumbnails for employers."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Regenerate even where thumbnails already exist.",
+        )
+
+    def handle(self, *args, **options):
+        qs = Employer.objects.exclude(logo="")
+        if not options["all"]:
+            qs = qs.filter(logo_thumbnails={})
+        ids = list(qs.values_list("pk", flat=True))
+        for pk in ids:
+            generate_logo_thumbnails(pk)
+        self.stdout.write(self.style.SUCCESS(f"Thumbnails for {len(ids)} employers."))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-17 00:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employers", "0002_employer_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="employer",
+            name="logo_thumbnails",
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
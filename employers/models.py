@@ -10,10 +10,14 @@ class Employer(models.Model):
     )
     company_name = models.CharField(max_length=150, blank=True)
     logo = models.ImageField(upload_to="logos/", blank=True)
+    # size (px, as str) -> storage name; filled in by employers.thumbnails
+    logo_thumbnails = models.JSONField(default=dict, blank=True, editable=False)
     mission = models.TextField(blank=True)
     location = models.CharField(max_length=100, blank=True)
     website = models.URLField(blank=True)
 
+    updated_at = models.DateTimeField(auto_now=True)
+
     def __str__(self) -> str:
         # Show company name if set, otherwise use user email as identifier
         if self.company_name:
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from internships.models import Application
+from profiles.serializers import ApplicantProfileSerializer
 
 from .models import Employer
 
@@ -14,8 +15,10 @@ class EmployerSerializer(serializers.ModelSerializer):
 
 class ApplicationSerializer(serializers.ModelSerializer):
     intern_email = serializers.ReadOnlyField(source="intern.email")
+    # None when the intern hasn't created a profile yet
+    profile = ApplicantProfileSerializer(source="intern.profile", read_only=True)
 
     class Meta:
         model = Application
-        fields = ("id", "intern_email", "status", "created_at")
-        read_only_fields = ("id", "intern_email", "created_at")
+        fields = ("id", "intern_email", "profile", "status", "created_at")
+        read_only_fields = ("id", "intern_email", "profile", "created_at")
@@ -0,0 +1,40 @@
+"""
+Signal handlers for the employers app (connected in EmployersConfig.ready).
+
+• Bumps the "employers" cache namespace (backend/caching.py) so cached
+  /api/employer/me/ reads and internship listings embedding company data
+  are invalidated on any employer change.
+• Queues thumbnail generation (employers.thumbnails) after a new logo is
+  saved.
+"""
+
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from backend.background import run_after_commit
+from backend.caching import bump_version
+
+from .models import Employer
+from .thumbnails import generate_logo_thumbnails
+
+
+@receiver(post_save, sender=Employer)
+@receiver(post_delete, sender=Employer)
+def _invalidate_cache(sender, **kwargs):
+    bump_version("employers")
+
+
+# ───────────────────────── logo thumbnails ─────────────────────────
+@receiver(post_init, sender=Employer)
+def _remember_logo(sender, instance: Employer, **kwargs):
+    logo = instance.__dict__.get("logo")
+    instance._loaded_logo = getattr(logo, "name", logo) or ""
+
+
+@receiver(post_save, sender=Employer)
+def _thumbnail_on_save(sender, instance: Employer, raw: bool, using, **kwargs):
+    if raw:
+        return
+    if instance.logo.name != instance._loaded_logo:
+        run_after_commit(generate_logo_thumbnails, instance.pk, using=using)
+    instance._loaded_logo = instance.logo.name or ""
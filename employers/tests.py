@@ -0,0 +1,72 @@
+import io
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core.files.base import ContentFile
+from django.test import override_settings
+from PIL import Image
+
+from employers.thumbnails import THUMBNAIL_NAME_RE, THUMBNAIL_SIZES
+from internships.tests.utils import APITestCase, make_employer, make_internship
+
+
+def _png(color="red", size=(300, 200)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def _run_now(fn, *args):
+    return fn(*args)
+
+
+@mock.patch("backend.background.run_in_background", _run_now)
+class LogoThumbnailTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media)
+        settings_override = override_settings(MEDIA_ROOT=self.media)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.employer = make_employer()
+
+    def _upload(self, data: bytes):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.employer.logo.save("logo.png", ContentFile(data))
+        self.employer.refresh_from_db()
+        return self.employer.logo_thumbnails
+
+    def test_upload_renders_content_hashed_thumbnails(self):
+        thumbnails = self._upload(_png())
+        self.assertEqual(sorted(thumbnails, key=int), [str(s) for s in THUMBNAIL_SIZES])
+        for name in thumbnails.values():
+            self.assertRegex(name.rsplit("/", 1)[-1], THUMBNAIL_NAME_RE)
+
+    def test_same_image_reuses_files_and_a_new_one_gets_new_names(self):
+        first = self._upload(_png())
+        self.assertEqual(self._upload(_png()), first)
+        self.assertNotEqual(self._upload(_png("blue")), first)
+
+    def test_listings_expose_absolute_urls_served_immutable(self):
+        self._upload(_png())
+        make_internship(self.employer)
+        logo = self.client.get("/api/internships/").data["results"][0]["employer_logo"]
+        self.assertTrue(logo["64"].startswith("http://testserver/"))
+
+        response = self.client.get(logo["128"])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/webp")
+        self.assertIn("immutable", response["Cache-Control"])
+        self.assertEqual(Image.open(io.BytesIO(b"".join(response))).size, (128, 85))
+
+    def test_unknown_or_malformed_names_are_404(self):
+        for name in ("0123456789abcdef0123-64.webp", "..%2Fsecret.webp"):
+            response = self.client.get(f"/api/logos/thumbs/{name}")
+            self.assertEqual(response.status_code, 404)
+
+    def test_no_logo_means_no_thumbnails(self):
+        make_internship(self.employer)
+        logo = self.client.get("/api/internships/").data["results"][0]["employer_logo"]
+        self.assertIsNone(logo)
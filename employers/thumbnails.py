@@ -0,0 +1,89 @@
+# employers/thumbnails.py
+"""
+Employer logo thumbnails.
+
+• On upload (employers.signals) `generate_logo_thumbnails` runs in the
+  background and renders the logo at THUMBNAIL_SIZES px as WebP.
+• Files are named after a hash of their own bytes –
+  ``logos/thumbs/<sha256[:20]>-<size>.webp`` – so a URL never changes
+  meaning and can be served with a one-year ``immutable`` Cache-Control
+  (see employers.views.LogoThumbnailView). Re-uploading the same image
+  reuses the same files.
+• ``Employer.logo_thumbnails`` maps size → storage name; listings expose it
+  as a srcset-style map of absolute URLs.
+
+Backfill / repair: `python manage.py generate_logo_thumbnails`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import re
+from typing import Dict
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.urls import reverse
+from PIL import Image, ImageOps
+
+log = logging.getLogger(__name__)
+
+THUMBNAIL_SIZES = (64, 128, 256)
+THUMBNAIL_DIR = "logos/thumbs"
+THUMBNAIL_NAME_RE = re.compile(r"^[0-9a-f]{20}-\d+\.webp$")
+
+
+def render_thumbnails(source) -> Dict[str, str]:
+    """Write one WebP per size for the image file ``source``; return the map."""
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)
+        image = image.convert("RGBA")
+        names = {}
+        for size in THUMBNAIL_SIZES:
+            thumb = ImageOps.contain(image, (size, size), Image.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            thumb.save(buffer, "WEBP", quality=85, method=6)
+            data = buffer.getvalue()
+            digest = hashlib.sha256(data).hexdigest()[:20]
+            name = f"{THUMBNAIL_DIR}/{digest}-{size}.webp"
+            if not default_storage.exists(name):
+                default_storage.save(name, ContentFile(data))
+            names[str(size)] = name
+        return names
+
+
+def generate_logo_thumbnails(employer_id: int) -> None:
+    """(Re)build thumbnails for one employer's current logo."""
+    from .models import Employer
+
+    employer = Employer.objects.filter(pk=employer_id).first()
+    if employer is None:
+        return
+    logo_name = employer.logo.name
+    thumbnails = {}
+    if logo_name:
+        try:
+            with employer.logo.open("rb") as source:
+                thumbnails = render_thumbnails(source)
+        except (OSError, ValueError):
+            log.warning("Unreadable logo %r for employer %s", logo_name, employer_id)
+    # Skip if the logo was replaced while we were rendering; the newer
+    # upload has queued its own run.
+    if not Employer.objects.filter(pk=employer_id, logo=logo_name).exists():
+        return
+    employer.logo_thumbnails = thumbnails
+    # save() (not update()) so updated_at moves and the cache signals fire
+    employer.save(update_fields=["logo_thumbnails", "updated_at"])
+
+
+def thumbnail_urls(employer, request=None) -> Dict[str, str] | None:
+    """{"64": url, "128": url, "256": url} or None while none exist."""
+    if not employer.logo_thumbnails:
+        return None
+    urls = {}
+    for size, name in employer.logo_thumbnails.items():
+        url = reverse("employers:logo-thumbnail", args=[name.rsplit("/", 1)[-1]])
+        urls[size] = request.build_absolute_uri(url) if request is not None else url
+    return urls
@@ -9,6 +9,7 @@ from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db import transaction
 from pydantic import BaseModel, ValidationError
 
+from accounts.deletion import schedule_deletion
 from internships.models import Internship  # NEW: import Application model
 
 from .models import Employer
@@ -255,7 +256,8 @@ def delete_internship_v1(*, user_email: str, payload_json: str) -> str:
     except Internship.DoesNotExist:
         raise ValueError(f"No internship found with id {listing_id} for this employer.")
     deleted_info = {"id": listing_id, "title": internship.title}
-    internship.delete()
+    # Hidden now; applications are removed in the background
+    schedule_deletion(internship, requested_by=user)
     deleted_json = json.dumps(deleted_info, default=str)
     print(f"[DELETE TOOL - DELETED] {user_email}: {deleted_json}")
     log.info("✅ Deleted internship listing %s for %s", listing_id, user_email)
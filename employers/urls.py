@@ -2,7 +2,7 @@
 from django.urls import path
 
 from .agent_views import AgentHistoryView, EmployerAgentView
-from .views import EmployerMeView
+from .views import EmployerMeView, EmployerStatsView, logo_thumbnail
 
 app_name = "employers"
 
@@ -10,6 +10,10 @@ urlpatterns = [
     # ── Employer profile endpoints ─────────────────────────────
     path("employer/me/", EmployerMeView.as_view(), name="employer-me"),
     path("employer/me", EmployerMeView.as_view()),  # no-slash variant
+    path("employer/stats/", EmployerStatsView.as_view(), name="employer-stats"),
+    path("employer/stats", EmployerStatsView.as_view()),
+    # ── Logo thumbnails (content-hashed, cached forever) ───────
+    path("logos/thumbs/<str:name>", logo_thumbnail, name="logo-thumbnail"),
     # ── Employer AI assistant endpoints ────────────────────────
     path(
         "agent/employer-assistant/",
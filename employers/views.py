@@ -1,13 +1,28 @@
+from datetime import timedelta
+
+from django.core.files.storage import default_storage
+from django.db.models import Sum
+from django.http import FileResponse, Http404
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import require_safe
 from rest_framework import generics, permissions
 from rest_framework.exceptions import PermissionDenied
+from rest_framework.response import Response
 
 from accounts.models import User
+from backend.caching import CachedResponseMixin
+from backend.conditional import ConditionalGetMixin
+from internships.models import ApplicationDailyStats, ApplicationStats
 
 from .models import Employer
 from .serializers import EmployerSerializer
+from .thumbnails import THUMBNAIL_DIR, THUMBNAIL_NAME_RE
 
 
-class EmployerMeView(generics.RetrieveUpdateAPIView):
+class EmployerMeView(
+    ConditionalGetMixin, CachedResponseMixin, generics.RetrieveUpdateAPIView
+):
     """
     GET    /api/employer/me/   -> retrieve your employer profile
     PUT    /api/employer/me/   -> update/replace employer profile
@@ -16,6 +31,19 @@ class EmployerMeView(generics.RetrieveUpdateAPIView):
 
     serializer_class = EmployerSerializer
     permission_classes = [permissions.IsAuthenticated]
+    cache_namespaces = ("employers",)
+    cache_per_user = True
+    conditional_per_user = True
+
+    def get_validator(self, request):
+        if request.user.role != User.Role.EMPLOYER:
+            return None  # get_object() raises the 403
+        updated_at = (
+            Employer.objects.filter(user=request.user)
+            .values_list("updated_at", flat=True)
+            .first()
+        )
+        return None if updated_at is None else ([updated_at], updated_at)
 
     def get_object(self):
         # Only allow if current user is an employer
@@ -24,3 +52,96 @@ class EmployerMeView(generics.RetrieveUpdateAPIView):
         # Auto-create an empty Employer profile on first access
         employer, _ = Employer.objects.get_or_create(user=self.request.user)
         return employer
+
+
+def _ratio(part: int, whole: int):
+    return round(part / whole, 4) if whole else None
+
+
+class EmployerStatsView(generics.GenericAPIView):
+    """
+    GET /api/employer/stats/   -> dashboard numbers for your listings
+        {"listings": [{"internship", "title", "pending", "accepted",
+                       "rejected", "total", "views", "impressions",
+                       "view_to_apply"}, …],
+         "totals": {same counters},
+         "daily": [{"date", "applications"}, …]}   (last STATS_DAYS days)
+
+    Reads only the rollup tables (internships/rollups.py), never the
+    Application table (views / impressions are the counters flushed onto
+    the listing by internships/counters.py). Listings without applications
+    have no rollup row and are left out.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    STATS_DAYS = 30
+
+    def get(self, request, *args, **kwargs):
+        if request.user.role != User.Role.EMPLOYER:
+            raise PermissionDenied("Only employer accounts have dashboard stats.")
+        statuses = ("pending", "accepted", "rejected")
+
+        listings = []
+        totals = dict.fromkeys(statuses + ("total", "views", "impressions"), 0)
+        rows = (
+            ApplicationStats.objects.filter(
+                internship__employer__user=request.user,
+                internship__deleted_at__isnull=True,
+            )
+            .order_by("-internship__posted_at")
+            .values(
+                "internship_id",
+                "internship__title",
+                "internship__views_count",
+                "internship__impressions_count",
+                *statuses,
+            )
+        )
+        for row in rows:
+            counts = {status: row[status] for status in statuses}
+            counts["total"] = sum(counts.values())
+            counts["views"] = row["internship__views_count"]
+            counts["impressions"] = row["internship__impressions_count"]
+            for key, n in counts.items():
+                totals[key] += n
+            listings.append(
+                {
+                    "internship": row["internship_id"],
+                    "title": row["internship__title"],
+                    **counts,
+                    "view_to_apply": _ratio(counts["total"], counts["views"]),
+                }
+            )
+        totals["view_to_apply"] = _ratio(totals["total"], totals["views"])
+
+        today = timezone.localdate()
+        since = today - timedelta(days=self.STATS_DAYS - 1)
+        per_day = dict(
+            ApplicationDailyStats.objects.filter(
+                internship__employer__user=request.user, day__gte=since
+            )
+            .order_by()
+            .values_list("day")
+            .annotate(n=Sum("applications"))
+        )
+        daily = [
+            {"date": day, "applications": per_day.get(day, 0)}
+            for day in (since + timedelta(days=i) for i in range(self.STATS_DAYS))
+        ]
+        return Response({"listings": listings, "totals": totals, "daily": daily})
+
+
+@require_safe
+def logo_thumbnail(request, name: str):
+    """
+    GET /api/logos/thumbs/<sha>-<size>.webp  -> logo thumbnail (public)
+
+    A plain Django view (no auth / throttling): names are content hashes, so
+    the response is cacheable by browsers and CDNs for a year.
+    """
+    path = f"{THUMBNAIL_DIR}/{name}"
+    if not THUMBNAIL_NAME_RE.match(name) or not default_storage.exists(path):
+        raise Http404("Unknown thumbnail")
+    response = FileResponse(default_storage.open(path, "rb"), content_type="image/webp")
+    patch_cache_control(response, public=True, max_age=31536000, immutable=True)
+    return response
@@ -96,7 +96,10 @@ export default function DashboardPage() {
   const { data: employerProfile } = useEmployerProfile({ enabled: isEmployer });
   const { data: myInternships = [] } = useQuery<InternshipSummary[]>({
     queryKey: ["internships", "mine"],
-    queryFn: () => fetchWithAuth("/api/internships?mine=true").then((r) => r.json()),
+    queryFn: () =>
+      fetchWithAuth("/api/internships?mine=true&page=1&page_size=100")
+        .then((r) => r.json())
+        .then((page) => page.results),
     enabled: !!user && isEmployer,
     staleTime: 60_000,
   });
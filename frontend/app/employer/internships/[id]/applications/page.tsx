@@ -78,7 +78,18 @@ export default function ApplicationsPage() {
               ) : apps && apps.length ? (
                 apps.map((app) => (
                   <tr key={app.id} className="border-b">
-                    <td className="py-2">{app.intern_email}</td>
+                    <td className="py-2">
+                      <div>{app.intern_email}</div>
+                      {app.profile && (
+                        <div className="text-xs text-muted-foreground">
+                          {app.profile.headline} · {app.profile.city}
+                          {app.profile.latest_education &&
+                            ` · ${app.profile.latest_education.institution}`}
+                          {app.profile.skills.length > 0 &&
+                            ` · ${app.profile.skills.map((s) => s.name).join(", ")}`}
+                        </div>
+                      )}
+                    </td>
                     <td className="py-2 capitalize">{app.status}</td>
                     <td className="py-2">
                       {app.status === "pending" ? (
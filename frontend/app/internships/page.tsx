@@ -52,7 +52,7 @@ export default function InternshipsPage() {
                 <p className="mt-1 flex items-center text-sm text-muted-foreground">
                   {it.employer_logo ? (
                     <Image
-                      src={it.employer_logo}
+                      src={it.employer_logo["64"]}
                       alt={it.employer_name ?? "Company logo"}
                       width={24}
                       height={24}
@@ -1,18 +1,18 @@
 // frontend/src/hooks/useAgentChat.ts
 "use client";
 
-import { useEffect, useState } from "react";
+import { useCallback, useEffect, useState } from "react";
 import { useMutation, useQuery, useQueryClient } from "@tanstack/react-query";
 import { fetchWithAuth } from "@/lib/fetchWithAuth";
+import { fetchHistoryPage, type HistoryChunk } from "@/lib/agentHistory";
 
 /* ---------- types ---------- */
 export type Msg = { role: "user" | "assistant"; content: string };
 
 /* ---------- helpers ---------- */
-async function getHistory(): Promise<Msg[]> {
-  const res = await fetchWithAuth("/api/agent/profile-builder/history/");
-  if (!res.ok) throw new Error(await res.text());
-  return res.json();
+/** Newest page of the transcript; older pages via `loadOlder` */
+function getHistory(): Promise<HistoryChunk<Msg>> {
+  return fetchHistoryPage<Msg>("/api/agent/profile-builder/history/");
 }
 
 async function sendMessage(body: {
@@ -40,12 +40,24 @@ export function useAgentChat() {
   });
 
   const [localHistory, setLocal] = useState<Msg[]>([]);
+  const [olderUrl, setOlderUrl] = useState<string | null>(null);
 
   /* when server history loads, sync local state */
   useEffect(() => {
-    if (historyQ.data) setLocal(historyQ.data);
+    if (historyQ.data) {
+      setLocal(historyQ.data.messages);
+      setOlderUrl(historyQ.data.older);
+    }
   }, [historyQ.data]);
 
+  /* lazy-load the page of turns before the oldest one shown */
+  const loadOlder = useCallback(async () => {
+    if (!olderUrl) return;
+    const page = await fetchHistoryPage<Msg>(olderUrl);
+    setLocal((h) => [...page.messages, ...h]);
+    setOlderUrl(page.older);
+  }, [olderUrl]);
+
   /* mutation */
   const chat = useMutation({
     mutationFn: (userMsg: string) =>
@@ -56,11 +68,14 @@ export function useAgentChat() {
         { role: "user", content: userMsg },
         { role: "assistant", content: reply },
       ]);
-      qc.setQueryData(["chat", "profile-builder"], (old: Msg[] = []) => [
-        ...old,
-        { role: "user", content: userMsg },
-        { role: "assistant", content: reply },
-      ]);
+      qc.setQueryData<HistoryChunk<Msg>>(["chat", "profile-builder"], (old) => ({
+        messages: [
+          ...(old?.messages ?? []),
+          { role: "user", content: userMsg },
+          { role: "assistant", content: reply },
+        ],
+        older: old?.older ?? null,
+      }));
       if (profile_updated_at) {
         qc.invalidateQueries({ queryKey: ["profile", "me"] });
       }
@@ -75,6 +90,8 @@ export function useAgentChat() {
 
   return {
     history: localHistory,
+    loadOlder,
+    hasOlder: !!olderUrl,
     send,
     sending: chat.isPending,
     error: historyQ.error || (chat.error as Error | null),
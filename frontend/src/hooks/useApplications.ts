@@ -4,18 +4,56 @@ import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import { fetchWithAuth } from "@/lib/fetchWithAuth";
 
 /* -------------------- Types -------------------- */
+export type ApplicantProfile = {
+  id: number;
+  headline: string;
+  city: string;
+  state: string;
+  country: string;
+  availability: {
+    status: "IMMEDIATELY" | "FROM_DATE" | "UNAVAILABLE";
+    earliest_start: string | null;
+    hours_per_week: number | null;
+    remote_ok: boolean;
+    onsite_ok: boolean;
+  } | null;
+  skills: { id: number; name: string }[];
+  latest_education: {
+    id: number;
+    institution: string;
+    degree: string;
+    field_of_study: string;
+    start_date: string;
+    end_date: string | null;
+  } | null;
+};
+
 export type Application = {
   id: number;
   intern_email: string;
+  /** null when the intern hasn't filled in a profile */
+  profile: ApplicantProfile | null;
   status: "pending" | "accepted" | "rejected";
   created_at: string;
 };
 
+/** Cursor-paginated envelope returned by /api/internships/<id>/applications/ */
+export type ApplicationPage = {
+  next: string | null;
+  previous: string | null;
+  results: Application[];
+  /** Per-status applicant counts; first page only */
+  totals?: Record<Application["status"] | "all", number>;
+};
+
 /* ------------------ API calls ------------------ */
 async function getApplications(listingId: number): Promise<Application[]> {
-  const res = await fetchWithAuth(`/api/internships/${listingId}/applications/`);
+  const res = await fetchWithAuth(
+    `/api/internships/${listingId}/applications/?page_size=100`
+  );
   if (!res.ok) throw new Error(await res.text());
-  return res.json();
+  const page: ApplicationPage = await res.json();
+  return page.results;
 }
 
 async function patchApplication({
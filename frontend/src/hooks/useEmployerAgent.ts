@@ -1,18 +1,18 @@
 // frontend/src/hooks/useEmployerAgent.ts
 "use client";
 
-import { useEffect, useState } from "react";
+import { useCallback, useEffect, useState } from "react";
 import { useMutation, useQuery, useQueryClient } from "@tanstack/react-query";
 import { fetchWithAuth } from "@/lib/fetchWithAuth";
+import { fetchHistoryPage, type HistoryChunk } from "@/lib/agentHistory";
 
 /* ---------- types ---------- */
 export type Msg = { role: "user" | "assistant"; content: string };
 
 /* ---------- API calls ---------- */
-async function getEmployerHistory(): Promise<Msg[]> {
-  const res = await fetchWithAuth("/api/agent/employer-assistant/history/");
-  if (!res.ok) throw new Error(await res.text());
-  return res.json();
+/** Newest page of the transcript; older pages via `loadOlder` */
+function getEmployerHistory(): Promise<HistoryChunk<Msg>> {
+  return fetchHistoryPage<Msg>("/api/agent/employer-assistant/history/");
 }
 
 async function sendEmployerMessage(body: {
@@ -40,14 +40,24 @@ export function useEmployerAgent() {
   });
 
   const [localHistory, setLocal] = useState<Msg[]>([]);
+  const [olderUrl, setOlderUrl] = useState<string | null>(null);
 
   // Sync local history state when server history is fetched
   useEffect(() => {
     if (historyQ.data) {
-      setLocal(historyQ.data);
+      setLocal(historyQ.data.messages);
+      setOlderUrl(historyQ.data.older);
     }
   }, [historyQ.data]);
 
+  /* lazy-load the page of turns before the oldest one shown */
+  const loadOlder = useCallback(async () => {
+    if (!olderUrl) return;
+    const page = await fetchHistoryPage<Msg>(olderUrl);
+    setLocal((h) => [...page.messages, ...h]);
+    setOlderUrl(page.older);
+  }, [olderUrl]);
+
   // Mutation to send a new message
   const chat = useMutation({
     mutationFn: (userMsg: string) =>
@@ -59,11 +69,14 @@ export function useEmployerAgent() {
         { role: "user", content: userMsg },
         { role: "assistant", content: reply },
       ]);
-      qc.setQueryData<Msg[]>(["chat", "employer-assistant"], (old = []) => [
-        ...old,
-        { role: "user", content: userMsg },
-        { role: "assistant", content: reply },
-      ]);
+      qc.setQueryData<HistoryChunk<Msg>>(["chat", "employer-assistant"], (old) => ({
+        messages: [
+          ...(old?.messages ?? []),
+          { role: "user", content: userMsg },
+          { role: "assistant", content: reply },
+        ],
+        older: old?.older ?? null,
+      }));
       // If the employer profile was updated (profile data returned), refresh the employer profile query
       if (employer) {
         qc.invalidateQueries({ queryKey: ["employer", "me"] });
@@ -79,6 +92,8 @@ export function useEmployerAgent() {
 
   return {
     history: localHistory,
+    loadOlder,
+    hasOlder: !!olderUrl,
     send,
     sending: chat.isPending,
     error: historyQ.error || (chat.error as Error | null),
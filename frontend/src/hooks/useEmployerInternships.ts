@@ -15,26 +15,40 @@ export type EmployerInternship = {
   requirements: string | null;
   posted_at: string;
   updated_at: string;
+  /** ISO timestamp after which the listing stops taking applications */
+  application_deadline?: string | null;
+  is_closed?: boolean;
+  closed_at?: string | null;
   /** number of applicants returned by the API (may be undefined if not annotated) */
   applications_count?: number;
+  /** detail-page views / feed impressions (flushed periodically, may lag) */
+  views_count?: number;
+  impressions_count?: number;
 };
 
 /* ------------------------------------------------------------------ */
 /*  API helpers                                                        */
 /* ------------------------------------------------------------------ */
 
-/* ── GET current employer’s listings ── */
+/* ── GET current employer’s listings (offset pages: ?page=N) ── */
 async function getMine(): Promise<EmployerInternship[]> {
-  const res = await fetchWithAuth("/api/internships?mine=true");
+  const res = await fetchWithAuth("/api/internships?mine=true&page=1&page_size=100");
   if (!res.ok) throw new Error(await res.text());
-  return res.json();
+  const page: { count: number; results: EmployerInternship[] } = await res.json();
+  return page.results;
 }
 
 /* ── POST create listing ── */
 async function postListing(
   data: Omit<
     EmployerInternship,
-    "id" | "posted_at" | "updated_at" | "applications_count"
+    | "id"
+    | "posted_at"
+    | "updated_at"
+    | "closed_at"
+    | "applications_count"
+    | "views_count"
+    | "impressions_count"
   >
 ): Promise<EmployerInternship> {
   const res = await fetchWithAuth("/api/internships", {
@@ -50,7 +64,12 @@ async function postListing(
 async function putListing(
   data: Omit<
     EmployerInternship,
-    "posted_at" | "updated_at" | "applications_count"
+    | "posted_at"
+    | "updated_at"
+    | "closed_at"
+    | "applications_count"
+    | "views_count"
+    | "impressions_count"
   >
 ): Promise<EmployerInternship> {
   const { id, ...fields } = data;
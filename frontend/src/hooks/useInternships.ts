@@ -4,6 +4,9 @@ import { useQuery } from "@tanstack/react-query";
 import { fetchWithAuth } from "@/lib/fetchWithAuth";
 
 /* -------------------- types -------------------- */
+/** Logo thumbnail URLs keyed by pixel size ("64" | "128" | "256"). */
+export type LogoSrcSet = Record<string, string>;
+
 export type Internship = {
   id: number;
   title: string;
@@ -14,14 +17,22 @@ export type Internship = {
   posted_at: string;
   updated_at: string;
   employer_name: string;
-  employer_logo: string | null;
+  employer_logo: LogoSrcSet | null;
+};
+
+/** Cursor-paginated envelope returned by /api/internships/ */
+export type InternshipPage = {
+  next: string | null;
+  previous: string | null;
+  results: Internship[];
 };
 
 /* ------------------ API calls ------------------ */
 async function getAllInternships(): Promise<Internship[]> {
-  const res = await fetchWithAuth("/api/internships/");
+  const res = await fetchWithAuth("/api/internships/?page_size=100");
   if (!res.ok) throw new Error(await res.text());
-  return res.json();
+  const page: InternshipPage = await res.json();
+  return page.results;
 }
 
 /* -------------------- hook -------------------- */
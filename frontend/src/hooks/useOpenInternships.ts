@@ -1,13 +1,14 @@
 "use client";
 import { useQuery, type UseQueryOptions } from "@tanstack/react-query";
 import { fetchWithAuth } from "@/lib/fetchWithAuth";
-import type { Internship } from "@/hooks/useInternships";
+import type { Internship, InternshipPage } from "@/hooks/useInternships";
 
 /** Fetch all open internships (status=open). */
 async function getOpenInternships(): Promise<Internship[]> {
-  const res = await fetchWithAuth("/api/internships?status=open");
+  const res = await fetchWithAuth("/api/internships?status=open&page_size=100");
   if (!res.ok) throw new Error(await res.text());
-  return res.json();
+  const page: InternshipPage = await res.json();
+  return page.results;
 }
 
 /** Hook to retrieve currently open internships (for intern dashboard metrics/feed). */
@@ -5,6 +5,7 @@ import { useRouter } from "next/navigation";
 import { useQuery, useQueryClient } from "@tanstack/react-query";
 import { useVoice } from "@/hooks/useVoice";
 import { fetchWithAuth } from "@/lib/fetchWithAuth";
+import { fetchHistoryPage, type HistoryChunk } from "@/lib/agentHistory";
 import { getAccess } from "@/lib/auth";
 import { jwtDecode } from "jwt-decode";
 
@@ -184,24 +185,30 @@ export function useVoiceAgent() {
 
   const navigate = debounce((path: string) => router.push(path), 1000);
 
-  const { data: serverHistory = [] } = useQuery({
+  /* newest page of this agent's transcript; older pages load on demand */
+  const { data: serverHistory } = useQuery({
     queryKey: ["chat", key],
-    queryFn: async () => {
-      const res = await fetchWithAuth(`/api/agent/${key}/history`);
-      if (!res.ok) throw new Error(await res.text());
-      return res.json() as Promise<Msg[]>;
-    },
+    queryFn: () => fetchHistoryPage<Msg>(`/api/agent/${key}/history`),
     staleTime: Infinity,
     enabled: !!getAccess(),
   });
 
-  const [history, setHistory] = useState<Msg[]>(serverHistory);
+  const [history, setHistory] = useState<Msg[]>(serverHistory?.messages ?? []);
+  const [olderUrl, setOlderUrl] = useState<string | null>(null);
   useEffect(() => {
-    if (history.length === 0 && serverHistory.length > 0) {
-      setHistory(serverHistory);
+    if (history.length === 0 && serverHistory?.messages.length) {
+      setHistory(serverHistory.messages);
+      setOlderUrl(serverHistory.older);
     }
   }, [serverHistory, history.length]);
 
+  const loadOlder = useCallback(async () => {
+    if (!olderUrl) return;
+    const page = await fetchHistoryPage<Msg>(olderUrl);
+    setHistory((h) => [...page.messages, ...h]);
+    setOlderUrl(page.older);
+  }, [olderUrl]);
+
   const { isRecording, start, stop, transcript, sttLoading, sttError } =
     useVoice();
   const speakSentence = useSentenceSpeaker();
@@ -279,11 +286,14 @@ export function useVoiceAgent() {
         return copy;
       });
 
-      qc.setQueryData(["chat", key], (old: Msg[] = []) => [
-        ...old,
-        { role: "user", content: userMsg },
-        { role: "assistant", content: finalText || " " },
-      ]);
+      qc.setQueryData<HistoryChunk<Msg>>(["chat", key], (old) => ({
+        messages: [
+          ...(old?.messages ?? []),
+          { role: "user", content: userMsg },
+          { role: "assistant", content: finalText || " " },
+        ],
+        older: old?.older ?? null,
+      }));
 
       if (role === "EMPLOYER" && done.employer) {
         qc.invalidateQueries({ queryKey: ["employer", "me"] });
@@ -326,6 +336,8 @@ export function useVoiceAgent() {
     start,
     stop,
     history,
+    loadOlder,
+    hasOlder: !!olderUrl,
     sending: sending || sttLoading,
     error: error || sttError,
   };
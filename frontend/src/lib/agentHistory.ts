@@ -0,0 +1,18 @@
+import { fetchWithAuth } from "@/lib/fetchWithAuth";
+
+/** Cursor-paginated envelope returned by /api/agent/<agent>/history/ (newest first) */
+export type HistoryPage<T> = {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+};
+
+/** One page of an agent transcript, oldest first, plus the URL of the page before it. */
+export type HistoryChunk<T> = { messages: T[]; older: string | null };
+
+export async function fetchHistoryPage<T>(url: string): Promise<HistoryChunk<T>> {
+  const res = await fetchWithAuth(url);
+  if (!res.ok) throw new Error(await res.text());
+  const page: HistoryPage<T> = await res.json();
+  return { messages: [...page.results].reverse(), older: page.next };
+}
@@ -0,0 +1,200 @@
+# internships/applications.py
+"""
+Concurrency-safe application writes.
+
+Single apply
+
+`apply(internship_id, intern_id)` is a single
+
+    INSERT … SELECT … WHERE <listing is open>
+    ON CONFLICT (internship_id, intern_id)
+        DO UPDATE SET status = status        -- no-op, but makes RETURNING work
+    RETURNING id, status, created_at, (xmax = 0)
+
+so double-clicks and concurrent retries can never hit the unique constraint:
+the loser simply gets the existing row back, and ``xmax = 0`` (no earlier
+row version) says whether *this* statement inserted. SQLite (≥ 3.35) has
+no xmax, so there the conflict is DO NOTHING: a returned row is always an
+insert, and a retry costs one extra SELECT for the existing row. Only when
+no application exists either (closed, expired or missing listing) do
+follow-up queries work out which.
+
+The upsert and the ``post_save(created=True)`` it sends by hand for a new
+row (the insert bypasses Model.save(); applications_count, dashboard
+rollups, …) share one transaction, so the counters never drift from the
+rows; `manage.py rebuild_applications_count` remains for repairs.
+
+Bulk apply
+  `apply_many(ids, intern_id)` costs a constant number of queries whatever
+  the batch size: validate ids (and whether each is open) → one multi-row
+  INSERT … ON CONFLICT DO NOTHING RETURNING internship_id (exactly the rows
+  *this* statement inserted, on PostgreSQL and SQLite alike) → read back the
+  intern's rows for those ids → one UPDATE bumping applications_count → two
+  for the dashboard rollups (internships/rollups.py).
+"""
+
+from __future__ import annotations
+
+from datetime import timezone as dt_timezone
+from typing import Dict, List, Sequence, Tuple
+
+from django.db import connection, transaction
+from django.db.models import BooleanField, ExpressionWrapper, F
+from django.db.models.signals import post_save
+from django.utils import timezone
+
+from . import rollups
+from .models import Application, Internship, accepting_applications
+
+_UPSERT_SQL = """
+INSERT INTO internships_application (internship_id, intern_id, status, created_at)
+SELECT %s, %s, %s, %s
+WHERE EXISTS (
+    SELECT 1 FROM internships_internship
+    WHERE id = %s AND NOT is_closed
+      AND (application_deadline IS NULL OR application_deadline > %s)
+)
+ON CONFLICT (internship_id, intern_id) {on_conflict}
+RETURNING id, status, created_at, {inserted}
+"""
+_UPSERT_BY_VENDOR = {
+    "postgresql": _UPSERT_SQL.format(
+        on_conflict="DO UPDATE SET status = internships_application.status",
+        inserted="(xmax = 0)",
+    ),
+}
+_INSERT_SQL = _UPSERT_SQL.format(on_conflict="DO NOTHING", inserted="1")
+
+_INSERT_MANY_SQL = """
+INSERT INTO internships_application (internship_id, intern_id, status, created_at)
+VALUES {rows}
+ON CONFLICT (internship_id, intern_id) DO NOTHING
+RETURNING internship_id
+"""
+INSERT_BATCH = 200  # rows per INSERT (4 parameters each; SQLite caps at 999)
+
+
+class ListingClosed(Exception):
+    """The listing exists but no longer takes applications."""
+
+
+def apply(internship_id: int, intern_id: int) -> Tuple[Application, bool]:
+    """
+    Create the application unless it exists; return (application, created).
+
+    Raises ListingClosed for a closed / expired listing the intern hasn't
+    applied to yet, and Internship.DoesNotExist for an unknown one.
+    """
+    stamp = connection.ops.adapt_datetimefield_value(timezone.now())
+    with transaction.atomic():
+        with connection.cursor() as cur:
+            cur.execute(
+                _UPSERT_BY_VENDOR.get(connection.vendor, _INSERT_SQL),
+                [
+                    internship_id,
+                    intern_id,
+                    Application.Status.PENDING,
+                    stamp,
+                    internship_id,
+                    stamp,
+                ],
+            )
+            row = cur.fetchone()
+        if row is None:
+            existing = Application.objects.filter(
+                internship_id=internship_id, intern_id=intern_id
+            ).first()
+            if existing is not None:  # a retry, or applied before it closed
+                return existing, False
+            if Internship.objects.filter(pk=internship_id).exists():
+                raise ListingClosed(internship_id)
+            raise Internship.DoesNotExist(internship_id)
+        pk, status, created_at, inserted = row
+        created_at = Application._meta.get_field("created_at").to_python(created_at)
+        if timezone.is_naive(created_at):  # SQLite stores UTC without an offset
+            created_at = timezone.make_aware(created_at, dt_timezone.utc)
+
+        application = Application(
+            id=pk,
+            internship_id=internship_id,
+            intern_id=intern_id,
+            status=status,
+            created_at=created_at,
+        )
+        application._state.adding = False
+        created = bool(inserted)
+        if created:
+            post_save.send(
+                sender=Application,
+                instance=application,
+                created=True,
+                update_fields=None,
+                raw=False,
+                using=connection.alias,
+            )
+    return application, created
+
+
+def apply_many(
+    internship_ids: Sequence[int], intern_id: int
+) -> Tuple[Dict[int, Application], List[int], List[int], List[int]]:
+    """
+    Apply to every listing in ``internship_ids`` at once.
+
+    Returns ({internship id: application}, created internship ids,
+    unknown internship ids, closed internship ids not applied to before).
+    """
+    wanted = list(dict.fromkeys(internship_ids))
+    is_open = dict(
+        Internship.objects.filter(pk__in=wanted)
+        .annotate(is_open=ExpressionWrapper(accepting_applications(), BooleanField()))
+        .values_list("pk", "is_open")
+    )
+    found = set(is_open)
+    open_ids = {pk for pk, flag in is_open.items() if flag}
+    unknown = [pk for pk in wanted if pk not in found]
+    valid = [pk for pk in wanted if pk in found]
+    if not valid:
+        return {}, [], unknown, []
+
+    to_insert = [pk for pk in valid if pk in open_ids]
+    stamp = connection.ops.adapt_datetimefield_value(timezone.now())
+    with transaction.atomic():
+        inserted = set()
+        with connection.cursor() as cur:
+            for start in range(0, len(to_insert), INSERT_BATCH):
+                batch = to_insert[start : start + INSERT_BATCH]
+                cur.execute(
+                    _INSERT_MANY_SQL.format(
+                        rows=", ".join(["(%s, %s, %s, %s)"] * len(batch))
+                    ),
+                    [
+                        value
+                        for pk in batch
+                        for value in (
+                            pk,
+                            intern_id,
+                            Application.Status.PENDING,
+                            stamp,
+                        )
+                    ],
+                )
+                inserted.update(pk for (pk,) in cur.fetchall())
+        applications = {
+            app.internship_id: app
+            for app in Application.objects.filter(
+                intern_id=intern_id, internship_id__in=valid
+            )
+        }
+        created = [pk for pk in applications if pk in inserted]
+        if created:
+            # Each of these listings gained exactly one application
+            Internship.objects.filter(pk__in=created).update(
+                applications_count=F("applications_count") + 1
+            )
+            rollups.applications_created(
+                (pk, applications[pk].status, applications[pk].created_at)
+                for pk in created
+            )
+    closed = [pk for pk in valid if pk not in applications]
+    return applications, created, unknown, closed
@@ -12,6 +12,5 @@ class InternshipsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "internships"
 
-    # If you ever need to connect signals, do it here:
-    # def ready(self):
-    #     from . import signals  # noqa: F401
+    def ready(self):
+        from . import signals  # noqa: F401
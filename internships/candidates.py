@@ -0,0 +1,231 @@
+# internships/candidates.py
+"""
+Candidate discovery: rank intern profiles against one listing.
+
+`CandidateIndex` holds every profile in NumPy form, once per process:
+
+• skill → profile rows as CSC postings (sorted int32 arrays), plus the same
+  for headline / bio / skill-name terms;
+• Availability as flat columns – status code, hours_per_week, remote_ok,
+  onsite_ok – so filters are boolean masks.
+
+A query "skills A, B, C (any | all) + availability filters" is then set
+arithmetic: one `np.bincount` over the three postings gives, per profile,
+how many of the skills it has (AND = count == k, OR = count > 0) and their
+idf-weighted share; availability masks are and-ed in; `np.argpartition`
+picks the page. No join over profiles_profile_skills at request time.
+
+Rebuilt lazily when the "profiles" / "skills" cache namespaces move
+(profiles.signals), at most once per INDEX_MIN_AGE seconds.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .matching import LazyIndex, Postings, idf_weights, tokenize
+
+W_SKILL = 0.8
+W_TEXT = 0.2
+INDEX_MIN_AGE = 60  # seconds
+
+NO_AVAILABILITY = -1  # status code / hours for profiles without Availability
+
+
+@dataclass
+class CandidateIndex:
+    ids: np.ndarray  # row -> Profile.pk
+    skills: Postings
+    skill_cols: Dict[int, int]  # Skill.pk -> column
+    skill_idf: np.ndarray
+    terms: Postings
+    term_cols: Dict[str, int]
+    term_idf: np.ndarray
+    status: np.ndarray  # row -> index into ``statuses``, or NO_AVAILABILITY
+    hours: np.ndarray  # row -> hours_per_week, or NO_AVAILABILITY
+    remote_ok: np.ndarray
+    onsite_ok: np.ndarray
+    statuses: Tuple[str, ...] = field(default=())
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def build(cls) -> "CandidateIndex":
+        from accounts.models import User
+        from profiles.models import Availability, Profile, Skill
+
+        rows = list(
+            Profile.objects.filter(
+                user__is_active=True,  # not being deleted
+                user__role=User.Role.INTERN,  # employers get a Profile too
+            )
+            .order_by("pk")
+            .values_list("pk", "headline", "bio")
+            .iterator(chunk_size=5000)
+        )
+        n = len(rows)
+        ids = np.fromiter((r[0] for r in rows), np.int64, n)
+        row_of = {pk: i for i, pk in enumerate(ids.tolist())}
+
+        skill_names = dict(Skill.objects.values_list("pk", "name"))
+        skill_cols: Dict[int, int] = {}
+        skill_rows: List[int] = []
+        skill_ids: List[int] = []
+        names_by_row: Dict[int, List[str]] = {}
+        pairs = Profile.skills.through.objects.values_list("profile_id", "skill_id")
+        for profile_id, skill_id in pairs.iterator(chunk_size=20000):
+            row = row_of.get(profile_id)
+            if row is not None:
+                skill_rows.append(row)
+                skill_ids.append(skill_cols.setdefault(skill_id, len(skill_cols)))
+                names_by_row.setdefault(row, []).append(skill_names[skill_id])
+
+        term_cols: Dict[str, int] = {}
+        term_rows: List[int] = []
+        term_ids: List[int] = []
+        for i, (_, headline, bio) in enumerate(rows):
+            text = " ".join([headline, bio, *names_by_row.get(i, ())])
+            for term in tokenize(text):
+                term_rows.append(i)
+                term_ids.append(term_cols.setdefault(term, len(term_cols)))
+        del rows, names_by_row
+
+        statuses = tuple(Availability.Status.values)
+        status = np.full(n, NO_AVAILABILITY, np.int8)
+        hours = np.full(n, NO_AVAILABILITY, np.int16)
+        # Model defaults for profiles that never filled in availability
+        remote_ok = np.ones(n, bool)
+        onsite_ok = np.zeros(n, bool)
+        availability = Availability.objects.values_list(
+            "profile_id", "status", "hours_per_week", "remote_ok", "onsite_ok"
+        )
+        for profile_id, st, hrs, remote, onsite in availability.iterator(
+            chunk_size=20000
+        ):
+            row = row_of.get(profile_id)
+            if row is None:
+                continue
+            status[row] = statuses.index(st)
+            hours[row] = NO_AVAILABILITY if hrs is None else hrs
+            remote_ok[row] = remote
+            onsite_ok[row] = onsite
+
+        skills = Postings.build(
+            np.asarray(skill_rows, np.int32),
+            np.asarray(skill_ids, np.int32),
+            len(skill_cols),
+        )
+        terms = Postings.build(
+            np.asarray(term_rows, np.int32),
+            np.asarray(term_ids, np.int32),
+            len(term_cols),
+        )
+        return cls(
+            ids=ids,
+            skills=skills,
+            skill_cols=skill_cols,
+            skill_idf=idf_weights(skills.df(), n),
+            terms=terms,
+            term_cols=term_cols,
+            term_idf=idf_weights(terms.df(), n),
+            status=status,
+            hours=hours,
+            remote_ok=remote_ok,
+            onsite_ok=onsite_ok,
+            statuses=statuses,
+        )
+
+
+# ───────────────────────── query ─────────────────────────
+@dataclass
+class CandidateQuery:
+    skill_ids: Sequence[int]
+    text: str = ""
+    match_all: bool = False
+    statuses: Sequence[str] = ()
+    min_hours: Optional[int] = None
+    remote_ok: Optional[bool] = None
+    onsite_ok: Optional[bool] = None
+
+
+def search(
+    index: CandidateIndex, query: CandidateQuery, limit: int, offset: int = 0
+) -> Tuple[int, List[Tuple[int, float, List[int]]]]:
+    """
+    Return (total matches, [(profile id, score, matched skill ids), …]) for
+    one page, best first.
+    """
+    n = index.size
+    skill_ids = [s for s in query.skill_ids if s in index.skill_cols]
+    cols = [index.skill_cols[s] for s in skill_ids]
+
+    if query.match_all and len(cols) < len(query.skill_ids):
+        return 0, []  # some required skill has no holder at all
+    hits = np.zeros(n, np.int32)
+    total = np.zeros(n)
+    if cols:
+        rows, weights = index.skills.gather(cols, index.skill_idf[cols])
+        hits = np.bincount(rows, minlength=n).astype(np.int32)
+        shared = np.bincount(rows, weights=weights, minlength=n)
+        total += W_SKILL * shared / index.skill_idf[cols].sum()
+    mask = hits == len(query.skill_ids) if query.match_all else hits > 0
+
+    term_cols = [
+        index.term_cols[t] for t in tokenize(query.text) if t in index.term_cols
+    ]
+    if term_cols:
+        idf = index.term_idf[term_cols]
+        rows, weights = index.terms.gather(term_cols, idf)
+        total += W_TEXT * np.bincount(rows, weights=weights, minlength=n) / idf.sum()
+        if not query.skill_ids:
+            mask = total > 0
+    elif not query.skill_ids:
+        mask = np.ones(n, bool)
+
+    if query.statuses:
+        codes = [index.statuses.index(s) for s in query.statuses]
+        mask &= np.isin(index.status, codes)
+    if query.min_hours is not None:
+        mask &= index.hours >= query.min_hours
+    if query.remote_ok is not None:
+        mask &= index.remote_ok == query.remote_ok
+    if query.onsite_ok is not None:
+        mask &= index.onsite_ok == query.onsite_ok
+
+    candidates = np.flatnonzero(mask)
+    count = len(candidates)
+    wanted = offset + limit
+    if count > wanted:
+        part = np.argpartition(-total[candidates], wanted - 1)[:wanted]
+        candidates = candidates[part]
+    order = np.lexsort((index.ids[candidates], -total[candidates]))
+    page = candidates[order][offset:wanted]
+
+    results = []
+    for row in page.tolist():
+        matched = [
+            skill_id
+            for skill_id, col in zip(skill_ids, cols)
+            if _has(index.skills, col, row)
+        ]
+        results.append((int(index.ids[row]), float(total[row]), matched))
+    return count, results
+
+
+def _has(postings: Postings, col: int, row: int) -> bool:
+    rows = postings.indices[postings.indptr[col] : postings.indptr[col + 1]]
+    i = np.searchsorted(rows, row)
+    return bool(i < len(rows) and rows[i] == row)
+
+
+_candidates = LazyIndex(CandidateIndex.build, ("profiles", "skills"), INDEX_MIN_AGE)
+
+
+def get_index() -> CandidateIndex:
+    """The current candidate index, rebuilt when profiles or skills changed."""
+    return _candidates.get()
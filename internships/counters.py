@@ -0,0 +1,223 @@
+# internships/counters.py
+"""
+Buffered listing view / impression counters.
+
+A feed page or detail read must not cost a DB write, so hits are counted
+out-of-band and folded into ``Internship.views_count`` /
+``impressions_count`` in batches:
+
+• Redis cache (prod): one pipelined HINCRBY per listing into a shared hash,
+  so every worker adds to the same buffer. `flush()` RENAMEs the hash to a
+  ``:flushing:<time>:<uuid>`` key first – atomic, so concurrent flushers
+  (and hits arriving meanwhile) never double-count – and deletes that key
+  only once the DB write has committed. A flusher that dies in between
+  leaves the key behind; the next `flush()` merges keys older than
+  ORPHAN_AGE back into the live hash, so the batch is retried, not lost.
+• Any other cache (dev / tests): an in-process Counter behind a lock.
+• `flush()` turns the buffered deltas into one UPDATE … SET views_count =
+  views_count + CASE id … per FLUSH_BATCH listings. Each process flushes
+  every INTERNSHIP_COUNTERS_FLUSH_INTERVAL seconds from a daemon timer;
+  `manage.py flush_internship_counters` does the same from cron.
+
+Counts are best-effort: a worker killed before its timer fires loses its
+in-process buffer, and one killed between the commit and deleting its
+flushing key counts that batch twice.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.redis import RedisCache
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, When
+
+from backend.background import run_in_background
+
+KINDS = ("views", "impressions")
+FLUSH_BATCH = 500
+ORPHAN_AGE = 600  # seconds; far longer than any flush takes
+
+_lock = threading.Lock()
+_buffer: Dict[str, Counter] = {kind: Counter() for kind in KINDS}
+_flusher: threading.Timer | None = None
+
+
+def _redis():
+    # `cache` is a ConnectionProxy, never a RedisCache itself.
+    backend = caches["default"]
+    return (
+        backend._cache.get_client(write=True)
+        if isinstance(backend, RedisCache)
+        else None
+    )
+
+
+def _hash_key(kind: str) -> str:
+    return cache.make_key(f"counters:internship:{kind}")
+
+
+def _record(kind: str, ids: Iterable[int]) -> None:
+    hits = Counter(ids)
+    if not hits:
+        return
+    client = _redis()
+    if client is not None:
+        pipe = client.pipeline(transaction=False)
+        for pk, n in hits.items():
+            pipe.hincrby(_hash_key(kind), pk, n)
+        pipe.execute()
+    else:
+        with _lock:
+            _buffer[kind].update(hits)
+    _ensure_flusher()
+
+
+def record_view(internship_id: int) -> None:
+    """A listing's detail page was shown."""
+    _record("views", [internship_id])
+
+
+def record_impressions(ids: Iterable[int]) -> None:
+    """Listings appeared in a feed / recommendations page."""
+    _record("impressions", ids)
+
+
+# ───────────────────────── flushing ─────────────────────────
+def _flushing_key(kind: str) -> str:
+    return f"{_hash_key(kind)}:flushing:{int(time.time())}:{uuid.uuid4().hex}"
+
+
+def _take() -> Tuple[Dict[str, Counter], List[str]]:
+    """
+    Atomically detach everything buffered so far; return it with the Redis
+    keys now holding it, to delete once the counts are written.
+    """
+    client = _redis()
+    if client is None:
+        with _lock:
+            taken = {kind: _buffer[kind] for kind in KINDS}
+            for kind in KINDS:
+                _buffer[kind] = Counter()
+        return taken, []
+
+    from redis.exceptions import ResponseError
+
+    taken, keys = {}, []
+    for kind in KINDS:
+        flushing = _flushing_key(kind)  # one per flusher
+        try:
+            client.rename(_hash_key(kind), flushing)
+        except ResponseError:  # "no such key": nothing buffered
+            taken[kind] = Counter()
+            continue
+        keys.append(flushing)
+        raw = client.hgetall(flushing)
+        taken[kind] = Counter({int(pk): int(n) for pk, n in raw.items()})
+    return taken, keys
+
+
+def _give_back(taken: Dict[str, Counter], keys: List[str]) -> None:
+    client = _redis()
+    if client is None:
+        with _lock:
+            for kind in KINDS:
+                _buffer[kind].update(taken[kind])
+        return
+    pipe = client.pipeline(transaction=True)  # merge back and drop, together
+    for kind in KINDS:
+        for pk, n in taken[kind].items():
+            pipe.hincrby(_hash_key(kind), pk, n)
+    if keys:
+        pipe.delete(*keys)
+    pipe.execute()
+
+
+def _recover_orphans() -> None:
+    """Merge flushing keys left by a flusher that died mid-flush back in."""
+    client = _redis()
+    if client is None:
+        return
+
+    from redis.exceptions import ResponseError
+
+    cutoff = time.time() - ORPHAN_AGE
+    for kind in KINDS:
+        for orphan in client.scan_iter(match=f"{_hash_key(kind)}:flushing:*"):
+            orphan = orphan.decode() if isinstance(orphan, bytes) else orphan
+            if int(orphan.rsplit(":", 2)[1]) > cutoff:
+                continue  # another flusher may still be writing it
+            claimed = _flushing_key(kind)
+            try:
+                client.rename(orphan, claimed)  # only one recoverer wins
+            except ResponseError:
+                continue
+            raw = client.hgetall(claimed)
+            _give_back(
+                {k: Counter() for k in KINDS}
+                | {kind: Counter({int(pk): int(n) for pk, n in raw.items()})},
+                [claimed],
+            )
+
+
+def flush() -> int:
+    """Write buffered counts to the DB; return the number of listings touched."""
+    _recover_orphans()
+    taken, keys = _take()
+    ids = sorted(set().union(*(taken[kind] for kind in KINDS)))
+    try:
+        with transaction.atomic():
+            _write(taken, ids)
+    except Exception:
+        _give_back(taken, keys)  # keep the counts for the next attempt
+        raise
+    if keys:
+        _redis().delete(*keys)
+    return len(ids)
+
+
+def _write(taken: Dict[str, Counter], ids) -> None:
+    from .models import Internship
+
+    for start in range(0, len(ids), FLUSH_BATCH):
+        batch = ids[start : start + FLUSH_BATCH]
+        updates = {}
+        for kind in KINDS:
+            field = f"{kind}_count"
+            whens = [
+                When(pk=pk, then=F(field) + taken[kind][pk])
+                for pk in batch
+                if taken[kind][pk]
+            ]
+            if whens:
+                updates[field] = Case(
+                    *whens, default=F(field), output_field=IntegerField()
+                )
+        # Deleted listings simply match no row
+        Internship.objects.filter(pk__in=batch).update(**updates)
+
+
+def _tick() -> None:
+    global _flusher
+    with _lock:
+        _flusher = None
+    run_in_background(flush)
+
+
+def _ensure_flusher() -> None:
+    global _flusher
+    if _flusher is not None:
+        return
+    with _lock:
+        if _flusher is None:
+            _flusher = threading.Timer(
+                settings.INTERNSHIP_COUNTERS_FLUSH_INTERVAL, _tick
+            )
+            _flusher.daemon = True
+            _flusher.start()
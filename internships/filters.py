@@ -0,0 +1,152 @@
+# internships/filters.py
+"""
+Facet filters and facet counts for /api/internships/.
+
+Query parameters (all optional, combinable):
+  location=Boston,NYC        exact location(s)
+  is_remote=true|false
+  employer=3,7               employer id(s)
+  posted_after=2025-05-01    ISO date or datetime (inclusive)
+  posted_before=2025-06-01   ISO date or datetime (exclusive)
+  skills=Python,Django       listings tagged with *any* of these skills
+
+`facet_counts` returns the chip data for a filtered queryset in two grouped
+queries: one GROUP BY over (is_remote, location, employer) folded into every
+scalar facet, and one over the skills join table.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime, time, timedelta
+from typing import Dict, List
+
+from django.db.models import Count, Q, QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+TOP_LOCATIONS = 10
+TOP_EMPLOYERS = 10
+TOP_SKILLS = 15
+RECENCY_BUCKETS = {"last_24h": 1, "last_7d": 7, "last_30d": 30}
+
+_TRUE = ("true", "1", "yes")
+_FALSE = ("false", "0", "no")
+
+
+# ───────────────────────── parsing helpers ─────────────────────────
+def _csv(params, name: str) -> List[str]:
+    raw = params.get(name) or ""
+    return [part.strip() for part in raw.split(",") if part.strip()]
+
+
+def _parse_moment(params, name: str):
+    raw = (params.get(name) or "").strip()
+    if not raw:
+        return None
+    moment = parse_datetime(raw)
+    if moment is None:
+        day = parse_date(raw)
+        if day is None:
+            raise ValidationError({name: "Expected an ISO date or datetime."})
+        moment = datetime.combine(day, time.min)
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return moment
+
+
+# ───────────────────────── filtering ─────────────────────────
+def filter_internships(qs: QuerySet, params) -> QuerySet:
+    """Apply every facet filter present in ``params`` (a QueryDict)."""
+    locations = _csv(params, "location")
+    if locations:
+        qs = qs.filter(location__in=locations)
+
+    is_remote = (params.get("is_remote") or "").lower()
+    if is_remote in _TRUE:
+        qs = qs.filter(is_remote=True)
+    elif is_remote in _FALSE:
+        qs = qs.filter(is_remote=False)
+    elif is_remote:
+        raise ValidationError({"is_remote": "Expected true or false."})
+
+    employers = _csv(params, "employer")
+    if employers:
+        try:
+            qs = qs.filter(employer_id__in=[int(e) for e in employers])
+        except ValueError:
+            raise ValidationError({"employer": "Expected employer ids."})
+
+    posted_after = _parse_moment(params, "posted_after")
+    if posted_after:
+        qs = qs.filter(posted_at__gte=posted_after)
+    posted_before = _parse_moment(params, "posted_before")
+    if posted_before:
+        qs = qs.filter(posted_at__lt=posted_before)
+
+    skills = _csv(params, "skills")
+    if skills:
+        # Semi-join on the through table instead of JOIN + DISTINCT, so the
+        # outer query keeps its (posted_at, id) ordering and index.
+        through = qs.model.skills.through
+        qs = qs.filter(
+            id__in=through.objects.filter(skill__name__in=skills).values(
+                "internship_id"
+            )
+        )
+    return qs
+
+
+# ───────────────────────── facet counts ─────────────────────────
+def facet_counts(qs: QuerySet) -> Dict[str, object]:
+    """
+    Counts for filter chips over ``qs`` (already filtered, unannotated).
+    """
+    now = timezone.now()
+    recency = {
+        bucket: Count("id", filter=Q(posted_at__gte=now - timedelta(days=days)))
+        for bucket, days in RECENCY_BUCKETS.items()
+    }
+    grouped = (
+        qs.order_by()
+        .values("is_remote", "location", "employer_id", "employer__company_name")
+        .annotate(n=Count("id"), **recency)
+    )
+
+    remote = Counter()
+    locations = Counter()
+    employers = Counter()
+    employer_names: Dict[int, str] = {}
+    posted = Counter()
+    for row in grouped:
+        n = row["n"]
+        remote["remote" if row["is_remote"] else "onsite"] += n
+        if row["location"]:
+            locations[row["location"]] += n
+        employers[row["employer_id"]] += n
+        employer_names[row["employer_id"]] = row["employer__company_name"]
+        for bucket in RECENCY_BUCKETS:
+            posted[bucket] += row[bucket]
+
+    through = qs.model.skills.through
+    skills = (
+        through.objects.filter(internship_id__in=qs.order_by().values("id"))
+        .values("skill__name")
+        .annotate(n=Count("internship_id"))
+        .order_by("-n", "skill__name")[:TOP_SKILLS]
+    )
+
+    return {
+        "is_remote": {"remote": remote["remote"], "onsite": remote["onsite"]},
+        "location": [
+            {"value": loc, "count": n}
+            for loc, n in locations.most_common(TOP_LOCATIONS)
+        ],
+        "employer": [
+            {"value": emp_id, "name": employer_names[emp_id], "count": n}
+            for emp_id, n in employers.most_common(TOP_EMPLOYERS)
+        ],
+        "posted_at": {bucket: posted[bucket] for bucket in RECENCY_BUCKETS},
+        "skills": [{"value": row["skill__name"], "count": row["n"]} for row in skills],
+    }
@@ -0,0 +1,63 @@
+# internships/fragments.py
+"""
+Per-row fragment cache for internship listings.
+
+Serializing a listing (employer name + logo URL, skills, timestamps …) is the
+CPU-heavy part of /api/internships/. `InternshipListSerializer` caches each
+row's serialized representation and reuses it until the row changes:
+
+• key = (id, updated_at, employer.updated_at, host)
+  – editing the listing or re-tagging its skills moves ``updated_at``;
+  – any employer save (company_name, logo …) moves ``employer.updated_at``;
+  – the host is part of the key because logo URLs are absolute.
+  Stale fragments are never deleted, they just stop being asked for.
+• Per-request values – ``applications_count`` and the search rank / snippet –
+  are *not* cached; they are laid over the cached fragment on every request.
+• Hits and misses are reported as the "internship_fragments" ratio in
+  /api/metrics/.
+"""
+
+from __future__ import annotations
+
+from django.core.cache import cache
+from rest_framework import serializers
+
+from backend import metrics
+
+FRAGMENT_VERSION = 2  # bump when InternshipSerializer's output changes
+FRAGMENT_TIMEOUT = 60 * 60 * 24
+
+metrics.register_ratio("internship_fragments")
+
+
+def fragment_key(internship, host: str) -> str:
+    return (
+        f"internship-fragment:v{FRAGMENT_VERSION}:{host}:{internship.pk}:"
+        f"{internship.updated_at.timestamp()}:"
+        f"{internship.employer.updated_at.timestamp()}"
+    )
+
+
+class InternshipListSerializer(serializers.ListSerializer):
+    """Read-side list serializer that serves rows from the fragment cache."""
+
+    def to_representation(self, data):
+        rows = list(data.all() if hasattr(data, "all") else data)
+        request = self.context.get("request")
+        host = request.get_host() if request is not None else ""
+
+        keys = [fragment_key(row, host) for row in rows]
+        cached = cache.get_many(keys)
+        fresh = {}
+        results = []
+        for key, row in zip(keys, rows):
+            fragment = cached.get(key)
+            if fragment is None:
+                fragment = fresh[key] = self.child.static_representation(row)
+            results.append({**fragment, **self.child.dynamic_representation(row)})
+
+        if fresh:
+            cache.set_many(fresh, FRAGMENT_TIMEOUT)
+        metrics.incr("internship_fragments.hit", len(cached))
+        metrics.incr("internship_fragments.miss", len(fresh))
+        return results
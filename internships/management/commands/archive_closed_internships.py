@@ -0,0 +1,98 @@
+"""
+Move long-closed listings (and their applications) out of the hot tables.
+
+    python manage.py archive_closed_internships                     # closed > 180 days
+    python manage.py archive_closed_internships --days 90 --batch-size 100
+
+Run nightly. Each batch copies listings into ArchivedInternship and their
+applications into ArchivedApplication, then deletes the originals – all in
+one transaction, so a listing is never in both places or in neither. Ids
+are preserved and inserts ignore conflicts, so a rerun after a crash is
+safe.
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from internships.models import (
+    Application,
+    ArchivedApplication,
+    ArchivedInternship,
+    Internship,
+)
+
+
+class Command(BaseCommand):
+    help = "Archive internships that have been closed for longer than --days."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=180)
+        parser.add_argument("--batch-size", type=int, default=200)
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        batch_size = max(options["batch_size"], 1)
+        archived = 0
+        while True:
+            with transaction.atomic():
+                listings = list(
+                    Internship.objects.filter(is_closed=True, closed_at__lt=cutoff)
+                    .order_by("closed_at")
+                    .prefetch_related("skills")[:batch_size]
+                )
+                if not listings:
+                    break
+                ids = [listing.pk for listing in listings]
+                ArchivedInternship.objects.bulk_create(
+                    [self._archived(listing) for listing in listings],
+                    ignore_conflicts=True,
+                )
+                ArchivedApplication.objects.bulk_create(
+                    [
+                        ArchivedApplication(
+                            id=pk,
+                            internship_id=internship_id,
+                            intern_id=intern_id,
+                            status=status,
+                            created_at=created_at,
+                        )
+                        for pk, internship_id, intern_id, status, created_at in (
+                            Application.objects.filter(
+                                internship_id__in=ids
+                            ).values_list(
+                                "pk",
+                                "internship_id",
+                                "intern_id",
+                                "status",
+                                "created_at",
+                            )
+                        )
+                    ],
+                    batch_size=1000,
+                    ignore_conflicts=True,
+                )
+                Internship.objects.filter(pk__in=ids).delete()  # cascades
+                archived += len(ids)
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} internships."))
+
+    @staticmethod
+    def _archived(listing: Internship) -> ArchivedInternship:
+        return ArchivedInternship(
+            id=listing.pk,
+            employer_id=listing.employer_id,
+            title=listing.title,
+            description=listing.description,
+            location=listing.location,
+            is_remote=listing.is_remote,
+            requirements=listing.requirements,
+            skills=[skill.name for skill in listing.skills.all()],
+            posted_at=listing.posted_at,
+            application_deadline=listing.application_deadline,
+            closed_at=listing.closed_at,
+            applications_count=listing.applications_count,
+            views_count=listing.views_count,
+            impressions_count=listing.impressions_count,
+        )
@@ -0,0 +1,51 @@
+"""
+Close listings whose application deadline has passed.
+
+    python manage.py close_expired_internships                  # batches of 1000
+    python manage.py close_expired_internships --batch-size 200
+
+Run from cron every few minutes. The public feed already hides expired
+listings by deadline; closing them moves them out of the partial
+`internship_active_feed_idx` so feed queries stop stepping over them.
+Each batch is one short transaction (UPDATE … WHERE id IN (…)), so the
+job never holds locks on the whole table.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from backend.caching import bump_version
+from internships.models import Internship, Recommendation
+
+
+class Command(BaseCommand):
+    help = "Mark internships past their application deadline as closed."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        batch_size = max(options["batch_size"], 1)
+        closed = 0
+        while True:
+            with transaction.atomic():
+                ids = list(
+                    Internship.objects.filter(
+                        is_closed=False, application_deadline__lte=now
+                    )
+                    .order_by("application_deadline")
+                    .values_list("pk", flat=True)[:batch_size]
+                )
+                if not ids:
+                    break
+                # Queryset update: no signals, so touch updated_at for ETags
+                # and cached fragments ourselves.
+                closed += Internship.objects.filter(pk__in=ids).update(
+                    is_closed=True, closed_at=now, updated_at=now
+                )
+                Recommendation.objects.filter(internship_id__in=ids).delete()
+        if closed:
+            bump_version("internships")
+        self.stdout.write(self.style.SUCCESS(f"Closed {closed} expired internships."))
@@ -0,0 +1,21 @@
+"""
+Write buffered listing view / impression counts to the database.
+
+    python manage.py flush_internship_counters
+
+Each web process already flushes on a timer (internships/counters.py); run
+this from cron as well so the shared Redis buffer drains even when traffic
+– and with it every timer – stops. Safe to run concurrently.
+"""
+
+from django.core.management.base import BaseCommand
+
+from internships.counters import flush
+
+
+class Command(BaseCommand):
+    help = "Flush buffered Internship view / impression counters to the DB."
+
+    def handle(self, *args, **options):
+        touched = flush()
+        self.stdout.write(self.style.SUCCESS(f"Flushed counters for {touched} rows."))
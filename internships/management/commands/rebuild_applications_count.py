@@ -0,0 +1,37 @@
+"""
+Recompute the denormalized ``Internship.applications_count`` column.
+
+    python manage.py rebuild_applications_count
+
+Runs a single correlated UPDATE, so it is safe to schedule periodically as
+a consistency check on top of the signal-maintained counter.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from internships.models import Application, Internship
+
+
+class Command(BaseCommand):
+    help = "Rebuild Internship.applications_count from the Application table."
+
+    def handle(self, *args, **options):
+        per_internship = (
+            Application.objects.filter(internship=OuterRef("pk"))
+            .order_by()
+            .values("internship")
+            .annotate(n=Count("pk"))
+            .values("n")
+        )
+        with transaction.atomic():
+            updated = Internship.objects.update(
+                applications_count=Coalesce(
+                    Subquery(per_internship, output_field=IntegerField()), 0
+                )
+            )
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt applications_count for {updated} rows.")
+        )
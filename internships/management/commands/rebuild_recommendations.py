@@ -0,0 +1,40 @@
+"""
+Recompute every intern's top-N recommendations.
+
+    python manage.py rebuild_recommendations [--workers 4] [--chunk-size 500]
+
+Profiles are split into chunks and scored in a process pool; each worker
+builds the listing index once and reuses it for all its chunks.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from internships.recommendations import init_worker, refresh_chunk
+from profiles.models import Profile
+
+
+class Command(BaseCommand):
+    help = "Recompute precomputed internship recommendations for all interns."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4)
+        parser.add_argument("--chunk-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        ids = list(Profile.objects.order_by("pk").values_list("pk", flat=True))
+        size = options["chunk_size"]
+        chunks = [ids[i : i + size] for i in range(0, len(ids), size)]
+        # Forked workers must not share the parent's DB connection.
+        connections.close_all()
+
+        done = 0
+        with ProcessPoolExecutor(
+            max_workers=options["workers"], initializer=init_worker
+        ) as pool:
+            for future in as_completed(pool.submit(refresh_chunk, c) for c in chunks):
+                done += future.result()
+                self.stdout.write(f"{done}/{len(ids)} profiles")
+        self.stdout.write(self.style.SUCCESS(f"Recommendations rebuilt for {done}."))
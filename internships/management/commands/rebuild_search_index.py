@@ -0,0 +1,23 @@
+"""
+Rebuild the internship full-text index.
+
+    python manage.py rebuild_search_index
+
+PostgreSQL: re-fires the tsvector trigger for every row.
+SQLite:     repopulates the FTS5 shadow table.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from internships.search import is_postgres, rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the internship full-text search index."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            rebuild_index()
+        backend = "tsvector/GIN" if is_postgres() else "FTS5"
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {backend} search index."))
@@ -0,0 +1,87 @@
+"""
+Recompute the employer dashboard rollups from the Application table.
+
+    python manage.py reconcile_application_stats             # last 30 days
+    python manage.py reconcile_application_stats --days 365
+
+Per-listing status totals are always rebuilt in full; daily counts only for
+the trailing ``--days`` window (older days no longer change). Everything is
+replaced in one transaction, so it is safe to run nightly from cron on top
+of the incrementally maintained rows (internships/rollups.py).
+
+On PostgreSQL both rollup tables are locked IN SHARE ROW EXCLUSIVE MODE
+before anything is counted. An application write whose rollup update was
+already under way commits first, so the counts include it. Any later one
+waits for the lock and then applies its delta on top of the rebuilt rows.
+Nothing is lost, and no row can appear between the delete and the insert.
+(SQLite serialises writers anyway.)
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from internships.models import Application, ApplicationDailyStats, ApplicationStats
+
+
+class Command(BaseCommand):
+    help = "Rebuild ApplicationStats / ApplicationDailyStats from Application rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="How many trailing days of daily counts to rebuild (default 30).",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cur:
+                    cur.execute(
+                        f"LOCK TABLE {ApplicationStats._meta.db_table}, "
+                        f"{ApplicationDailyStats._meta.db_table} "
+                        "IN SHARE ROW EXCLUSIVE MODE"
+                    )
+            totals = {}
+            by_status = (
+                Application.objects.order_by()
+                .values_list("internship_id", "status")
+                .annotate(n=Count("pk"))
+            )
+            for internship_id, status, n in by_status.iterator():
+                stats = totals.setdefault(
+                    internship_id, ApplicationStats(internship_id=internship_id)
+                )
+                setattr(stats, status, n)
+
+            since = timezone.localdate() - timedelta(days=max(options["days"], 1) - 1)
+            daily = [
+                ApplicationDailyStats(
+                    internship_id=internship_id, day=day, applications=n
+                )
+                for internship_id, day, n in Application.objects.filter(
+                    created_at__date__gte=since
+                )
+                .order_by()
+                .annotate(day=TruncDate("created_at"))
+                .values_list("internship_id", "day")
+                .annotate(n=Count("pk"))
+                .iterator()
+            ]
+
+            ApplicationStats.objects.all().delete()
+            ApplicationStats.objects.bulk_create(totals.values(), batch_size=1000)
+            ApplicationDailyStats.objects.filter(day__gte=since).delete()
+            ApplicationDailyStats.objects.bulk_create(daily, batch_size=1000)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Reconciled {len(totals)} listings and {len(daily)} daily rows "
+                f"since {since}."
+            )
+        )
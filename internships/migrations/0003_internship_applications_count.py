@@ -0,0 +1,38 @@
+# Generated by Django 5.2 on 2026-10-16 23:52
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_applications_count(apps, schema_editor):
+    Internship = apps.get_model("internships", "Internship")
+    Application = apps.get_model("internships", "Application")
+    per_internship = (
+        Application.objects.filter(internship=OuterRef("pk"))
+        .order_by()
+        .values("internship")
+        .annotate(n=Count("pk"))
+        .values("n")
+    )
+    Internship.objects.update(
+        applications_count=Coalesce(
+            Subquery(per_internship, output_field=IntegerField()), 0
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("internships", "0002_application"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="internship",
+            name="applications_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_applications_count, migrations.RunPython.noop),
+    ]
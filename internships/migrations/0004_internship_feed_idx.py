@@ -0,0 +1,24 @@
+# Generated by Django 5.2 on 2026-10-16 23:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employers", "0001_initial"),
+        ("internships", "0003_internship_applications_count"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="internship",
+            options={"ordering": ("-posted_at", "-id")},
+        ),
+        migrations.AddIndex(
+            model_name="internship",
+            index=models.Index(
+                fields=["-posted_at", "-id"], name="internship_feed_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 5.2 on 2026-10-16 23:55
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# ── PostgreSQL: weighted tsvector maintained by a trigger + GIN index ──
+PG_FORWARD = [
+    """
+    CREATE OR REPLACE FUNCTION internships_internship_search_update()
+    RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english', coalesce(NEW.title, '')), 'A')
+            || setweight(to_tsvector('english', coalesce(NEW.requirements, '')), 'B')
+            || setweight(to_tsvector('english', coalesce(NEW.description, '')), 'C');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql;
+    """,
+    """
+    CREATE TRIGGER internships_internship_search_trg
+    BEFORE INSERT OR UPDATE OF title, description, requirements
+    ON internships_internship
+    FOR EACH ROW EXECUTE FUNCTION internships_internship_search_update();
+    """,
+    "UPDATE internships_internship SET title = title;",
+    """
+    CREATE INDEX internship_search_gin
+    ON internships_internship USING GIN (search_vector);
+    """,
+]
+PG_BACKWARD = [
+    "DROP INDEX IF EXISTS internship_search_gin;",
+    "DROP TRIGGER IF EXISTS internships_internship_search_trg "
+    "ON internships_internship;",
+    "DROP FUNCTION IF EXISTS internships_internship_search_update();",
+]
+
+# ── SQLite: FTS5 shadow table (rowid = internship id), synced by signals ──
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS internships_internship_fts
+    USING fts5(title, description, requirements, tokenize = 'porter unicode61');
+    """,
+    """
+    INSERT INTO internships_internship_fts (rowid, title, description, requirements)
+    SELECT id, title, description, requirements FROM internships_internship;
+    """,
+]
+SQLITE_BACKWARD = ["DROP TABLE IF EXISTS internships_internship_fts;"]
+
+
+def _run(statements_by_vendor):
+    def run(apps, schema_editor):
+        for sql in statements_by_vendor.get(schema_editor.connection.vendor, ()):
+            schema_editor.execute(sql)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("internships", "0004_internship_feed_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="internship",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(
+            _run({"postgresql": PG_FORWARD, "sqlite": SQLITE_FORWARD}),
+            _run({"postgresql": PG_BACKWARD, "sqlite": SQLITE_BACKWARD}),
+        ),
+    ]
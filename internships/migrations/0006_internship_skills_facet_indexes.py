@@ -0,0 +1,41 @@
+# Generated by Django 5.2 on 2026-10-17 00:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employers", "0001_initial"),
+        ("internships", "0005_internship_search"),
+        ("profiles", "0003_agentmessage_agent_type"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="internship",
+            name="skills",
+            field=models.ManyToManyField(
+                blank=True, related_name="internships", to="profiles.skill"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="internship",
+            index=models.Index(
+                fields=["is_remote", "location", "-posted_at"],
+                name="internship_remote_loc_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="internship",
+            index=models.Index(
+                fields=["location", "-posted_at"], name="internship_location_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="internship",
+            index=models.Index(
+                fields=["employer", "-posted_at"], name="internship_employer_idx"
+            ),
+        ),
+    ]
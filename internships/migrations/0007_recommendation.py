@@ -0,0 +1,61 @@
+# Generated by Django 5.2 on 2026-10-17 00:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("internships", "0006_internship_skills_facet_indexes"),
+        ("profiles", "0003_agentmessage_agent_type"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Recommendation",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("score", models.FloatField()),
+                ("rank", models.PositiveSmallIntegerField()),
+                ("computed_at", models.DateTimeField(auto_now=True)),
+                (
+                    "internship",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="recommendations",
+                        to="internships.internship",
+                    ),
+                ),
+                (
+                    "profile",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="recommendations",
+                        to="profiles.profile",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("profile", "rank"),
+                "indexes": [
+                    models.Index(
+                        fields=["profile", "rank"], name="recommendation_rank_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("profile", "internship"), name="recommendation_unique"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-17 00:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("internships", "0007_recommendation"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["internship", "status", "-created_at", "-id"],
+                name="application_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["internship", "-created_at", "-id"],
+                name="application_recent_idx",
+            ),
+        ),
+    ]
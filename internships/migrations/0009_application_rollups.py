@@ -0,0 +1,64 @@
+# Generated by Django 5.2 on 2026-10-17 00:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("internships", "0008_application_list_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ApplicationStats",
+            fields=[
+                (
+                    "internship",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="application_stats",
+                        serialize=False,
+                        to="internships.internship",
+                    ),
+                ),
+                ("pending", models.PositiveIntegerField(default=0)),
+                ("accepted", models.PositiveIntegerField(default=0)),
+                ("rejected", models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ApplicationDailyStats",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("applications", models.PositiveIntegerField(default=0)),
+                (
+                    "internship",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_application_stats",
+                        to="internships.internship",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("internship", "day"),
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("internship", "day"), name="application_daily_unique"
+                    )
+                ],
+            },
+        ),
+    ]
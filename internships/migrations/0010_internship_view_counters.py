@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-17 00:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("internships", "0009_application_rollups"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="internship",
+            name="impressions_count",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="internship",
+            name="views_count",
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+    ]
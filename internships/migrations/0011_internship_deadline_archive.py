@@ -0,0 +1,141 @@
+# Generated by Django 5.2 on 2026-10-17 00:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employers", "0003_employer_logo_thumbnails"),
+        ("internships", "0010_internship_view_counters"),
+        ("profiles", "0003_agentmessage_agent_type"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedApplication",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("accepted", "Accepted"),
+                            ("rejected", "Rejected"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("created_at", models.DateTimeField()),
+            ],
+            options={
+                "ordering": ("-created_at",),
+            },
+        ),
+        migrations.CreateModel(
+            name="ArchivedInternship",
+            fields=[
+                ("id", models.BigIntegerField(primary_key=True, serialize=False)),
+                ("title", models.CharField(max_length=200)),
+                ("description", models.TextField()),
+                ("location", models.CharField(blank=True, max_length=100)),
+                ("is_remote", models.BooleanField(default=False)),
+                ("requirements", models.TextField(blank=True)),
+                ("skills", models.JSONField(blank=True, default=list)),
+                ("posted_at", models.DateTimeField()),
+                ("application_deadline", models.DateTimeField(blank=True, null=True)),
+                ("closed_at", models.DateTimeField(blank=True, null=True)),
+                ("applications_count", models.PositiveIntegerField(default=0)),
+                ("views_count", models.PositiveBigIntegerField(default=0)),
+                ("impressions_count", models.PositiveBigIntegerField(default=0)),
+                ("archived_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ("-posted_at", "-id"),
+            },
+        ),
+        migrations.AddField(
+            model_name="internship",
+            name="application_deadline",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="internship",
+            name="closed_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="internship",
+            name="is_closed",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name="internship",
+            index=models.Index(
+                condition=models.Q(("is_closed", False)),
+                fields=["-posted_at", "-id"],
+                name="internship_active_feed_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="internship",
+            index=models.Index(
+                condition=models.Q(
+                    ("application_deadline__isnull", False), ("is_closed", False)
+                ),
+                fields=["application_deadline"],
+                name="internship_deadline_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="internship",
+            index=models.Index(
+                condition=models.Q(("is_closed", True)),
+                fields=["closed_at"],
+                name="internship_closed_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="archivedapplication",
+            name="intern",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="archived_applications",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name="archivedinternship",
+            name="employer",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="archived_internships",
+                to="employers.employer",
+            ),
+        ),
+        migrations.AddField(
+            model_name="archivedapplication",
+            name="internship",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="applications",
+                to="internships.archivedinternship",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="archivedinternship",
+            index=models.Index(
+                fields=["employer", "-posted_at"], name="archived_internship_emp_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="archivedapplication",
+            index=models.Index(
+                fields=["intern", "-created_at"], name="archived_application_idx"
+            ),
+        ),
+    ]
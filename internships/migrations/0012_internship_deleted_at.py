@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-17 00:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("internships", "0011_internship_deadline_archive"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="internship",
+            name="deleted_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
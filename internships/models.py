@@ -1,5 +1,61 @@
 from django.conf import settings
-from django.db import models
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
+from django.db.models import Count, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+
+def accepting_applications() -> Q:
+    """
+    Listings still taking applications: not closed and not past their
+    deadline. `manage.py close_expired_internships` flips the latter to
+    closed, so filters on this mostly read `internship_active_feed_idx`.
+    """
+    return Q(is_closed=False) & (
+        Q(application_deadline__isnull=True)
+        | Q(application_deadline__gt=timezone.now())
+    )
+
+
+class InternshipQuerySet(models.QuerySet):
+    def active(self):
+        return self.filter(accepting_applications())
+
+    def with_applications_count(self):
+        """
+        Attach the number of applications to every row in the same query.
+
+        A correlated subquery (rather than JOIN + GROUP BY) is only evaluated
+        for the rows a page actually returns and keeps the outer query free
+        of GROUP BY. With ``INTERNSHIPS_DENORMALIZED_COUNTS`` on, the
+        maintained ``applications_count`` column is read as-is instead.
+        """
+        if settings.INTERNSHIPS_DENORMALIZED_COUNTS:
+            return self
+        per_internship = (
+            Application.objects.filter(internship=OuterRef("pk"))
+            .order_by()
+            .values("internship")
+            .annotate(n=Count("pk"))
+            .values("n")
+        )
+        return self.annotate(
+            n_applications=Coalesce(
+                Subquery(per_internship, output_field=IntegerField()), 0
+            )
+        )
+
+
+class InternshipManager(models.Manager.from_queryset(InternshipQuerySet)):
+    """
+    Hides listings whose deletion is in progress (``deleted_at`` set; see
+    accounts/deletion.py). Cascades and the deletion job itself go through
+    ``_base_manager``, which still sees them.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
 
 
 class Internship(models.Model):
@@ -13,11 +69,93 @@ class Internship(models.Model):
     location = models.CharField(max_length=100, blank=True)
     is_remote = models.BooleanField(default=False)
     requirements = models.TextField(blank=True)
+    skills = models.ManyToManyField(
+        "profiles.Skill", related_name="internships", blank=True
+    )
     posted_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    application_deadline = models.DateTimeField(null=True, blank=True)
+    is_closed = models.BooleanField(default=False)
+    # Set when the listing closes; `archive_closed_internships` moves
+    # listings closed long enough ago into ArchivedInternship.
+    closed_at = models.DateTimeField(null=True, blank=True, editable=False)
+    # Soft delete: set when a DeletionJob is scheduled, row removed by it
+    deleted_at = models.DateTimeField(null=True, blank=True, editable=False)
+    # Denormalized; maintained by internships.signals, rebuilt by
+    # `manage.py rebuild_applications_count`.
+    applications_count = models.PositiveIntegerField(default=0, editable=False)
+    # Buffered in the cache and flushed in batches by internships/counters.py
+    views_count = models.PositiveBigIntegerField(default=0, editable=False)
+    impressions_count = models.PositiveBigIntegerField(default=0, editable=False)
+    # PostgreSQL only: weighted tsvector kept current by a DB trigger (see
+    # internships/search.py). Stays NULL on SQLite, which uses FTS5 instead.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = InternshipManager()
 
     class Meta:
-        ordering = ("-posted_at",)
+        ordering = ("-posted_at", "-id")
+        indexes = [
+            # Keyset pagination of the public feed: (posted_at, id) DESC
+            models.Index(fields=["-posted_at", "-id"], name="internship_feed_idx"),
+            # …the same over open listings only, which is what the public
+            # feed reads; closed rows never enter it
+            models.Index(
+                fields=["-posted_at", "-id"],
+                condition=Q(is_closed=False),
+                name="internship_active_feed_idx",
+            ),
+            # close_expired_internships: open listings by deadline
+            models.Index(
+                fields=["application_deadline"],
+                condition=Q(is_closed=False, application_deadline__isnull=False),
+                name="internship_deadline_idx",
+            ),
+            # archive_closed_internships: closed listings by age
+            models.Index(
+                fields=["closed_at"],
+                condition=Q(is_closed=True),
+                name="internship_closed_idx",
+            ),
+            # Facet filters (see internships/filters.py), each still served
+            # in feed order so cursor pagination stays an index range scan
+            models.Index(
+                fields=["is_remote", "location", "-posted_at"],
+                name="internship_remote_loc_idx",
+            ),
+            models.Index(
+                fields=["location", "-posted_at"], name="internship_location_idx"
+            ),
+            models.Index(
+                fields=["employer", "-posted_at"], name="internship_employer_idx"
+            ),
+        ]
+
+    @classmethod
+    def hide_for_deletion_many(cls, queryset) -> int:
+        """Soft-delete: closed, out of every listing query, still in the table."""
+        from backend.caching import bump_version
+
+        now = timezone.now()
+        hidden = queryset.update(
+            deleted_at=now,
+            is_closed=True,
+            closed_at=Coalesce("closed_at", Value(now)),
+            updated_at=now,
+        )
+        if hidden:
+            bump_version("internships")
+        return hidden
+
+    def hide_for_deletion(self) -> None:
+        type(self).hide_for_deletion_many(type(self).objects.filter(pk=self.pk))
+
+    def save(self, *args, **kwargs):
+        if not self.is_closed:
+            self.closed_at = None
+        elif self.closed_at is None:
+            self.closed_at = timezone.now()
+        super().save(*args, **kwargs)
 
     def __str__(self) -> str:  # pragma: no cover
         return (
@@ -54,6 +192,176 @@ class Application(models.Model):
     class Meta:
         unique_together = (("internship", "intern"),)
         ordering = ("-created_at",)
+        indexes = [
+            # Employer applicant list: ?status= tab, keyset on (created_at, id)
+            models.Index(
+                fields=["internship", "status", "-created_at", "-id"],
+                name="application_status_idx",
+            ),
+            # …and the "all statuses" tab
+            models.Index(
+                fields=["internship", "-created_at", "-id"],
+                name="application_recent_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        # The post_save handler adjusts Internship.applications_count; run
+        # both writes in one transaction so the counter can't drift.
+        with transaction.atomic(using=kwargs.get("using")):
+            super().save(*args, **kwargs)
 
     def __str__(self) -> str:
         return f"Application of {self.intern.email} to {self.internship.title}"
+
+
+class Recommendation(models.Model):
+    """
+    One row of an intern's precomputed top-N listings (see
+    internships/recommendations.py); ``rank`` 1 is the best match.
+    """
+
+    profile = models.ForeignKey(
+        "profiles.Profile",
+        on_delete=models.CASCADE,
+        related_name="recommendations",
+    )
+    internship = models.ForeignKey(
+        Internship,
+        on_delete=models.CASCADE,
+        related_name="recommendations",
+    )
+    score = models.FloatField()
+    rank = models.PositiveSmallIntegerField()
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("profile", "rank")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["profile", "internship"], name="recommendation_unique"
+            ),
+        ]
+        indexes = [
+            # The dashboard read: WHERE profile = ? ORDER BY rank LIMIT n
+            models.Index(fields=["profile", "rank"], name="recommendation_rank_idx"),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"#{self.rank} {self.internship_id} for profile {self.profile_id}"
+
+
+# ───────────────────────── employer dashboard rollups ─────────────────────────
+# Maintained incrementally by internships/rollups.py and reconciled nightly by
+# `manage.py reconcile_application_stats`; never written by request code
+# directly.
+class ApplicationStats(models.Model):
+    """Application totals by status for one listing."""
+
+    internship = models.OneToOneField(
+        Internship,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="application_stats",
+    )
+    pending = models.PositiveIntegerField(default=0)
+    accepted = models.PositiveIntegerField(default=0)
+    rejected = models.PositiveIntegerField(default=0)
+
+    def __str__(self) -> str:  # pragma: no cover
+        return (
+            f"{self.internship_id}: {self.pending} pending, "
+            f"{self.accepted} accepted, {self.rejected} rejected"
+        )
+
+
+class ApplicationDailyStats(models.Model):
+    """Applications received by one listing on one (server-local) day."""
+
+    internship = models.ForeignKey(
+        Internship,
+        on_delete=models.CASCADE,
+        related_name="daily_application_stats",
+    )
+    day = models.DateField()
+    applications = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ("internship", "day")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["internship", "day"], name="application_daily_unique"
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.internship_id} on {self.day}: {self.applications}"
+
+
+# ───────────────────────── archive ─────────────────────────
+# Cold storage for listings closed longer than the retention window (see
+# `manage.py archive_closed_internships`); keeps the hot table – and every
+# index on it – sized to listings people can still act on.
+class ArchivedInternship(models.Model):
+    """A closed listing moved out of `Internship`; ``id`` is preserved."""
+
+    id = models.BigIntegerField(primary_key=True)
+    employer = models.ForeignKey(
+        "employers.Employer",
+        on_delete=models.CASCADE,
+        related_name="archived_internships",
+    )
+    title = models.CharField(max_length=200)
+    description = models.TextField()
+    location = models.CharField(max_length=100, blank=True)
+    is_remote = models.BooleanField(default=False)
+    requirements = models.TextField(blank=True)
+    skills = models.JSONField(default=list, blank=True)  # names at archive time
+    posted_at = models.DateTimeField()
+    application_deadline = models.DateTimeField(null=True, blank=True)
+    closed_at = models.DateTimeField(null=True, blank=True)
+    applications_count = models.PositiveIntegerField(default=0)
+    views_count = models.PositiveBigIntegerField(default=0)
+    impressions_count = models.PositiveBigIntegerField(default=0)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("-posted_at", "-id")
+        indexes = [
+            models.Index(
+                fields=["employer", "-posted_at"],
+                name="archived_internship_emp_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"{self.title} (archived)"
+
+
+class ArchivedApplication(models.Model):
+    """An application to an archived listing, kept for the intern's history."""
+
+    id = models.BigIntegerField(primary_key=True)
+    internship = models.ForeignKey(
+        ArchivedInternship,
+        on_delete=models.CASCADE,
+        related_name="applications",
+    )
+    intern = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="archived_applications",
+    )
+    status = models.CharField(max_length=20, choices=Application.Status.choices)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ("-created_at",)
+        indexes = [
+            models.Index(
+                fields=["intern", "-created_at"], name="archived_application_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return f"Archived application {self.pk}"
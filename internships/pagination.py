@@ -0,0 +1,17 @@
+from backend.pagination import KeysetPagination, OffsetPagination
+
+
+class InternshipFeedPagination(KeysetPagination):
+    """Default feed pagination; backed by the `internship_feed_idx` index."""
+
+    ordering = ("-posted_at", "-id")
+
+
+class InternshipPagePagination(OffsetPagination):
+    """`?page=N` opt-in for table-style UIs that need totals / page jumps."""
+
+
+class ApplicantPagination(KeysetPagination):
+    """Applicants per listing, newest first; backed by `application_*_idx`."""
+
+    ordering = ("-created_at", "-id")
@@ -0,0 +1,155 @@
+# internships/recommendations.py
+"""
+Precomputed top-N recommendations per intern (the `Recommendation` table).
+
+• `refresh_for_profile(id)` – rescore one intern against every listing
+  (internships.matching) and replace their rows.
+• `refresh_for_internship(id)` – after a listing is created or edited,
+  rescore just that listing for the interns it can affect (shared skill, or
+  already recommended) and merge it into their stored top N – no full
+  rescoring.
+• Both are scheduled from internships.signals through a debounce, so a burst
+  of edits (a profile form save touches profile, availability and skills)
+  costs one refresh.
+• `python manage.py rebuild_recommendations` recomputes everyone across a
+  process pool; run it after deploys that change scoring and periodically
+  to pick up what the incremental path approximates.
+
+The dashboard read is `WHERE profile_id = ? ORDER BY rank LIMIT n` on
+recommendation_rank_idx. Every store also leaves a "computed" marker in the
+cache (`is_computed`), so an intern nothing matches isn't rescored on each
+visit just because they have no rows.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple
+
+from django.core.cache import cache
+from django.db import transaction
+
+from backend.background import debounce
+
+from .matching import ListingIndex, MatchQuery, get_index, recommend, score
+
+TOP_N = 100
+DEBOUNCE_SECONDS = 5
+COMPUTED_TTL = 7 * 24 * 3600  # an expired marker costs one inline rescore
+
+
+def _computed_key(profile_id: int) -> str:
+    return f"recommend:computed:{profile_id}"
+
+
+def is_computed(profile_id: int) -> bool:
+    """Whether this intern's rows (possibly none) have been stored."""
+    return cache.get(_computed_key(profile_id)) is not None
+
+
+def _replace(rows_by_profile: Dict[int, List[Tuple[int, float]]]) -> None:
+    """Store ranked (internship id, score) lists, replacing existing rows."""
+    from .models import Recommendation
+
+    fresh = [
+        Recommendation(profile_id=profile_id, internship_id=pk, score=s, rank=rank)
+        for profile_id, ranked in rows_by_profile.items()
+        for rank, (pk, s) in enumerate(ranked, start=1)
+    ]
+    with transaction.atomic():
+        Recommendation.objects.filter(profile_id__in=rows_by_profile).delete()
+        Recommendation.objects.bulk_create(fresh, batch_size=1000)
+    cache.set_many(
+        {_computed_key(profile_id): True for profile_id in rows_by_profile},
+        COMPUTED_TTL,
+    )
+
+
+def refresh_for_profile(profile_id: int) -> None:
+    from profiles.models import Profile
+
+    profile = (
+        Profile.objects.select_related("availability").filter(pk=profile_id).first()
+    )
+    if profile is not None:
+        _replace({profile_id: recommend(profile, TOP_N)})
+
+
+def refresh_for_internship(internship_id: int) -> None:
+    from profiles.models import Profile
+
+    from .models import Internship, Recommendation
+
+    listing = ListingIndex.build([internship_id], reference=get_index())
+    skill_ids = Internship.skills.through.objects.filter(
+        internship_id=internship_id
+    ).values("skill_id")
+    affected = Profile.objects.filter(
+        pk__in=Profile.skills.through.objects.filter(skill_id__in=skill_ids).values(
+            "profile_id"
+        )
+    ) | Profile.objects.filter(recommendations__internship_id=internship_id)
+
+    current: Dict[int, List[Tuple[int, float]]] = {}
+    profiles = affected.distinct().select_related("availability")
+    for profile in profiles.prefetch_related("skills"):
+        new_score = 0.0  # listing deleted meanwhile: drop it everywhere
+        if listing.size:
+            new_score = float(score(listing, MatchQuery.from_profile(profile))[0])
+        current[profile.pk] = [(internship_id, new_score)]
+    if not current:
+        return
+
+    stored = Recommendation.objects.filter(profile_id__in=current).values_list(
+        "profile_id", "internship_id", "score"
+    )
+    for profile_id, pk, s in stored:
+        if pk != internship_id:
+            current[profile_id].append((pk, s))
+    _replace(
+        {
+            profile_id: sorted(
+                (row for row in ranked if row[1] > 0),
+                key=lambda row: (-row[1], -row[0]),
+            )[:TOP_N]
+            for profile_id, ranked in current.items()
+        }
+    )
+
+
+def schedule_profile_refresh(profile_id: int) -> None:
+    debounce(
+        f"recommend:profile:{profile_id}",
+        DEBOUNCE_SECONDS,
+        refresh_for_profile,
+        profile_id,
+    )
+
+
+def schedule_internship_refresh(internship_id: int) -> None:
+    debounce(
+        f"recommend:internship:{internship_id}",
+        DEBOUNCE_SECONDS,
+        refresh_for_internship,
+        internship_id,
+    )
+
+
+# ───────────────────────── bulk rebuild (process pool) ─────────────────────────
+def init_worker() -> None:
+    import django
+
+    django.setup()
+
+
+def refresh_chunk(profile_ids: Iterable[int]) -> int:
+    """Pool task: rescore a chunk of interns (one index build per worker)."""
+    from profiles.models import Profile
+
+    profiles = (
+        Profile.objects.filter(pk__in=list(profile_ids))
+        .select_related("availability")
+        .prefetch_related("skills")
+    )
+    rows = {profile.pk: recommend(profile, TOP_N) for profile in profiles}
+    _replace(rows)
+    return len(rows)
@@ -0,0 +1,122 @@
+# internships/rollups.py
+"""
+Incremental maintenance of the employer dashboard rollups
+(`ApplicationStats`, `ApplicationDailyStats`).
+
+Every write path that creates, re-statuses or deletes applications reports
+what happened here, in the same transaction:
+
+• Model.save() / delete() and the raw-SQL `apply()` – via internships.signals
+• `apply_many()` (bulk_create) and the bulk status endpoint (queryset
+  UPDATE), which bypass signals, call these functions themselves.
+
+Each call costs a constant number of queries however many applications it
+covers: rows are made to exist with INSERT … ON CONFLICT DO NOTHING, then a
+single UPDATE applies every delta through CASE WHEN. Deletes only
+decrement – they never insert, so a listing being cascade-deleted can't
+get its rollup row resurrected.
+
+Drift (writes that went around all of the above, crashes between commit
+and rollup, …) is repaired by `manage.py reconcile_application_stats`.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date, datetime
+from typing import Iterable, Tuple
+
+from django.db.models import Case, F, IntegerField, Q, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .models import Application, ApplicationDailyStats, ApplicationStats
+
+STATUS_FIELDS = tuple(Application.Status.values)
+
+
+def bucket(created_at: datetime) -> date:
+    """The dashboard day an application counts towards."""
+    return timezone.localdate(created_at)
+
+
+def _bump(expr, delta: int):
+    expr = F(expr) + delta
+    return Greatest(expr, 0) if delta < 0 else expr
+
+
+def _apply(status_deltas: Counter, day_deltas: Counter, *, create: bool = True) -> None:
+    status_deltas = {key: delta for key, delta in status_deltas.items() if delta}
+    day_deltas = {key: delta for key, delta in day_deltas.items() if delta}
+
+    if status_deltas:
+        internship_ids = {pk for pk, _ in status_deltas}
+        if create:
+            ApplicationStats.objects.bulk_create(
+                [ApplicationStats(internship_id=pk) for pk in internship_ids],
+                ignore_conflicts=True,
+            )
+        updates = {}
+        for field in STATUS_FIELDS:
+            whens = [
+                When(internship_id=pk, then=_bump(field, delta))
+                for (pk, status), delta in status_deltas.items()
+                if status == field
+            ]
+            if whens:
+                updates[field] = Case(
+                    *whens, default=F(field), output_field=IntegerField()
+                )
+        ApplicationStats.objects.filter(internship_id__in=internship_ids).update(
+            **updates
+        )
+
+    if day_deltas:
+        if create:
+            ApplicationDailyStats.objects.bulk_create(
+                [
+                    ApplicationDailyStats(internship_id=pk, day=day)
+                    for pk, day in day_deltas
+                ],
+                ignore_conflicts=True,
+            )
+        match = Q()
+        whens = []
+        for (pk, day), delta in day_deltas.items():
+            match |= Q(internship_id=pk, day=day)
+            whens.append(
+                When(internship_id=pk, day=day, then=_bump("applications", delta))
+            )
+        ApplicationDailyStats.objects.filter(match).update(
+            applications=Case(
+                *whens, default=F("applications"), output_field=IntegerField()
+            )
+        )
+
+
+def applications_created(rows: Iterable[Tuple[int, str, datetime]]) -> None:
+    """Count new applications given as (internship id, status, created_at)."""
+    statuses, days = Counter(), Counter()
+    for internship_id, status, created_at in rows:
+        statuses[internship_id, status] += 1
+        days[internship_id, bucket(created_at)] += 1
+    _apply(statuses, days)
+
+
+def applications_deleted(rows: Iterable[Tuple[int, str, datetime]]) -> None:
+    """Un-count deleted applications given as (internship id, status, created_at)."""
+    statuses, days = Counter(), Counter()
+    for internship_id, status, created_at in rows:
+        statuses[internship_id, status] -= 1
+        days[internship_id, bucket(created_at)] -= 1
+    _apply(statuses, days, create=False)
+
+
+def status_changed(rows: Iterable[Tuple[int, str, str]]) -> None:
+    """Move applications between statuses: (internship id, old, new)."""
+    statuses = Counter()
+    for internship_id, old, new in rows:
+        if old != new:
+            statuses[internship_id, old] -= 1
+            statuses[internship_id, new] += 1
+    _apply(statuses, Counter())
@@ -0,0 +1,176 @@
+# internships/search.py
+"""
+Full-text search over internship listings (title / requirements / description).
+
+Two backends, picked from the active database vendor:
+
+• PostgreSQL – a trigger-maintained, weighted `search_vector` tsvector column
+  (title A, requirements B, description C) behind a GIN index.
+  Ranking: ts_rank;  snippets: ts_headline (page rows only).
+• SQLite     – an FTS5 shadow table `internships_internship_fts`
+  (rowid = internship id) kept in sync by internships.signals.
+  Ranking: bm25;  snippets: snippet().
+
+Both are created by migration 0005 and rebuilt with
+`python manage.py rebuild_search_index`.
+"""
+
+from __future__ import annotations
+
+import re
+
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import F, FloatField, QuerySet
+from django.db.models.expressions import RawSQL
+
+FTS_TABLE = "internships_internship_fts"
+SEARCH_CONFIG = "english"
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+
+# Columns that feed the index; saves touching none of them skip re-indexing.
+INDEXED_FIELDS = ("title", "description", "requirements")
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def is_postgres() -> bool:
+    return connection.vendor == "postgresql"
+
+
+# ───────────────────────── query ─────────────────────────
+def _fts5_query(text: str) -> str:
+    """
+    Turn free text into a safe FTS5 expression: every word is quoted so user
+    input can't inject FTS operators; terms are AND-ed (like websearch).
+    """
+    return " ".join(f'"{tok}"' for tok in _TOKEN_RE.findall(text))
+
+
+def search_internships(qs: QuerySet, text: str) -> QuerySet:
+    """
+    Restrict ``qs`` to listings matching ``text``, best matches first, and
+    annotate ``search_rank`` (higher = better).
+
+    Snippets are deliberately *not* computed here: highlighting is the
+    expensive part, so call :func:`attach_snippets` on the page only.
+    """
+    if is_postgres():
+        query = SearchQuery(text, config=SEARCH_CONFIG, search_type="websearch")
+        return (
+            qs.filter(search_vector=query)
+            .annotate(search_rank=SearchRank(F("search_vector"), query))
+            .order_by("-search_rank", "-posted_at", "-id")
+        )
+
+    # bm25() weights follow the FTS column order: title, description,
+    # requirements. bm25 is "lower is better", so negate it.
+    rank = RawSQL(
+        f"SELECT -bm25({FTS_TABLE}, 10.0, 1.0, 4.0) FROM {FTS_TABLE} "
+        f"WHERE {FTS_TABLE} MATCH %s AND rowid = internships_internship.id",
+        [_fts5_query(text)],
+        output_field=FloatField(),
+    )
+    return (
+        filter_matches(qs, text)
+        .annotate(search_rank=rank)
+        .order_by("-search_rank", "-posted_at", "-id")
+    )
+
+
+def filter_matches(qs: QuerySet, text: str) -> QuerySet:
+    """Restrict ``qs`` to matching listings without ranking (facet counts)."""
+    if is_postgres():
+        query = SearchQuery(text, config=SEARCH_CONFIG, search_type="websearch")
+        return qs.filter(search_vector=query)
+    match = _fts5_query(text)
+    if not match:
+        return qs.none()
+    return qs.filter(
+        id__in=RawSQL(
+            f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [match]
+        )
+    )
+
+
+def attach_snippets(rows, text: str) -> None:
+    """
+    Set ``search_snippet`` on each listing in ``rows`` (one query for the
+    whole page): a description excerpt with matches wrapped in <mark>…</mark>.
+    """
+    ids = [row.pk for row in rows]
+    if not ids:
+        return
+    if is_postgres():
+        from .models import Internship
+
+        query = SearchQuery(text, config=SEARCH_CONFIG, search_type="websearch")
+        snippets = dict(
+            Internship.objects.filter(pk__in=ids)
+            .annotate(
+                snippet=SearchHeadline(
+                    "description",
+                    query,
+                    config=SEARCH_CONFIG,
+                    start_sel=HIGHLIGHT_START,
+                    stop_sel=HIGHLIGHT_STOP,
+                    max_words=35,
+                    min_words=15,
+                    max_fragments=2,
+                )
+            )
+            .values_list("pk", "snippet")
+        )
+    else:
+        placeholders = ", ".join(["%s"] * len(ids))
+        with connection.cursor() as cur:
+            cur.execute(
+                f"SELECT rowid, snippet({FTS_TABLE}, 1, %s, %s, '…', 24) "
+                f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s "
+                f"AND rowid IN ({placeholders})",
+                [HIGHLIGHT_START, HIGHLIGHT_STOP, _fts5_query(text), *ids],
+            )
+            snippets = dict(cur.fetchall())
+    for row in rows:
+        row.search_snippet = snippets.get(row.pk, "")
+
+
+# ───────────────────────── index maintenance ─────────────────────────
+def index_internship(internship) -> None:
+    """Upsert one listing into the SQLite FTS table (Postgres uses a trigger)."""
+    if is_postgres():
+        return
+    with connection.cursor() as cur:
+        cur.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [internship.pk])
+        cur.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, description, requirements) "
+            "VALUES (%s, %s, %s, %s)",
+            [
+                internship.pk,
+                internship.title,
+                internship.description,
+                internship.requirements,
+            ],
+        )
+
+
+def unindex_internship(pk: int) -> None:
+    if is_postgres():
+        return
+    with connection.cursor() as cur:
+        cur.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [pk])
+
+
+def rebuild_index() -> None:
+    """Recompute the whole index from the internships table."""
+    with connection.cursor() as cur:
+        if is_postgres():
+            # Touching an indexed column fires the maintenance trigger.
+            cur.execute("UPDATE internships_internship SET title = title")
+            return
+        cur.execute(f"DELETE FROM {FTS_TABLE}")
+        cur.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, description, requirements) "
+            "SELECT id, title, description, requirements FROM internships_internship"
+        )
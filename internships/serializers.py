@@ -1,12 +1,28 @@
+from django.utils import timezone
 from rest_framework import serializers
 
-from .models import Internship
+from employers.thumbnails import thumbnail_urls
+from profiles.models import Skill
+
+from .fragments import InternshipListSerializer
+from .models import Application, Internship
+
+
+class SkillNamesField(serializers.ListField):
+    """Skill tags as a flat list of names, e.g. ["Python", "Figma"]."""
+
+    child = serializers.CharField(max_length=128)
+
+    def to_representation(self, value):
+        # Reads the prefetch cache when the view prefetched "skills"
+        return [skill.name for skill in value.all()]
 
 
 class InternshipSerializer(serializers.ModelSerializer):
     employer_name = serializers.ReadOnlyField(source="employer.company_name")
     employer_logo = serializers.SerializerMethodField()
-    applications_count = serializers.SerializerMethodField()  # New field
+    applications_count = serializers.SerializerMethodField()
+    skills = SkillNamesField(required=False)
 
     class Meta:
         model = Internship
@@ -17,32 +33,95 @@ class InternshipSerializer(serializers.ModelSerializer):
             "location",
             "is_remote",
             "requirements",
+            "skills",
             "posted_at",
             "updated_at",
+            "application_deadline",
+            "is_closed",
+            "closed_at",
             "employer_name",
             "employer_logo",
             "applications_count",
+            "views_count",
+            "impressions_count",
         )
         read_only_fields = (
             "id",
             "posted_at",
             "updated_at",
+            "closed_at",
             "employer_name",
             "employer_logo",
             "applications_count",
+            "views_count",
+            "impressions_count",
         )
+        # Lists reuse cached per-row fragments (see internships.fragments)
+        list_serializer_class = InternshipListSerializer
 
     def get_employer_logo(self, obj):
-        # Return full URL for logo if present
-        request = self.context.get("request")
-        if obj.employer.logo:
-            url = obj.employer.logo.url
-            return request.build_absolute_uri(url) if request is not None else url
-        return None
+        # srcset-style {"64": url, "128": url, "256": url}; never the original
+        # upload. None until the background thumbnail job has run.
+        return thumbnail_urls(obj.employer, self.context.get("request"))
 
     def get_applications_count(self, obj):
-        # Count related applications for this internship
-        return obj.applications.count()
+        # Filled in by InternshipQuerySet.with_applications_count(); fall back
+        # to the denormalized column (never a per-row COUNT query).
+        return getattr(obj, "n_applications", obj.applications_count)
+
+    def static_representation(self, instance) -> dict:
+        """Everything that only changes when the row or its employer does."""
+        return super().to_representation(instance)
+
+    def dynamic_representation(self, instance) -> dict:
+        """Per-request values laid over the (cacheable) static part."""
+        data = {
+            "applications_count": self.get_applications_count(instance),
+            # Move on every counter flush without touching updated_at
+            "views_count": instance.views_count,
+            "impressions_count": instance.impressions_count,
+        }
+        # Present only on ?q= search results (see internships.search)
+        if hasattr(instance, "search_rank"):
+            data["search_rank"] = instance.search_rank
+            data["search_snippet"] = getattr(instance, "search_snippet", "")
+        # Present only on /recommended/ (see internships.matching)
+        if hasattr(instance, "match_score"):
+            data["match_score"] = round(instance.match_score, 4)
+        return data
+
+    def to_representation(self, instance):
+        data = self.static_representation(instance)
+        data.update(self.dynamic_representation(instance))
+        return data
+
+    # -------- skills (created on first use, like profile skills) --------
+    def _set_skills(self, internship: Internship, names: list[str]):
+        names = [name.strip() for name in names if name.strip()]
+        skills = [Skill.objects.get_or_create(name=name)[0] for name in names]
+        internship.skills.set(skills)
+
+    def create(self, validated_data):
+        skills = validated_data.pop("skills", None)
+        internship = super().create(validated_data)
+        if skills is not None:
+            self._set_skills(internship, skills)
+        return internship
+
+    def update(self, instance, validated_data):
+        skills = validated_data.pop("skills", None)
+        internship = super().update(instance, validated_data)
+        if skills is not None:
+            self._set_skills(internship, skills)
+        return internship
+
+    def validate_application_deadline(self, value):
+        unchanged = self.instance is not None and (
+            value == self.instance.application_deadline
+        )
+        if value is not None and not unchanged and value <= timezone.now():
+            raise serializers.ValidationError("The deadline must be in the future.")
+        return value
 
     def validate(self, attrs):
         # Require location if not remote
@@ -51,3 +130,12 @@ class InternshipSerializer(serializers.ModelSerializer):
                 {"location": "Location is required for non-remote internships."}
             )
         return attrs
+
+
+class MyApplicationSerializer(serializers.ModelSerializer):
+    """An intern's own view of one of their applications."""
+
+    class Meta:
+        model = Application
+        fields = ("id", "internship", "status", "created_at")
+        read_only_fields = fields
@@ -0,0 +1,137 @@
+"""
+Signal handlers for the internships app (connected in InternshipsConfig.ready).
+
+• Keeps the denormalized ``Internship.applications_count`` and the employer
+  dashboard rollups (internships/rollups.py) in step with Application
+  inserts, status changes, deletes and moves between internships.
+• Mirrors listing text into the SQLite FTS5 table (no-op on PostgreSQL,
+  where a trigger maintains ``search_vector``).
+• Bumps the "internships" cache namespace (backend/caching.py) whenever a
+  listing or its skill tags change, and touches ``updated_at`` on skill
+  re-tagging so ETags (backend/conditional.py) move too.
+• Schedules (debounced) refreshes of the precomputed recommendations when a
+  listing or an intern's matching inputs change.
+"""
+
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from backend.caching import bump_version
+from profiles.models import Availability, Profile
+
+from . import rollups
+from .models import Application, Internship
+from .recommendations import schedule_internship_refresh, schedule_profile_refresh
+from .search import INDEXED_FIELDS, index_internship, unindex_internship
+
+
+def bump_applications_count(internship_id: int, delta: int) -> None:
+    """Atomically add ``delta`` to one internship's applications_count."""
+    expr = F("applications_count") + delta
+    if delta < 0:
+        expr = Greatest(expr, 0)
+    Internship.objects.filter(pk=internship_id).update(applications_count=expr)
+
+
+@receiver(post_init, sender=Application)
+def _remember_internship(sender, instance: Application, **kwargs):
+    # Read from __dict__ so a deferred field never triggers a query here.
+    instance._loaded_internship_id = instance.__dict__.get("internship_id")
+    instance._loaded_status = instance.__dict__.get("status")
+
+
+@receiver(post_save, sender=Application)
+def _count_on_save(sender, instance: Application, created: bool, raw: bool, **kw):
+    """applications_count and the rollups, from one read of the loaded state."""
+    if raw:  # loaddata – counts and rollups are rebuilt separately
+        return
+    row = (instance.internship_id, instance.status, instance.created_at)
+    previous = instance._loaded_internship_id
+    if created:
+        bump_applications_count(instance.internship_id, 1)
+        rollups.applications_created([row])
+    elif previous is not None and previous != instance.internship_id:
+        bump_applications_count(previous, -1)
+        bump_applications_count(instance.internship_id, 1)
+        old_status = instance._loaded_status or instance.status
+        rollups.applications_deleted([(previous, old_status, instance.created_at)])
+        rollups.applications_created([row])
+    elif instance._loaded_status is not None:
+        rollups.status_changed(
+            [(instance.internship_id, instance._loaded_status, instance.status)]
+        )
+    instance._loaded_internship_id = instance.internship_id
+    instance._loaded_status = instance.status
+
+
+@receiver(post_delete, sender=Application)
+def _count_on_delete(sender, instance: Application, **kwargs):
+    bump_applications_count(instance.internship_id, -1)
+    rollups.applications_deleted(
+        [(instance.internship_id, instance.status, instance.created_at)]
+    )
+
+
+# ───────────────────────── full-text index (SQLite FTS5) ─────────────────────────
+@receiver(post_save, sender=Internship)
+def _index_on_save(sender, instance: Internship, update_fields=None, **kwargs):
+    if update_fields is not None and not set(update_fields) & set(INDEXED_FIELDS):
+        return
+    index_internship(instance)
+
+
+@receiver(post_delete, sender=Internship)
+def _unindex_on_delete(sender, instance: Internship, **kwargs):
+    unindex_internship(instance.pk)
+
+
+# ───────────────────────── response cache ─────────────────────────
+@receiver(post_save, sender=Internship)
+@receiver(post_delete, sender=Internship)
+@receiver(m2m_changed, sender=Internship.skills.through)
+def _invalidate_cache(sender, **kwargs):
+    bump_version("internships")
+
+
+@receiver(m2m_changed, sender=Internship.skills.through)
+def _touch_on_skills_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+    ids = pk_set if reverse else [instance.pk]
+    if ids:
+        Internship.objects.filter(pk__in=ids).update(updated_at=timezone.now())
+
+
+# ───────────────────────── recommendations ─────────────────────────
+@receiver(post_save, sender=Internship)
+def _recommend_on_listing_save(sender, instance: Internship, raw: bool, **kwargs):
+    if not raw:
+        schedule_internship_refresh(instance.pk)
+
+
+@receiver(m2m_changed, sender=Internship.skills.through)
+def _recommend_on_listing_skills(sender, instance, action, reverse, pk_set, **kw):
+    if action.startswith("post_") and not reverse:
+        schedule_internship_refresh(instance.pk)
+
+
+@receiver(post_save, sender=Profile)
+def _recommend_on_profile_save(sender, instance: Profile, raw: bool, **kwargs):
+    if not raw:
+        schedule_profile_refresh(instance.pk)
+
+
+@receiver(post_save, sender=Availability)
+@receiver(post_delete, sender=Availability)
+def _recommend_on_availability(sender, instance: Availability, **kwargs):
+    if not kwargs.get("raw"):
+        schedule_profile_refresh(instance.profile_id)
+
+
+@receiver(m2m_changed, sender=Profile.skills.through)
+def _recommend_on_profile_skills(sender, instance, action, reverse, pk_set, **kw):
+    if action.startswith("post_") and not reverse:
+        schedule_profile_refresh(instance.pk)
@@ -0,0 +1,99 @@
+from datetime import date
+
+from internships.applications import apply
+from internships.models import Application
+from profiles.models import Availability, Education
+
+from .utils import APITestCase, make_employer, make_intern, make_internship, make_user
+
+
+class ApplicantListTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.employer = make_employer()
+        self.listing = make_internship(self.employer)
+        self.apps = [
+            apply(self.listing.pk, make_user(f"i{i}@example.com").pk)[0]
+            for i in range(5)
+        ]
+        Application.objects.filter(pk=self.apps[0].pk).update(status="accepted")
+        self.url = f"/api/internships/{self.listing.pk}/applications/"
+        self.client.force_authenticate(self.employer.user)
+
+    def test_cursor_pages_newest_first_with_totals_on_the_first(self):
+        first = self.client.get(self.url, {"page_size": 3})
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(
+            first.data["totals"],
+            {"pending": 4, "accepted": 1, "rejected": 0, "all": 5},
+        )
+        second = self.client.get(first.data["next"])
+        self.assertNotIn("totals", second.data)
+        self.assertIsNone(second.data["next"])
+        ids = [row["id"] for row in first.data["results"] + second.data["results"]]
+        self.assertEqual(ids, [app.pk for app in reversed(self.apps)])
+
+    def test_status_filter(self):
+        response = self.client.get(self.url, {"status": "accepted"})
+        self.assertEqual(
+            [row["id"] for row in response.data["results"]], [self.apps[0].pk]
+        )
+        self.assertEqual(
+            self.client.get(self.url, {"status": "hired"}).status_code, 400
+        )
+
+    def test_only_the_owning_employer(self):
+        self.client.force_authenticate(make_employer("other@example.com").user)
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+        self.client.force_authenticate(make_user("intern@example.com"))
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_empty_listing_is_not_a_404(self):
+        empty = make_internship(self.employer, title="Empty")
+        response = self.client.get(f"/api/internships/{empty.pk}/applications/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["totals"]["all"], 0)
+
+
+class EmbeddedProfileTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.employer = make_employer()
+        self.listing = make_internship(self.employer)
+        self.url = f"/api/internships/{self.listing.pk}/applications/"
+        self.client.force_authenticate(self.employer.user)
+
+    def _applicant(self, i):
+        profile = make_intern(f"i{i}@example.com", skills=["Python", f"Skill{i}"])
+        Availability.objects.create(profile=profile, hours_per_week=20)
+        for year in (2020, 2023):
+            Education.objects.create(
+                profile=profile,
+                institution=f"School {year}",
+                start_date=date(year, 9, 1),
+            )
+        apply(self.listing.pk, profile.user_id)
+        return profile
+
+    def test_applications_embed_the_intern_profile(self):
+        profile = self._applicant(0)
+        apply(self.listing.pk, make_user("bare@example.com").pk)
+        bare, full = self.client.get(self.url).data["results"]
+        self.assertIsNone(bare["profile"])
+        embedded = full["profile"]
+        self.assertEqual(embedded["id"], profile.pk)
+        self.assertEqual(embedded["availability"]["hours_per_week"], 20)
+        self.assertEqual(
+            sorted(s["name"] for s in embedded["skills"]), ["Python", "Skill0"]
+        )
+        self.assertEqual(embedded["latest_education"]["institution"], "School 2023")
+
+    def test_query_count_does_not_grow_with_the_page(self):
+        self._applicant(0)
+        self.client.get(self.url)  # warm the session / content types
+        with self.assertNumQueries(4):  # page, skills, educations, totals
+            self.client.get(self.url)
+        for i in range(1, 6):
+            self._applicant(i)
+        with self.assertNumQueries(4):
+            self.client.get(self.url)
@@ -0,0 +1,83 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.utils import timezone
+
+from accounts.models import User
+from internships.applications import ListingClosed, apply
+from internships.models import Application, ApplicationDailyStats, ApplicationStats
+
+from .utils import APITestCase, make_employer, make_internship, make_user
+
+
+class ApplyTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.listing = make_internship(make_employer())
+        self.intern = make_user("intern@example.com")
+        self.client.force_authenticate(self.intern)
+
+    def _apply(self, pk=None, **headers):
+        return self.client.post(
+            f"/api/internships/{pk or self.listing.pk}/apply/", headers=headers
+        )
+
+    def test_first_apply_creates_and_retries_return_it(self):
+        first = self._apply()
+        second = self._apply()
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(first.data["id"], second.data["id"])
+        self.listing.refresh_from_db()
+        self.assertEqual(self.listing.applications_count, 1)
+        stats = ApplicationStats.objects.get(internship=self.listing)
+        self.assertEqual(stats.pending, 1)
+        daily = ApplicationDailyStats.objects.get(internship=self.listing)
+        self.assertEqual(daily.applications, 1)
+
+    def test_idempotency_key_replays_the_first_response(self):
+        first = self._apply(**{"Idempotency-Key": "k1"})
+        replay = self._apply(**{"Idempotency-Key": "k1"})
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(replay.status_code, 201)
+        self.assertEqual(replay.data, first.data)
+        self.assertEqual(Application.objects.count(), 1)
+
+    def test_closed_or_expired_listings_are_rejected(self):
+        self.listing.is_closed = True
+        self.listing.save()
+        self.assertEqual(self._apply().status_code, 400)
+        expired = make_internship(
+            self.listing.employer,
+            title="Expired",
+            application_deadline=timezone.now() - timedelta(days=1),
+        )
+        self.assertEqual(self._apply(expired.pk).status_code, 400)
+        self.assertFalse(Application.objects.exists())
+
+    def test_applied_before_closing_is_still_a_retry(self):
+        self._apply()
+        self.listing.is_closed = True
+        self.listing.save()
+        self.assertEqual(self._apply().status_code, 200)
+
+    def test_unknown_listing_and_non_interns(self):
+        self.assertEqual(self._apply(999999).status_code, 404)
+        self.client.force_authenticate(make_user("e@example.com", User.Role.EMPLOYER))
+        self.assertEqual(self._apply().status_code, 403)
+
+    def test_insert_and_counters_commit_together(self):
+        with mock.patch(
+            "internships.rollups.applications_created", side_effect=RuntimeError
+        ):
+            with self.assertRaises(RuntimeError):
+                apply(self.listing.pk, self.intern.pk)
+        self.assertFalse(Application.objects.exists())
+        self.listing.refresh_from_db()
+        self.assertEqual(self.listing.applications_count, 0)
+
+    def test_apply_reports_closed_listings(self):
+        self.listing.is_closed = True
+        self.listing.save()
+        with self.assertRaises(ListingClosed):
+            apply(self.listing.pk, self.intern.pk)
@@ -0,0 +1,79 @@
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from internships.applications import apply_many
+from internships.models import Application, ApplicationStats
+
+from .utils import APITestCase, make_employer, make_internship, make_user
+
+
+class BulkApplyTests(APITestCase):
+    url = "/api/applications/bulk/"
+
+    def setUp(self):
+        super().setUp()
+        self.employer = make_employer()
+        self.open = [
+            make_internship(self.employer, title=f"Intern {i}") for i in range(3)
+        ]
+        self.closed = make_internship(self.employer, title="Closed", is_closed=True)
+        self.intern = make_user("intern@example.com")
+        self.client.force_authenticate(self.intern)
+
+    def _post(self, ids, **kwargs):
+        return self.client.post(self.url, {"internships": ids}, format="json", **kwargs)
+
+    def test_reports_each_listing(self):
+        self.client.post(f"/api/internships/{self.open[0].pk}/apply/")
+        ids = [self.open[0].pk, self.open[1].pk, self.closed.pk, 999999]
+        response = self._post(ids + [self.open[1].pk])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual(
+            [(row["internship"], row["result"]) for row in response.data["results"]],
+            [
+                (self.open[0].pk, "exists"),
+                (self.open[1].pk, "created"),
+                (self.closed.pk, "closed"),
+                (999999, "not_found"),
+            ],
+        )
+        self.open[1].refresh_from_db()
+        self.assertEqual(self.open[1].applications_count, 1)
+        self.assertEqual(
+            ApplicationStats.objects.get(internship=self.open[1]).pending, 1
+        )
+
+    def test_query_count_does_not_grow_with_the_batch(self):
+        with CaptureQueriesContext(connection) as one:
+            self._post([self.open[0].pk])
+        with CaptureQueriesContext(connection) as many:
+            self._post([self.open[1].pk, self.open[2].pk, self.closed.pk])
+        self.assertEqual(len(many), len(one))
+        self.assertEqual(Application.objects.count(), 3)
+
+    def test_invalid_payloads(self):
+        self.assertEqual(self._post([]).status_code, 400)
+        self.assertEqual(self._post(["1"]).status_code, 400)
+        self.assertEqual(self._post([True]).status_code, 400)
+        self.assertEqual(self._post(list(range(1, 52))).status_code, 400)
+
+    def test_interns_only(self):
+        self.client.force_authenticate(self.employer.user)
+        self.assertEqual(self._post([self.open[0].pk]).status_code, 403)
+
+    def test_an_existing_row_with_our_timestamp_is_not_ours(self):
+        existing = Application.objects.create(
+            internship=self.open[0], intern=self.intern
+        )
+        with mock.patch(
+            "internships.applications.timezone.now", return_value=existing.created_at
+        ):
+            _, created, _, _ = apply_many(
+                [self.open[0].pk, self.open[1].pk], self.intern.pk
+            )
+        self.assertEqual(created, [self.open[1].pk])
+        self.open[0].refresh_from_db()
+        self.assertEqual(self.open[0].applications_count, 1)
@@ -0,0 +1,51 @@
+from internships.applications import apply
+from internships.models import Application, ApplicationStats
+
+from .utils import APITestCase, make_employer, make_internship, make_user
+
+
+class BulkStatusTests(APITestCase):
+    url = "/api/applications/status/"
+
+    def setUp(self):
+        super().setUp()
+        self.employer = make_employer()
+        self.listing = make_internship(self.employer)
+        self.apps = [
+            apply(self.listing.pk, make_user(f"i{i}@example.com").pk)[0]
+            for i in range(3)
+        ]
+        other = make_internship(make_employer("other@example.com"))
+        self.foreign = apply(other.pk, make_user("x@example.com").pk)[0]
+        self.client.force_authenticate(self.employer.user)
+
+    def _post(self, data):
+        return self.client.post(self.url, data, format="json")
+
+    def test_updates_owned_applications_and_rollups(self):
+        a, b, c = (app.pk for app in self.apps)
+        response = self._post({"accepted": [a, b], "rejected": [c, self.foreign.pk]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data["updated"], {"pending": 0, "accepted": 2, "rejected": 1}
+        )
+        self.assertEqual(response.data["not_found"], [self.foreign.pk])
+        self.assertEqual(Application.objects.get(pk=c).status, "rejected")
+        self.assertEqual(Application.objects.get(pk=self.foreign.pk).status, "pending")
+        stats = ApplicationStats.objects.get(internship=self.listing)
+        self.assertEqual((stats.pending, stats.accepted, stats.rejected), (0, 2, 1))
+
+    def test_constant_query_count(self):
+        with self.assertNumQueries(6):
+            self._post({"accepted": [self.apps[0].pk]})
+        with self.assertNumQueries(6):
+            self._post({"rejected": [app.pk for app in self.apps]})
+
+    def test_invalid_payloads(self):
+        pk = self.apps[0].pk
+        self.assertEqual(self._post({}).status_code, 400)
+        self.assertEqual(self._post({"accepted": "1"}).status_code, 400)
+        self.assertEqual(
+            self._post({"accepted": [pk], "rejected": [pk]}).status_code, 400
+        )
+        self.assertEqual(self._post({"accepted": list(range(501))}).status_code, 400)
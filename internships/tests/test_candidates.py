@@ -0,0 +1,126 @@
+from unittest import mock
+
+from internships import candidates, matching
+from internships.matching import LazyIndex
+from profiles.models import Availability, Profile
+
+from .utils import APITestCase, make_employer, make_intern, make_internship
+
+
+class CandidateTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        candidates._candidates._index = None  # process-wide; rebuild per test
+        self.employer = make_employer()
+        self.listing = make_internship(
+            self.employer, title="Django developer", skills=["Python", "Django"]
+        )
+        self.both = make_intern("both@example.com", skills=["Python", "Django"])
+        self.python = make_intern("python@example.com", skills=["Python"])
+        self.figma = make_intern("figma@example.com", skills=["Figma"])
+        Availability.objects.create(
+            profile=self.both, status="IMMEDIATELY", hours_per_week=40
+        )
+        Availability.objects.create(
+            profile=self.python, status="UNAVAILABLE", hours_per_week=10
+        )
+        self.client.force_authenticate(self.employer.user)
+
+    def _get(self, **params):
+        url = f"/api/internships/{self.listing.pk}/candidates/"
+        return self.client.get(url, params)
+
+    def _ids(self, **params):
+        response = self._get(**params)
+        self.assertEqual(response.status_code, 200)
+        return [row["profile"]["id"] for row in response.data["results"]]
+
+    def test_defaults_to_the_listing_skills_best_first(self):
+        response = self._get()
+        self.assertEqual(response.data["count"], 2)
+        first, second = response.data["results"]
+        self.assertEqual(sorted(first["matched_skills"]), ["Django", "Python"])
+        self.assertEqual(second["matched_skills"], ["Python"])
+        self.assertGreater(first["score"], second["score"])
+
+    def test_match_all_requires_every_skill(self):
+        self.assertEqual(self._ids(match="all"), [self.both.pk])
+        self.assertEqual(self._ids(skills="Python,Cobol", match="all"), [])
+        self.assertEqual(len(self._ids(skills="Python,Cobol")), 2)
+
+    def test_availability_filters(self):
+        self.assertEqual(self._ids(status="IMMEDIATELY"), [self.both.pk])
+        self.assertEqual(self._ids(min_hours=20), [self.both.pk])
+        # Profiles without Availability use the model defaults
+        self.assertEqual(self._ids(skills="Figma", remote_ok="true"), [self.figma.pk])
+        self.assertEqual(self._ids(skills="Figma", onsite_ok="true"), [])
+
+    def test_pagination(self):
+        response = self._get(limit=1, offset=1)
+        self.assertEqual(response.data["count"], 2)
+        self.assertEqual(len(response.data["results"]), 1)
+
+    def test_bad_parameters_are_rejected(self):
+        self.assertEqual(self._get(status="BUSY").status_code, 400)
+        self.assertEqual(self._get(min_hours="x").status_code, 400)
+        self.assertEqual(self._get(remote_ok="maybe").status_code, 400)
+
+    def test_only_the_owning_employer(self):
+        other = make_employer("other@example.com")
+        self.client.force_authenticate(other.user)
+        self.assertEqual(self._get().status_code, 404)
+
+    def test_deactivated_users_are_excluded(self):
+        self.python.user.is_active = False
+        self.python.user.save()
+        candidates._candidates._index = None
+        self.assertEqual(self._ids(), [self.both.pk])
+
+    def test_employer_profiles_are_not_candidates(self):
+        Profile.objects.create(user=self.employer.user).skills.set(
+            self.listing.skills.all()
+        )
+        candidates._candidates._index = None
+        self.assertEqual(self._ids(), [self.both.pk, self.python.pk])
+
+
+class LazyIndexTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.builds = []
+        self.version = "1"
+        self.index = LazyIndex(self._build, ("profiles",), min_age=0)
+        patcher = mock.patch.object(
+            matching, "get_versions", lambda namespaces: self.version
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _build(self):
+        self.builds.append(self.version)
+        return f"index {len(self.builds)}"
+
+    def test_stale_index_is_served_while_one_rebuild_runs(self):
+        self.assertEqual(self.index.get(), "index 1")  # first build blocks
+        self.version = "2"
+        with mock.patch.object(matching, "run_in_background") as background:
+            self.assertEqual(self.index.get(), "index 1")
+            self.assertEqual(self.index.get(), "index 1")
+        background.assert_called_once()
+        fn, *args = background.call_args.args
+        fn(*args)  # the background rebuild
+        self.assertEqual(self.index.get(), "index 2")
+        self.assertEqual(self.builds, ["1", "2"])
+
+    def test_failed_rebuild_can_be_retried(self):
+        self.index.get()
+        self.version = "2"
+        with mock.patch.object(matching, "run_in_background") as background:
+            self.index.get()
+        fn, *args = background.call_args.args
+        with mock.patch.object(self.index, "_build", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                fn(*args)
+        with mock.patch.object(matching, "run_in_background") as background:
+            self.assertEqual(self.index.get(), "index 1")
+        background.assert_called_once()
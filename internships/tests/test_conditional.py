@@ -0,0 +1,71 @@
+from django.utils.http import http_date
+
+from internships import counters
+from internships.models import Application
+
+from .utils import APITestCase, make_employer, make_intern, make_internship
+
+
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        counters._take()  # drop hits buffered by earlier tests
+        self.employer = make_employer()
+        self.listing = make_internship(self.employer)
+        self.detail = f"/api/internships/{self.listing.pk}/"
+
+    def _revalidate(self, url, response):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+    def test_matching_etag_is_304(self):
+        for url in ("/api/internships/", self.detail):
+            first = self.client.get(url)
+            self.assertEqual(first.status_code, 200)
+            self.assertEqual(self._revalidate(url, first).status_code, 304)
+
+    def test_if_modified_since_is_304(self):
+        first = self.client.get(self.detail)
+        since = http_date(self.listing.updated_at.timestamp() + 1)
+        response = self.client.get(self.detail, HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], first["ETag"])
+
+    def test_edit_changes_etag(self):
+        first = self.client.get(self.detail)
+        self.listing.title = "Renamed"
+        self.listing.save()
+        response = self._revalidate(self.detail, first)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["title"], "Renamed")
+
+    def test_new_application_never_pairs_new_etag_with_cached_body(self):
+        for url in ("/api/internships/", self.detail):
+            self.client.get(url)  # cached with applications_count 0
+        Application.objects.create(internship=self.listing, intern=make_intern().user)
+        list_page = self.client.get("/api/internships/")
+        self.assertEqual(list_page.data["results"][0]["applications_count"], 1)
+        detail = self.client.get(self.detail)
+        self.assertEqual(detail.data["applications_count"], 1)
+        # …and that pairing is what a 304 keeps serving
+        self.assertEqual(self._revalidate(self.detail, detail).status_code, 304)
+
+    def test_counter_flush_moves_etag_and_body_together(self):
+        first = self.client.get(self.detail)
+        counters.record_view(self.listing.pk)
+        counters.record_view(self.listing.pk)
+        counters.flush()
+        response = self._revalidate(self.detail, first)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["views_count"], 3)  # 2 + the first GET
+
+    def test_profile_and_employer_me(self):
+        intern = make_intern("me@example.com").user
+        for user, url in (
+            (intern, "/api/profile/me/"),
+            (self.employer.user, "/api/employer/me/"),
+        ):
+            self.client.force_authenticate(user)
+            first = self.client.get(url)
+            self.assertEqual(first.status_code, 200)
+            self.assertIn("private", first["Cache-Control"])
+            self.assertEqual(self._revalidate(url, first).status_code, 304)
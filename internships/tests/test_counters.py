@@ -0,0 +1,131 @@
+import fnmatch
+import io
+import time
+from collections import Counter
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+from redis import Redis
+from redis.exceptions import ResponseError
+
+from internships import counters
+
+from .utils import APITestCase, make_employer, make_internship
+
+
+class FakeRedis:
+    """The handful of hash commands counters.py uses, in memory."""
+
+    def __init__(self):
+        self.data = {}
+
+    def hincrby(self, key, field, n):
+        hash_ = self.data.setdefault(key, {})
+        hash_[str(field).encode()] = str(
+            int(hash_.get(str(field).encode(), 0)) + n
+        ).encode()
+
+    def rename(self, src, dst):
+        if src not in self.data:
+            raise ResponseError("no such key")
+        self.data[dst] = self.data.pop(src)
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def scan_iter(self, match):
+        return [key.encode() for key in list(self.data) if fnmatch.fnmatch(key, match)]
+
+    def pipeline(self, transaction=True):
+        redis, calls = self, []
+
+        class Pipeline:
+            def __getattr__(self, name):
+                return lambda *args: calls.append((name, args))
+
+            def execute(self):
+                for name, args in calls:
+                    getattr(redis, name)(*args)
+
+        return Pipeline()
+
+
+class CounterTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        counters._take()  # drop hits buffered by earlier tests
+        self.listing = make_internship(make_employer())
+
+    def _counts(self):
+        self.listing.refresh_from_db()
+        return self.listing.views_count, self.listing.impressions_count
+
+    def test_flush_writes_buffered_hits(self):
+        counters.record_view(self.listing.pk)
+        counters.record_impressions([self.listing.pk, self.listing.pk, 999999])
+        call_command("flush_internship_counters", stdout=io.StringIO())
+        self.assertEqual(self._counts(), (1, 2))
+        self.assertEqual(counters.flush(), 0)
+
+    def test_failed_write_keeps_the_counts(self):
+        counters.record_view(self.listing.pk)
+        with mock.patch.object(counters, "_write", side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                counters.flush()
+        counters.flush()
+        self.assertEqual(self._counts(), (1, 0))
+
+
+REDIS_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": "redis://localhost:6379",
+    }
+}
+
+
+class BackendSelectionTests(SimpleTestCase):
+    def test_local_cache_buffers_in_process(self):
+        self.assertIsNone(counters._redis())
+
+    @override_settings(CACHES=REDIS_CACHES)
+    def test_redis_cache_shares_the_hash(self):
+        self.assertIsInstance(counters._redis(), Redis)  # lazy: no connection yet
+
+
+class RedisCounterTests(CounterTests):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = mock.patch.object(counters, "_redis", return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        super().setUp()
+
+    def test_flushing_key_lives_until_the_write_commits(self):
+        counters.record_view(self.listing.pk)
+        with mock.patch.object(counters, "_write", side_effect=SystemExit):
+            with self.assertRaises(SystemExit):  # not caught: a dying worker
+                counters.flush()
+        (orphan,) = self.redis.data
+        self.assertIn(":flushing:", orphan)
+
+        counters.flush()  # too recent to be an orphan yet
+        self.assertEqual(self._counts(), (0, 0))
+        with mock.patch.object(time, "time", return_value=time.time() + 3600):
+            counters.flush()
+        self.assertEqual(self._counts(), (1, 0))
+        self.assertEqual(self.redis.data, {})
+
+    def test_recovery_merges_into_new_hits(self):
+        counters.record_view(self.listing.pk)
+        taken, keys = counters._take()  # a flusher that never finished
+        self.assertEqual(taken["views"], Counter({self.listing.pk: 1}))
+        counters.record_view(self.listing.pk)
+        with mock.patch.object(time, "time", return_value=time.time() + 3600):
+            counters.flush()
+        self.assertEqual(self._counts(), (2, 0))
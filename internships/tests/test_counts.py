@@ -0,0 +1,69 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from internships.models import Application, Internship
+
+from .utils import APITestCase, make_employer, make_intern, make_internship
+
+
+class ApplicationsCountTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.employer = make_employer()
+        self.listing = make_internship(self.employer)
+        self.interns = [make_intern(f"i{n}@example.com").user for n in range(3)]
+
+    def _count_in_list(self, internship_id):
+        rows = self.client.get("/api/internships/").data["results"]
+        return next(r["applications_count"] for r in rows if r["id"] == internship_id)
+
+    def test_list_annotates_count(self):
+        for intern in self.interns[:2]:
+            Application.objects.create(internship=self.listing, intern=intern)
+        self.assertEqual(self._count_in_list(self.listing.pk), 2)
+
+    def test_list_query_count_does_not_grow_with_rows(self):
+        with CaptureQueriesContext(connection) as few:
+            self.client.get("/api/internships/")
+        for n in range(5):
+            listing = make_internship(self.employer, title=f"Listing {n}")
+            Application.objects.create(internship=listing, intern=self.interns[0])
+        cache.clear()
+        with CaptureQueriesContext(connection) as many:
+            self.client.get("/api/internships/")
+        self.assertEqual(len(few), len(many))
+
+    def test_counter_follows_create_move_and_delete(self):
+        other = make_internship(self.employer, title="Other")
+        app = Application.objects.create(
+            internship=self.listing, intern=self.interns[0]
+        )
+        Application.objects.create(internship=self.listing, intern=self.interns[1])
+        self.listing.refresh_from_db()
+        self.assertEqual(self.listing.applications_count, 2)
+
+        app.internship = other
+        app.save()
+        counts = dict(Internship.objects.values_list("pk", "applications_count"))
+        self.assertEqual((counts[self.listing.pk], counts[other.pk]), (1, 1))
+
+        app.delete()
+        other.refresh_from_db()
+        self.assertEqual(other.applications_count, 0)
+
+    @override_settings(INTERNSHIPS_DENORMALIZED_COUNTS=True)
+    def test_denormalized_mode_reads_column(self):
+        Application.objects.create(internship=self.listing, intern=self.interns[0])
+        self.assertEqual(self._count_in_list(self.listing.pk), 1)
+
+    def test_rebuild_command_repairs_drift(self):
+        Application.objects.create(internship=self.listing, intern=self.interns[0])
+        Internship.objects.filter(pk=self.listing.pk).update(applications_count=7)
+        call_command("rebuild_applications_count", stdout=StringIO())
+        self.listing.refresh_from_db()
+        self.assertEqual(self.listing.applications_count, 1)
@@ -0,0 +1,70 @@
+import io
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from internships.applications import apply
+from internships.models import (
+    Application,
+    ArchivedApplication,
+    ArchivedInternship,
+    Internship,
+)
+
+from .utils import APITestCase, make_employer, make_internship, make_user
+
+
+class ExpiryTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.employer = make_employer()
+        now = timezone.now()
+        self.open = make_internship(
+            self.employer, title="Open", application_deadline=now + timedelta(days=1)
+        )
+        self.expired = make_internship(
+            self.employer, title="Expired", application_deadline=now - timedelta(days=1)
+        )
+        self.closed = make_internship(self.employer, title="Closed", is_closed=True)
+
+    def _call(self, *args):
+        call_command(*args, stdout=io.StringIO())
+
+    def _feed_ids(self):
+        response = self.client.get("/api/internships/")
+        return {row["id"] for row in response.data["results"]}
+
+    def test_feed_and_active_show_only_open_listings(self):
+        self.assertEqual(
+            set(Internship.objects.active().values_list("pk", flat=True)),
+            {self.open.pk},
+        )
+        self.assertEqual(self._feed_ids(), {self.open.pk})
+
+    def test_close_expired_internships(self):
+        self._call("close_expired_internships", "--batch-size", "1")
+        self.expired.refresh_from_db()
+        self.assertTrue(self.expired.is_closed)
+        self.assertIsNotNone(self.expired.closed_at)
+        self.open.refresh_from_db()
+        self.assertFalse(self.open.is_closed)
+
+    def test_archive_moves_old_closed_listings_with_applications(self):
+        intern = make_user("intern@example.com")
+        application, _ = apply(self.open.pk, intern.pk)
+        Internship.objects.filter(pk=self.open.pk).update(
+            is_closed=True, closed_at=timezone.now() - timedelta(days=200)
+        )
+        Internship.objects.filter(pk=self.closed.pk).update(closed_at=timezone.now())
+
+        self._call("archive_closed_internships", "--batch-size", "1")
+        self.assertFalse(Internship.objects.filter(pk=self.open.pk).exists())
+        self.assertFalse(Application.objects.filter(pk=application.pk).exists())
+        archived = ArchivedInternship.objects.get(pk=self.open.pk)
+        self.assertEqual(archived.title, "Open")
+        self.assertEqual(archived.applications_count, 1)
+        self.assertEqual(
+            ArchivedApplication.objects.get(pk=application.pk).intern_id, intern.pk
+        )
+        self.assertTrue(Internship.objects.filter(pk=self.closed.pk).exists())
@@ -0,0 +1,77 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from internships.models import Internship
+from internships.pagination import InternshipFeedPagination
+
+from .utils import APITestCase, make_employer, make_internship
+
+
+class FeedPaginationTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        employer = make_employer()
+        self.listings = [
+            make_internship(employer, title=f"Listing {n}") for n in range(5)
+        ]
+        # Two listings share a posted_at so the id tie-break is exercised
+        now = timezone.now()
+        for n, listing in enumerate(self.listings):
+            posted = now - timedelta(minutes=n if n != 3 else 2)
+            Internship.objects.filter(pk=listing.pk).update(posted_at=posted)
+        self.feed_order = list(
+            Internship.objects.order_by("-posted_at", "-id").values_list(
+                "pk", flat=True
+            )
+        )
+
+    def _walk(self, url):
+        ids, pages = [], []
+        while url:
+            data = self.client.get(url).data
+            pages.append(data)
+            ids += [row["id"] for row in data["results"]]
+            url = data["next"]
+        return ids, pages
+
+    def test_pages_cover_feed_once_in_order(self):
+        ids, pages = self._walk("/api/internships/?page_size=2")
+        self.assertEqual(ids, self.feed_order)
+        self.assertEqual(len(pages), 3)
+        self.assertIsNone(pages[0]["previous"])
+
+    def test_previous_link_returns_the_earlier_page(self):
+        first = self.client.get("/api/internships/?page_size=2").data
+        second = self.client.get(first["next"]).data
+        back = self.client.get(second["previous"]).data
+        self.assertEqual(
+            [r["id"] for r in back["results"]], [r["id"] for r in first["results"]]
+        )
+
+    def test_inserts_while_paging_do_not_shift_pages(self):
+        first = self.client.get("/api/internships/?page_size=2").data
+        make_internship(self.listings[0].employer, title="Newest")
+        rest, _ = self._walk(first["next"])
+        self.assertEqual(rest, self.feed_order[2:])
+
+    def test_invalid_cursor_is_404(self):
+        response = self.client.get("/api/internships/?cursor=not-a-cursor")
+        self.assertEqual(response.status_code, 404)
+
+    def test_filter_starts_with_an_index_range_on_the_leading_column(self):
+        pagination = InternshipFeedPagination()
+        posted = timezone.now()
+        sql = str(
+            Internship.objects.filter(
+                pagination._keyset_filter([posted, 7], reverse=False)
+            ).query
+        )
+        where = sql.split("WHERE", 1)[1]
+        self.assertRegex(where, r'"posted_at" <= [^)]+ AND \(')
+        reverse_sql = str(
+            Internship.objects.filter(
+                pagination._keyset_filter([posted, 7], reverse=True)
+            ).query
+        )
+        self.assertIn('"posted_at" >=', reverse_sql)
@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from internships.filters import facet_counts
+from internships.models import Internship
+
+from .utils import APITestCase, make_employer, make_internship
+
+
+class FacetTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.acme = make_employer("acme@example.com", company_name="Acme")
+        self.globex = make_employer("globex@example.com", company_name="Globex")
+        make_internship(self.acme, location="Boston", skills=["Python", "Django"])
+        make_internship(self.acme, location="NYC", skills=["Python"])
+        make_internship(
+            self.globex, location="", is_remote=True, skills=["Figma"], title="UX"
+        )
+        old = make_internship(self.globex, location="Boston", title="Old")
+        Internship.objects.filter(pk=old.pk).update(
+            posted_at=timezone.now() - timedelta(days=20)
+        )
+
+    def _ids(self, **params):
+        response = self.client.get("/api/internships/", params)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def test_filters_combine(self):
+        self.assertEqual(len(self._ids(location="Boston,NYC")["results"]), 3)
+        self.assertEqual(len(self._ids(is_remote="true")["results"]), 1)
+        self.assertEqual(
+            len(self._ids(employer=str(self.acme.pk), skills="Python")["results"]), 2
+        )
+        self.assertEqual(len(self._ids(skills="Figma,Django")["results"]), 2)
+        cutoff = (timezone.now() - timedelta(days=7)).date().isoformat()
+        self.assertEqual(len(self._ids(posted_after=cutoff)["results"]), 3)
+        self.assertEqual(len(self._ids(posted_before=cutoff)["results"]), 1)
+
+    def test_invalid_values_are_400(self):
+        for params in (
+            {"is_remote": "maybe"},
+            {"employer": "x"},
+            {"posted_after": "soon"},
+        ):
+            response = self.client.get("/api/internships/", params)
+            self.assertEqual(response.status_code, 400, params)
+
+    def test_facets_count_the_whole_filtered_set_not_the_page(self):
+        data = self._ids(page_size=1, location="Boston,NYC")
+        facets = data["facets"]
+        self.assertEqual(facets["is_remote"], {"remote": 0, "onsite": 3})
+        self.assertEqual(
+            facets["location"],
+            [{"value": "Boston", "count": 2}, {"value": "NYC", "count": 1}],
+        )
+        self.assertEqual(
+            {e["name"]: e["count"] for e in facets["employer"]},
+            {"Acme": 2, "Globex": 1},
+        )
+        self.assertEqual(facets["posted_at"]["last_7d"], 2)
+        self.assertEqual(facets["skills"][0], {"value": "Python", "count": 2})
+
+    def test_facets_only_on_the_first_page(self):
+        first = self._ids(page_size=1)
+        self.assertIn("facets", first)
+        self.assertNotIn("facets", self.client.get(first["next"]).data)
+
+    def test_facets_take_two_queries(self):
+        with self.assertNumQueries(2):
+            facet_counts(Internship.objects.active())
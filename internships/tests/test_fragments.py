@@ -0,0 +1,61 @@
+from unittest import mock
+
+from rest_framework.test import APIRequestFactory
+
+from internships.models import Application, Internship
+from internships.serializers import InternshipSerializer
+
+from .utils import APITestCase, make_employer, make_intern, make_internship
+
+
+class FragmentCacheTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.employer = make_employer()
+        self.first = make_internship(self.employer, title="First")
+        self.second = make_internship(self.employer, title="Second")
+        self.request = APIRequestFactory().get("/api/internships/")
+
+    def _render(self):
+        rows = Internship.objects.select_related("employer").prefetch_related("skills")
+        with mock.patch.object(
+            InternshipSerializer,
+            "static_representation",
+            autospec=True,
+            side_effect=InternshipSerializer.static_representation,
+        ) as static:
+            data = InternshipSerializer(
+                rows, many=True, context={"request": self.request}
+            ).data
+        return {row["id"]: row for row in data}, static.call_count
+
+    def test_unchanged_rows_are_served_from_the_cache(self):
+        _, misses = self._render()
+        self.assertEqual(misses, 2)
+        _, misses = self._render()
+        self.assertEqual(misses, 0)
+
+    def test_editing_a_row_rebuilds_only_that_row(self):
+        self._render()
+        self.first.title = "First (edited)"
+        self.first.save()
+        rows, misses = self._render()
+        self.assertEqual(misses, 1)
+        self.assertEqual(rows[self.first.pk]["title"], "First (edited)")
+
+    def test_employer_changes_rebuild_their_rows(self):
+        self._render()
+        self.employer.company_name = "Initech"
+        self.employer.save()
+        rows, misses = self._render()
+        self.assertEqual(misses, 2)
+        self.assertEqual(rows[self.second.pk]["employer_name"], "Initech")
+
+    def test_per_request_values_are_never_cached(self):
+        self._render()
+        Application.objects.create(internship=self.first, intern=make_intern().user)
+        Internship.objects.filter(pk=self.first.pk).update(views_count=9)
+        rows, misses = self._render()
+        self.assertEqual(misses, 0)
+        self.assertEqual(rows[self.first.pk]["applications_count"], 1)
+        self.assertEqual(rows[self.first.pk]["views_count"], 9)
@@ -0,0 +1,93 @@
+from internships import matching
+from internships.matching import (
+    W_LOCATION,
+    W_SKILL,
+    ListingIndex,
+    MatchQuery,
+    score,
+    tokenize,
+    top_matches,
+)
+from profiles.models import Availability
+
+from .utils import APITestCase, make_employer, make_intern, make_internship, skill
+
+
+class MatchingTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        matching._listings._index = None  # process-wide; rebuild per test
+        employer = make_employer()
+        self.django = make_internship(
+            employer, title="Django developer", skills=["Python", "Django"]
+        )
+        self.python = make_internship(
+            employer, title="Data engineer", skills=["Python", "SQL"], location="NYC"
+        )
+        self.remote = make_internship(
+            employer, title="Remote designer", skills=["Figma"], is_remote=True
+        )
+        make_internship(employer, title="Closed", skills=["Python"], is_closed=True)
+        self.profile = make_intern(skills=["Python", "Django"], city="Boston")
+
+    def _scores(self, **overrides):
+        query = MatchQuery.from_profile(self.profile)
+        for name, value in overrides.items():
+            setattr(query, name, value)
+        index = ListingIndex.build()
+        return dict(zip(index.ids.tolist(), score(index, query).tolist()))
+
+    def test_tokenize_drops_stopwords_and_short_tokens(self):
+        self.assertEqual(
+            tokenize("Strong experience with C++ and Node.js, go"), {"c++", "node.js"}
+        )
+
+    def test_full_skill_coverage_outranks_partial(self):
+        scores = self._scores(terms=set(), city="")
+        self.assertAlmostEqual(scores[self.django.pk], W_SKILL)
+        self.assertGreater(scores[self.django.pk], scores[self.python.pk])
+        self.assertEqual(scores[self.remote.pk], 0)
+
+    def test_closed_listings_are_not_indexed(self):
+        self.assertEqual(
+            sorted(ListingIndex.build().ids.tolist()),
+            sorted([self.django.pk, self.python.pk, self.remote.pk]),
+        )
+
+    def test_same_city_onsite_bonus(self):
+        boston = self._scores(terms=set(), skill_ids=[], city="boston")
+        self.assertAlmostEqual(boston[self.django.pk], W_LOCATION)
+        self.assertEqual(boston[self.python.pk], 0)
+
+    def test_availability_masks_listings(self):
+        no_remote = self._scores(remote_ok=False)
+        self.assertEqual(no_remote[self.remote.pk], float("-inf"))
+        no_onsite = self._scores(onsite_ok=False)
+        self.assertEqual(no_onsite[self.django.pk], float("-inf"))
+
+    def test_top_matches_are_best_first_and_positive_only(self):
+        query = MatchQuery.from_profile(self.profile)
+        ranked = top_matches(ListingIndex.build(), query, limit=10)
+        self.assertEqual([pk for pk, _ in ranked], [self.django.pk, self.python.pk])
+        self.assertEqual(len(top_matches(ListingIndex.build(), query, limit=1)), 1)
+
+    def test_recommended_endpoint(self):
+        Availability.objects.create(
+            profile=self.profile, remote_ok=True, onsite_ok=True
+        )
+        self.profile.skills.add(skill("Figma"))
+        self.client.force_authenticate(self.profile.user)
+        rows = self.client.get("/api/internships/recommended/").data["results"]
+        self.assertEqual(rows[0]["id"], self.django.pk)
+        self.assertEqual(
+            [r["match_score"] for r in rows],
+            sorted((r["match_score"] for r in rows), reverse=True),
+        )
+        limited = self.client.get("/api/internships/recommended/?limit=1")
+        self.assertEqual(len(limited.data["results"]), 1)
+
+    def test_recommended_without_profile_is_empty(self):
+        employer = make_employer("other@example.com")
+        self.client.force_authenticate(employer.user)
+        response = self.client.get("/api/internships/recommended/")
+        self.assertEqual(response.data, {"results": []})
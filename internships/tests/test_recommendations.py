@@ -0,0 +1,112 @@
+from unittest import mock
+
+from internships import matching, recommendations
+from internships.matching import ListingIndex, MatchQuery, score
+from internships.models import Recommendation
+from internships.recommendations import refresh_for_internship, refresh_for_profile
+
+from .utils import APITestCase, make_employer, make_intern, make_internship
+
+
+class RecommendationTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        matching._listings._index = None  # process-wide; rebuild per test
+        self.employer = make_employer()
+        make_internship(
+            self.employer,
+            title="Machine learning intern",
+            requirements="pytorch statistics",
+            skills=["Python"],
+        )
+        make_internship(
+            self.employer,
+            title="Analytics intern",
+            requirements="tableau statistics",
+            skills=["SQL"],
+        )
+        self.target = make_internship(
+            self.employer,
+            title="Backend intern",
+            requirements="django postgres",
+            skills=["Python", "Django"],
+        )
+        self.profile = make_intern(
+            headline="Backend developer",
+            bio="Django, postgres, pytorch and tableau projects",
+            skills=["Python"],
+        )
+
+    def _stored(self):
+        return list(
+            Recommendation.objects.filter(profile=self.profile).values_list(
+                "internship_id", "rank"
+            )
+        )
+
+    def test_partial_index_scores_like_the_full_index(self):
+        full = ListingIndex.build()
+        partial = ListingIndex.build([self.target.pk], reference=full)
+        query = MatchQuery.from_profile(self.profile)
+        full_scores = dict(zip(full.ids.tolist(), score(full, query).tolist()))
+        self.assertGreater(full_scores[self.target.pk], 0)
+        self.assertAlmostEqual(
+            float(score(partial, query)[0]), full_scores[self.target.pk]
+        )
+
+    def test_refresh_for_profile_stores_ranked_rows(self):
+        refresh_for_profile(self.profile.pk)
+        stored = self._stored()
+        self.assertIn(self.target.pk, [pk for pk, _ in stored])
+        self.assertEqual([rank for _, rank in stored], list(range(1, len(stored) + 1)))
+
+    def test_incremental_refresh_scores_the_listing_like_a_full_rescore(self):
+        refresh_for_profile(self.profile.pk)
+        matching._listings._index = None
+        new = make_internship(
+            self.employer,
+            title="Django postgres intern",
+            requirements="django",
+            skills=["Python"],
+        )
+        refresh_for_internship(new.pk)
+        incremental = dict(
+            Recommendation.objects.filter(profile=self.profile).values_list(
+                "internship_id", "score"
+            )
+        )
+        refresh_for_profile(self.profile.pk)
+        full = dict(
+            Recommendation.objects.filter(profile=self.profile).values_list(
+                "internship_id", "score"
+            )
+        )
+        # Other rows keep their stored scores; only the edited listing is exact.
+        self.assertEqual(incremental.keys(), full.keys())
+        self.assertAlmostEqual(incremental[new.pk], full[new.pk])
+
+    def test_closed_listing_drops_out_on_refresh(self):
+        refresh_for_profile(self.profile.pk)
+        self.target.is_closed = True
+        self.target.save()
+        matching._listings._index = None
+        refresh_for_internship(self.target.pk)
+        self.assertNotIn(self.target.pk, [pk for pk, _ in self._stored()])
+
+    def test_edits_schedule_a_debounced_refresh(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.target.title = "Renamed"
+            self.target.save()
+        self.assertTrue(callbacks)
+
+    def test_no_matches_is_computed_once(self):
+        loner = make_intern("loner@example.com", headline="", city="Nowhere")
+        self.client.force_authenticate(loner.user)
+        with mock.patch(
+            "internships.views.refresh_for_profile",
+            wraps=recommendations.refresh_for_profile,
+        ) as refresh:
+            for _ in range(2):
+                response = self.client.get("/api/internships/recommended/")
+                self.assertEqual(response.data["results"], [])
+        refresh.assert_called_once_with(loner.pk)
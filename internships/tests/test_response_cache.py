@@ -0,0 +1,87 @@
+import threading
+import time
+from unittest import mock
+
+from django.core.cache import cache
+
+from backend import caching
+
+from .utils import APITestCase, make_employer, make_internship
+
+
+class CachedResponseTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.employer = make_employer()
+        self.listing = make_internship(self.employer)
+
+    def test_second_read_is_a_hit_until_a_listing_changes(self):
+        self.assertEqual(self.client.get("/api/internships/")["X-Cache"], "MISS")
+        self.assertEqual(self.client.get("/api/internships/")["X-Cache"], "HIT")
+
+        self.listing.title = "Renamed"
+        self.listing.save()
+        response = self.client.get("/api/internships/")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["results"][0]["title"], "Renamed")
+
+    def test_employer_changes_invalidate_listings(self):
+        self.client.get("/api/internships/")
+        self.employer.company_name = "Initech"
+        self.employer.save()
+        response = self.client.get("/api/internships/")
+        self.assertEqual(response.data["results"][0]["employer_name"], "Initech")
+
+    def test_query_string_is_part_of_the_key(self):
+        self.client.get("/api/internships/?location=Boston")
+        response = self.client.get("/api/internships/?location=NYC")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.data["results"], [])
+
+    def test_mine_is_cached_per_user(self):
+        other = make_employer("other@example.com")
+        self.client.force_authenticate(self.employer.user)
+        self.assertEqual(
+            len(self.client.get("/api/internships/?mine=true").data["results"]), 1
+        )
+        self.client.force_authenticate(other.user)
+        self.assertEqual(
+            self.client.get("/api/internships/?mine=true").data["results"], []
+        )
+
+    def test_errors_are_not_cached(self):
+        missing = f"/api/internships/{self.listing.pk + 100}/"
+        self.assertEqual(self.client.get(missing).status_code, 404)
+        response = self.client.get(missing)
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn("X-Cache", response)
+
+
+class GetOrComputeTests(APITestCase):
+    def test_hard_miss_waits_for_the_rebuilding_caller(self):
+        cache.add("k:lock", 1, 10)  # another worker is rebuilding "k"
+
+        def finish():
+            time.sleep(0.1)
+            cache.set("k", ("theirs", 0.0, time.time() + 60), 60)
+
+        threading.Thread(target=finish).start()
+        compute = mock.Mock(return_value="mine")
+        self.assertEqual(caching.get_or_compute("k", compute, 60), "theirs")
+        compute.assert_not_called()
+
+    def test_soft_expiry_refreshes_early_once(self):
+        # An expensive entry one second from expiry is refreshed ahead of time…
+        cache.set("k", ("old", 100.0, time.time() + 1), 60)
+        self.assertEqual(caching.get_or_compute("k", lambda: "new", 60), "new")
+        # …unless someone else already holds the refresh lock.
+        cache.set("k", ("old", 100.0, time.time() + 1), 60)
+        cache.add("k:lock", 1, 10)
+        self.assertEqual(caching.get_or_compute("k", lambda: "new", 60), "old")
+
+    def test_bump_version_changes_the_token(self):
+        before = caching.get_versions(["internships", "skills"])
+        caching.bump_version("skills")
+        after = caching.get_versions(["internships", "skills"])
+        self.assertEqual(before.split(".")[0], after.split(".")[0])
+        self.assertNotEqual(before.split(".")[1], after.split(".")[1])
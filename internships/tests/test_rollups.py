@@ -0,0 +1,68 @@
+import io
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from internships.applications import apply
+from internships.models import Application, ApplicationDailyStats, ApplicationStats
+
+from .utils import APITestCase, make_employer, make_internship, make_user
+
+
+class RollupTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.employer = make_employer()
+        self.listing = make_internship(self.employer)
+        self.other = make_internship(self.employer, title="Other")
+        self.apps = [
+            apply(self.listing.pk, make_user(f"i{i}@example.com").pk)[0]
+            for i in range(3)
+        ]
+
+    def _totals(self, listing=None):
+        stats = ApplicationStats.objects.get(internship=listing or self.listing)
+        return stats.pending, stats.accepted, stats.rejected
+
+    def _daily(self, listing=None):
+        return ApplicationDailyStats.objects.get(
+            internship=listing or self.listing, day=timezone.localdate()
+        ).applications
+
+    def test_model_writes_keep_rollups_in_step(self):
+        app = Application.objects.get(pk=self.apps[0].pk)
+        app.status = "accepted"
+        app.save()
+        Application.objects.get(pk=self.apps[1].pk).delete()
+        self.assertEqual(self._totals(), (1, 1, 0))
+        self.assertEqual(self._daily(), 2)
+
+        app.internship = self.other
+        app.save()
+        self.assertEqual(self._totals(), (1, 0, 0))
+        self.assertEqual(self._totals(self.other), (0, 1, 0))
+        self.assertEqual(self._daily(self.other), 1)
+
+    def test_reconcile_repairs_drift(self):
+        ApplicationStats.objects.update(pending=99)
+        ApplicationDailyStats.objects.all().delete()
+        Application.objects.filter(pk=self.apps[0].pk).update(status="rejected")
+        call_command("reconcile_application_stats", stdout=io.StringIO())
+        self.assertEqual(self._totals(), (2, 0, 1))
+        self.assertEqual(self._daily(), 3)
+
+    def test_dashboard_reads_the_rollups(self):
+        Application.objects.filter(pk=self.apps[0].pk).update(status="accepted")
+        self.client.force_authenticate(self.employer.user)
+        response = self.client.get("/api/employer/stats/")
+        self.assertEqual(response.status_code, 200)
+        # The queryset UPDATE bypassed the rollups, so they still say 3 pending
+        (listing,) = response.data["listings"]
+        self.assertEqual((listing["pending"], listing["accepted"]), (3, 0))
+        self.assertEqual(response.data["totals"]["total"], 3)
+        today = {row["date"]: row["applications"] for row in response.data["daily"]}
+        self.assertEqual(today[timezone.localdate()], 3)
+
+    def test_dashboard_is_employer_only(self):
+        self.client.force_authenticate(make_user("intern@example.com"))
+        self.assertEqual(self.client.get("/api/employer/stats/").status_code, 403)
@@ -0,0 +1,59 @@
+from internships.models import Internship
+
+from .utils import APITestCase, make_employer, make_internship
+
+
+class SearchTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        employer = make_employer()
+        self.in_title = make_internship(
+            employer, title="Python developer", description="Build web services."
+        )
+        self.in_description = make_internship(
+            employer,
+            title="Data analyst",
+            description="Reporting with SQL and some Python scripting.",
+        )
+        self.unrelated = make_internship(
+            employer, title="Graphic designer", description="Figma and branding."
+        )
+
+    def _search(self, q):
+        response = self.client.get("/api/internships/", {"q": q})
+        self.assertEqual(response.status_code, 200)
+        return response.data["results"]
+
+    def test_title_matches_rank_above_description_matches(self):
+        rows = self._search("python")
+        self.assertEqual(
+            [r["id"] for r in rows], [self.in_title.pk, self.in_description.pk]
+        )
+        self.assertGreater(rows[0]["search_rank"], rows[1]["search_rank"])
+
+    def test_terms_are_anded(self):
+        rows = self._search("python sql")
+        self.assertEqual([r["id"] for r in rows], [self.in_description.pk])
+
+    def test_snippet_highlights_matches(self):
+        rows = self._search("scripting")
+        self.assertIn("<mark>", rows[0]["search_snippet"])
+
+    def test_edits_are_reindexed(self):
+        self.unrelated.title = "Python illustrator"
+        self.unrelated.save()
+        self.assertIn(self.unrelated.pk, [r["id"] for r in self._search("python")])
+
+    def test_operators_in_input_are_treated_as_text(self):
+        python = self._search("python")
+        self.assertTrue(python)
+        self.assertEqual(self._search('"python'), python)
+        self.assertEqual(self._search("python*"), python)
+        self.assertEqual(self._search("*** ()"), [])
+
+    def test_deleted_listings_leave_the_index(self):
+        self.in_title.delete()
+        self.assertEqual(
+            [r["id"] for r in self._search("python")], [self.in_description.pk]
+        )
+        self.assertFalse(Internship.objects.filter(pk=self.in_title.pk).exists())
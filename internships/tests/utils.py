@@ -0,0 +1,46 @@
+"""Fixtures shared by the test modules (internships and the other apps)."""
+
+from django.core.cache import cache
+from rest_framework.test import APITestCase as _APITestCase
+
+from accounts.models import User
+from employers.models import Employer
+from internships.models import Internship
+from profiles.models import Profile, Skill
+
+
+def make_user(email: str, role: str = User.Role.INTERN) -> User:
+    return User.objects.create_user(email, None, role=role)
+
+
+def skill(name: str) -> Skill:
+    return Skill.objects.get_or_create(name=name)[0]
+
+
+def make_employer(email: str = "employer@example.com", **fields) -> Employer:
+    fields.setdefault("company_name", "Acme")
+    return Employer.objects.create(user=make_user(email, User.Role.EMPLOYER), **fields)
+
+
+def make_intern(email: str = "intern@example.com", skills=(), **fields) -> Profile:
+    fields = {"headline": "Student", "bio": "", "city": "Boston", **fields}
+    profile = Profile.objects.create(user=make_user(email), **fields)
+    if skills:
+        profile.skills.set([skill(name) for name in skills])
+    return profile
+
+
+def make_internship(employer, title: str = "Backend intern", skills=(), **fields):
+    fields = {"description": f"{title} role", "location": "Boston", **fields}
+    internship = Internship.objects.create(employer=employer, title=title, **fields)
+    if skills:
+        internship.skills.set([skill(name) for name in skills])
+    return internship
+
+
+class APITestCase(_APITestCase):
+    """Each test starts from an empty cache (responses, throttles, counters)."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
@@ -3,8 +3,13 @@ from django.urls import path
 from .views import (
     ApplicationDetail,
     ApplicationList,
+    ApplyToInternship,
+    BulkApplicationStatus,
+    BulkApply,
+    InternshipCandidates,
     InternshipDetail,
     InternshipListCreate,
+    RecommendedInternships,
 )
 
 app_name = "internships"
@@ -13,8 +18,28 @@ urlpatterns = [
     # Internship listings
     path("internships/", InternshipListCreate.as_view(), name="internship-list"),
     path("internships", InternshipListCreate.as_view()),
+    path(
+        "internships/recommended/",
+        RecommendedInternships.as_view(),
+        name="internship-recommended",
+    ),
+    path("internships/recommended", RecommendedInternships.as_view()),
     path("internships/<int:pk>/", InternshipDetail.as_view(), name="internship-detail"),
     path("internships/<int:pk>", InternshipDetail.as_view()),
+    # Candidate discovery (employer)
+    path(
+        "internships/<int:pk>/candidates/",
+        InternshipCandidates.as_view(),
+        name="internship-candidates",
+    ),
+    path("internships/<int:pk>/candidates", InternshipCandidates.as_view()),
+    # Intern applies (idempotent)
+    path(
+        "internships/<int:pk>/apply/",
+        ApplyToInternship.as_view(),
+        name="internship-apply",
+    ),
+    path("internships/<int:pk>/apply", ApplyToInternship.as_view()),
     # **New:** Applications per internship and application detail
     path(
         "internships/<int:pk>/applications/",
@@ -22,6 +47,14 @@ urlpatterns = [
         name="internship-applications",
     ),
     path("internships/<int:pk>/applications", ApplicationList.as_view()),
+    path("applications/bulk/", BulkApply.as_view(), name="application-bulk"),
+    path("applications/bulk", BulkApply.as_view()),
+    path(
+        "applications/status/",
+        BulkApplicationStatus.as_view(),
+        name="application-bulk-status",
+    ),
+    path("applications/status", BulkApplicationStatus.as_view()),
     path(
         "applications/<int:pk>/", ApplicationDetail.as_view(), name="application-detail"
     ),
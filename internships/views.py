@@ -1,28 +1,90 @@
-from rest_framework import generics, permissions
-from rest_framework.exceptions import PermissionDenied
+from django.db import IntegrityError, transaction
+from django.db.models import Case, Count, F, Max, Sum, Value, When
+from rest_framework import generics, permissions, status
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from rest_framework.response import Response
 
+from accounts.deletion import schedule_deletion
 from accounts.models import User
+from accounts.serializers import DeletionJobSerializer
+from backend.caching import CachedResponseMixin
+from backend.conditional import ConditionalGetMixin
+from backend.idempotency import IdempotentMixin
 from employers.models import Employer
 from employers.serializers import ApplicationSerializer
+from profiles.models import Availability, Profile, Skill
+from profiles.serializers import CandidateSerializer
 
+from . import rollups
+from .applications import ListingClosed, apply, apply_many
+from .candidates import CandidateQuery
+from .candidates import get_index as get_candidate_index
+from .candidates import search as search_candidates
+from .counters import record_impressions, record_view
+from .filters import facet_counts, filter_internships
 from .models import Application, Internship
-from .serializers import InternshipSerializer
+from .pagination import (
+    ApplicantPagination,
+    InternshipFeedPagination,
+    InternshipPagePagination,
+)
+from .recommendations import is_computed, refresh_for_profile
+from .search import attach_snippets, filter_matches, search_internships
+from .serializers import InternshipSerializer, MyApplicationSerializer
 
 
-class InternshipListCreate(generics.ListCreateAPIView):
+class InternshipListCreate(
+    ConditionalGetMixin, CachedResponseMixin, generics.ListCreateAPIView
+):
     """
-    GET  /api/internships/         -> public list of all internships
+    GET  /api/internships/         -> public list of all internships (cursor pages)
     GET  /api/internships/?mine=true  -> list internships posted by current employer
+    GET  /api/internships/?page=N  -> offset pages with a total `count` (opt-in)
+    GET  /api/internships/?q=python+django -> full-text search, best match first
+    GET  /api/internships/?location=NYC&is_remote=false&skills=Python
+                                   -> facet filters (see internships/filters.py)
     POST /api/internships/         -> create a new internship (employer only)
+
+    The first page of a list response also carries `facets`: counts for the
+    filter chips over the whole filtered result set.
+
+    GET responses are cached (backend/caching.py) until a listing, employer
+    or skill changes, or their ETag – which also covers the application and
+    view / impression counts – moves. They carry an ETag / Last-Modified, so
+    polls that send them back get a 304 from one aggregate query.
     """
 
     serializer_class = InternshipSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    cache_namespaces = ("internships", "employers", "skills")
 
-    def get_queryset(self):
-        qs = Internship.objects.select_related("employer").all()
+    def cache_varies_on_user(self, request) -> bool:
+        return "mine" in request.query_params
+
+    @property
+    def conditional_per_user(self) -> bool:
+        return self.cache_varies_on_user(self.request)
+
+    @property
+    def pagination_class(self):
+        request = getattr(self, "request", None)
+        if request is not None and (
+            "page" in request.query_params or self._search_text()
+        ):
+            # Relevance order isn't a stable (posted_at, id) keyset
+            return InternshipPagePagination
+        return InternshipFeedPagination
+
+    def _search_text(self) -> str:
+        return (self.request.query_params.get("q") or "").strip()
+
+    def _filtered(self, qs):
+        """Apply ?mine and the facet filters (shared by rows and facets)."""
         mine_param = self.request.query_params.get("mine")
-        if mine_param and mine_param.lower() in ("true", "1", "yes"):
+        if not (mine_param and mine_param.lower() in ("true", "1", "yes")):
+            # Public feed: open listings only (internship_active_feed_idx)
+            qs = qs.active()
+        else:
             if not self.request.user.is_authenticated:
                 raise PermissionDenied(
                     "Authentication is required to filter your internships."
@@ -33,8 +95,64 @@ class InternshipListCreate(generics.ListCreateAPIView):
             except Employer.DoesNotExist:
                 raise PermissionDenied("No employer profile found for this user.")
             qs = qs.filter(employer=employer)
+        return filter_internships(qs, self.request.query_params)
+
+    def get_queryset(self):
+        qs = self._filtered(
+            Internship.objects.select_related("employer")
+            .prefetch_related("skills")
+            .with_applications_count()
+        )
+        search_text = self._search_text()
+        if search_text:
+            qs = search_internships(qs, search_text)
         return qs
 
+    def _matching(self):
+        """Every listing the request selects, unordered and unannotated."""
+        qs = self._filtered(Internship.objects.all())
+        search_text = self._search_text()
+        if search_text:
+            qs = filter_matches(qs, search_text)
+        return qs
+
+    def get_facets(self):
+        return facet_counts(self._matching())
+
+    def get_validator(self, request):
+        # Any insert, edit or delete in the result set moves one of these.
+        state = self._matching().aggregate(
+            last=Max("updated_at"),
+            employer_last=Max("employer__updated_at"),
+            rows=Count("id"),
+            applications=Sum("applications_count"),
+            views=Sum("views_count"),
+            impressions=Sum("impressions_count"),
+        )
+        stamps = [s for s in (state["last"], state["employer_last"]) if s]
+        return list(state.values()), max(stamps, default=None)
+
+    def paginate_queryset(self, queryset):
+        page = super().paginate_queryset(queryset)
+        search_text = self._search_text()
+        if page is not None and search_text:
+            attach_snippets(page, search_text)
+        return page
+
+    def get(self, request, *args, **kwargs):
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == 200:  # fresh or cached body, not a 304
+            record_impressions(row["id"] for row in response.data["results"])
+        return response
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        params = request.query_params
+        first_page = "cursor" not in params and params.get("page", "1") == "1"
+        if first_page and isinstance(response.data, dict):
+            response.data["facets"] = self.get_facets()
+        return response
+
     def perform_create(self, serializer):
         # Only authenticated employers can create internships
         if (
@@ -46,55 +164,361 @@ class InternshipListCreate(generics.ListCreateAPIView):
         serializer.save(employer=employer)
 
 
-class InternshipDetail(generics.RetrieveUpdateDestroyAPIView):
+class InternshipDetail(
+    ConditionalGetMixin, CachedResponseMixin, generics.RetrieveUpdateDestroyAPIView
+):
     """
     GET    /api/internships/<id>/   -> retrieve internship details (public)
     PUT    /api/internships/<id>/   -> update an internship (owner only)
     PATCH  /api/internships/<id>/   -> partial update (owner only)
-    DELETE /api/internships/<id>/   -> delete an internship (owner only)
+    DELETE /api/internships/<id>/   -> 202 + deletion job (owner only); the
+                                       listing disappears at once, its
+                                       applications are removed in the
+                                       background (accounts/deletion.py)
     """
 
     serializer_class = InternshipSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    cache_namespaces = ("internships", "employers", "skills")
+
+    def get_validator(self, request):
+        state = (
+            Internship.objects.filter(pk=self.kwargs["pk"])
+            .values_list(
+                "updated_at",
+                "employer__updated_at",
+                "applications_count",
+                "views_count",
+                "impressions_count",
+            )
+            .first()
+        )
+        if state is None:
+            return None  # let the normal path produce the 404
+        return state, max(state[0], state[1])
+
+    def destroy(self, request, *args, **kwargs):
+        job = schedule_deletion(self.get_object(), requested_by=request.user)
+        return Response(
+            DeletionJobSerializer(job).data, status=status.HTTP_202_ACCEPTED
+        )
+
+    def get(self, request, *args, **kwargs):
+        response = super().get(request, *args, **kwargs)
+        if response.status_code in (200, 304):  # a 304 is still a view
+            record_view(self.kwargs["pk"])
+        return response
 
     def get_queryset(self):
+        qs = (
+            Internship.objects.select_related("employer")
+            .prefetch_related("skills")
+            .with_applications_count()
+        )
         if self.request.method in permissions.SAFE_METHODS:
             # Anyone can retrieve/view
-            return Internship.objects.select_related("employer").all()
+            return qs
         # Editing/deleting allowed only for the owning employer
-        return Internship.objects.select_related("employer").filter(
-            employer__user=self.request.user
+        return qs.filter(employer__user=self.request.user)
+
+
+class RecommendedInternships(generics.GenericAPIView):
+    """
+    GET /api/internships/recommended/?limit=20
+        -> listings ranked for the current intern's profile (skills,
+           remote/on-site availability, city, headline/bio text), each with a
+           `match_score`. Served from the precomputed Recommendation
+           table (internships/recommendations.py) – one indexed lookup.
+    """
+
+    serializer_class = InternshipSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    default_limit = 20
+    max_limit = 100
+
+    def get_limit(self) -> int:
+        try:
+            limit = int(self.request.query_params["limit"])
+        except (KeyError, ValueError):
+            return self.default_limit
+        return max(1, min(limit, self.max_limit))
+
+    def get(self, request, *args, **kwargs):
+        profile = Profile.objects.filter(user=request.user).only("pk").first()
+        if profile is None:
+            return Response({"results": []})
+        if not is_computed(profile.pk):
+            refresh_for_profile(profile.pk)  # first visit: compute inline once
+        rows = (
+            Internship.objects.active()
+            .filter(recommendations__profile=profile)
+            .annotate(match_score=F("recommendations__score"))
+            .select_related("employer")
+            .prefetch_related("skills")
+            .with_applications_count()
+            .order_by("recommendations__rank")[: self.get_limit()]
+        )
+        serializer = self.get_serializer(rows, many=True)
+        record_impressions(row["id"] for row in serializer.data)
+        return Response({"results": serializer.data})
+
+
+class InternshipCandidates(generics.GenericAPIView):
+    """
+    GET /api/internships/<id>/candidates/   (owning employer only)
+        -> intern profiles ranked against the listing, from an in-memory
+           skill -> profiles index (internships/candidates.py)
+
+    Query parameters (all optional):
+      skills=Python,Django   defaults to the listing's own skills
+      match=any|all          any (default) or every skill required
+      status=IMMEDIATELY,FROM_DATE   Availability.status
+      min_hours=20           Availability.hours_per_week >= 20
+      remote_ok=true|false, onsite_ok=true|false
+      limit=20&offset=0
+    """
+
+    serializer_class = CandidateSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    default_limit = 20
+    max_limit = 100
+
+    def _bool(self, name):
+        raw = (self.request.query_params.get(name) or "").lower()
+        if not raw:
+            return None
+        if raw not in ("true", "false", "1", "0"):
+            raise ValidationError({name: "Expected true or false."})
+        return raw in ("true", "1")
+
+    def _int(self, name, default=None, minimum=0, maximum=None):
+        raw = self.request.query_params.get(name)
+        if raw in (None, ""):
+            return default
+        try:
+            value = int(raw)
+        except ValueError:
+            raise ValidationError({name: "Expected an integer."})
+        value = max(minimum, value)
+        return min(value, maximum) if maximum is not None else value
+
+    def build_query(self, internship: Internship) -> CandidateQuery:
+        params = self.request.query_params
+        names = [n.strip() for n in (params.get("skills") or "").split(",")]
+        names = [n for n in names if n]
+        if names:
+            skill_ids = list(
+                Skill.objects.filter(name__in=names).values_list("pk", flat=True)
+            )
+            if len(skill_ids) < len(set(names)) and params.get("match") == "all":
+                skill_ids.append(0)  # an unknown skill: nobody can have all
+        else:
+            skill_ids = [skill.pk for skill in internship.skills.all()]
+
+        statuses = [s.strip() for s in (params.get("status") or "").split(",")]
+        statuses = [s for s in statuses if s]
+        unknown = set(statuses) - set(Availability.Status.values)
+        if unknown:
+            raise ValidationError({"status": f"Unknown status: {sorted(unknown)}"})
+
+        return CandidateQuery(
+            skill_ids=skill_ids,
+            text=f"{internship.title} {internship.requirements}",
+            match_all=params.get("match") == "all",
+            statuses=statuses,
+            min_hours=self._int("min_hours"),
+            remote_ok=self._bool("remote_ok"),
+            onsite_ok=self._bool("onsite_ok"),
+        )
+
+    def get(self, request, pk, *args, **kwargs):
+        internship = (
+            Internship.objects.filter(pk=pk, employer__user=request.user)
+            .prefetch_related("skills")
+            .first()
+        )
+        if internship is None:
+            raise NotFound("Internship not found.")
+
+        limit = self._int("limit", self.default_limit, 1, self.max_limit)
+        offset = self._int("offset", 0)
+        count, ranked = search_candidates(
+            get_candidate_index(), self.build_query(internship), limit, offset
+        )
+        profiles = (
+            Profile.objects.select_related("availability")
+            .prefetch_related("skills")
+            .in_bulk([profile_id for profile_id, _, _ in ranked])
+        )
+        skill_names = dict(
+            Skill.objects.values_list("pk", "name").filter(
+                pk__in={s for _, _, matched in ranked for s in matched}
+            )
         )
+        results = [
+            {
+                "profile": self.get_serializer(profiles[profile_id]).data,
+                "score": round(match_score, 4),
+                "matched_skills": [skill_names[s] for s in matched],
+            }
+            for profile_id, match_score, matched in ranked
+            if profile_id in profiles  # deleted since the index was built
+        ]
+        return Response({"count": count, "results": results})
+
+
+class ApplyToInternship(IdempotentMixin, generics.GenericAPIView):
+    """
+    POST /api/internships/<id>/apply/   (intern only)
+        -> 201 + the new application, or 200 + the existing one if this
+           intern already applied (never a 500 on duplicates); 400 once the
+           listing is closed or past its deadline
+
+    Send an `Idempotency-Key` header to make client retries safe: the first
+    response is replayed for an hour (backend/idempotency.py).
+    """
+
+    serializer_class = MyApplicationSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, pk, *args, **kwargs):
+        if request.user.role != User.Role.INTERN:
+            raise PermissionDenied("Only intern accounts can apply.")
+        try:
+            application, created = apply(pk, request.user.pk)
+        except (Internship.DoesNotExist, IntegrityError):  # deleted meanwhile
+            raise NotFound("Internship not found.")
+        except ListingClosed:
+            raise ValidationError(
+                {"detail": "This internship is no longer accepting applications."}
+            )
+        return Response(
+            self.get_serializer(application).data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+
+class BulkApply(IdempotentMixin, generics.GenericAPIView):
+    """
+    POST /api/applications/bulk/   {"internships": [3, 7, 9]}   (intern only)
+        -> {"created": 2, "results": [{"internship": 3,
+                                       "result": "created" | "exists"
+                                                 | "not_found" | "closed",
+                                       "application": {...} | null}, …]}
+
+    A constant number of queries however many ids are sent (max 50); see
+    internships.applications.apply_many. Idempotency-Key is honoured.
+    """
+
+    serializer_class = MyApplicationSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    max_batch = 50
+
+    def post(self, request, *args, **kwargs):
+        if request.user.role != User.Role.INTERN:
+            raise PermissionDenied("Only intern accounts can apply.")
+        ids = request.data.get("internships")
+        if (
+            not isinstance(ids, list)
+            or not ids
+            or not all(isinstance(pk, int) and not isinstance(pk, bool) for pk in ids)
+        ):
+            raise ValidationError({"internships": "Expected a list of internship ids."})
+        if len(ids) > self.max_batch:
+            raise ValidationError(
+                {"internships": f"At most {self.max_batch} internships per request."}
+            )
+
+        applications, created, unknown, closed = apply_many(ids, request.user.pk)
+        created = set(created)
+        missing = {
+            **dict.fromkeys(unknown, "not_found"),
+            **dict.fromkeys(closed, "closed"),
+        }
+        results = []
+        for pk in dict.fromkeys(ids):
+            if pk in missing:
+                results.append(
+                    {"internship": pk, "result": missing[pk], "application": None}
+                )
+                continue
+            results.append(
+                {
+                    "internship": pk,
+                    "result": "created" if pk in created else "exists",
+                    "application": self.get_serializer(applications[pk]).data,
+                }
+            )
+        return Response({"created": len(created), "results": results})
 
 
 # **New:** List all applications for a specific internship (employer-only)
 class ApplicationList(generics.ListAPIView):
+    """
+    GET /api/internships/<id>/applications/            (owning employer only)
+    GET /api/internships/<id>/applications/?status=pending,accepted
+        -> cursor pages of applicants, newest first
+
+    The first page also carries `totals`: applicants per status for the
+    whole listing (for the tab badges). Ownership is part of every query's
+    WHERE clause rather than a separate probe.
+    """
+
     serializer_class = ApplicationSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = ApplicantPagination
 
-    def get_queryset(self):
-        # Must be an authenticated employer
-        if (
-            not self.request.user.is_authenticated
-            or self.request.user.role != User.Role.EMPLOYER
-        ):
+    def _owned(self):
+        if self.request.user.role != User.Role.EMPLOYER:
             raise PermissionDenied(
                 "Only authenticated employers can view applications."
             )
-        try:
-            employer = self.request.user.employer
-        except Employer.DoesNotExist:
-            raise PermissionDenied("No employer profile found for this user.")
-        internship_id = self.kwargs["pk"]
-        # Ensure the internship belongs to this employer
-        Internship.objects.get(
-            id=internship_id, employer=employer
-        )  # will raise DoesNotExist if not owned
-        # Return all applications for the internship
-        return Application.objects.filter(internship_id=internship_id).select_related(
-            "intern"
+        return Application.objects.filter(
+            internship_id=self.kwargs["pk"],
+            internship__employer__user=self.request.user,
+            internship__deleted_at__isnull=True,
         )
 
+    def get_queryset(self):
+        qs = self._owned()
+        statuses = [
+            s.strip()
+            for s in (self.request.query_params.get("status") or "").split(",")
+        ]
+        statuses = [s for s in statuses if s]
+        if statuses:
+            unknown = set(statuses) - set(Application.Status.values)
+            if unknown:
+                raise ValidationError({"status": f"Unknown status: {sorted(unknown)}"})
+            qs = qs.filter(status__in=statuses)
+        # Embedded applicant profiles: 1 join + 2 prefetches per page
+        return qs.select_related("intern__profile__availability").prefetch_related(
+            "intern__profile__skills", "intern__profile__educations"
+        )
+
+    def get_totals(self) -> dict:
+        counts = dict(
+            self._owned().order_by().values_list("status").annotate(n=Count("pk"))
+        )
+        totals = {value: counts.get(value, 0) for value in Application.Status.values}
+        totals["all"] = sum(counts.values())
+        return totals
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        if "cursor" not in request.query_params:
+            totals = self.get_totals()
+            if (
+                not totals["all"]
+                and not Internship.objects.filter(
+                    pk=self.kwargs["pk"], employer__user=request.user
+                ).exists()
+            ):
+                # Only an empty result needs telling "none" from "not yours"
+                raise NotFound("Internship not found.")
+            response.data["totals"] = totals
+        return response
+
 
 # **New:** Allow the employer to accept or reject an application by updating its status
 class ApplicationDetail(generics.UpdateAPIView):
@@ -104,3 +528,71 @@ class ApplicationDetail(generics.UpdateAPIView):
     def get_queryset(self):
         # Only allow updates to applications for internships owned by the current employer
         return Application.objects.filter(internship__employer__user=self.request.user)
+
+
+class BulkApplicationStatus(generics.GenericAPIView):
+    """
+    POST /api/applications/status/   (owning employer only)
+        {"accepted": [1, 2], "rejected": [3], "pending": []}
+        -> {"updated": {"accepted": 2, "rejected": 1, "pending": 0},
+            "not_found": [ids not found or not yours]}
+
+    A constant number of queries for any batch size: one ownership check
+    over internship__employer__user, one UPDATE … SET status = CASE id …,
+    and the dashboard rollup adjustment (internships/rollups.py).
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    max_batch = 500
+
+    def _parse(self, data) -> dict:
+        status_of = {}
+        for value in Application.Status.values:
+            ids = data.get(value, [])
+            if not isinstance(ids, list) or not all(
+                isinstance(pk, int) and not isinstance(pk, bool) for pk in ids
+            ):
+                raise ValidationError({value: "Expected a list of application ids."})
+            for pk in ids:
+                if status_of.setdefault(pk, value) != value:
+                    raise ValidationError({"detail": f"Application {pk} listed twice."})
+        if not status_of:
+            raise ValidationError({"detail": "No application ids given."})
+        if len(status_of) > self.max_batch:
+            raise ValidationError(
+                {"detail": f"At most {self.max_batch} applications per request."}
+            )
+        return status_of
+
+    def post(self, request, *args, **kwargs):
+        status_of = self._parse(request.data)
+        with transaction.atomic():
+            current = list(
+                Application.objects.filter(
+                    pk__in=status_of, internship__employer__user=request.user
+                )
+                .select_for_update()
+                .values_list("pk", "internship_id", "status")
+            )
+            owned = [pk for pk, _, _ in current]
+            if owned:
+                Application.objects.filter(pk__in=owned).update(
+                    status=Case(
+                        *[When(pk=pk, then=Value(status_of[pk])) for pk in owned],
+                        default=F("status"),
+                    )
+                )
+                rollups.status_changed(
+                    (internship_id, old, status_of[pk])
+                    for pk, internship_id, old in current
+                )
+        updated = dict.fromkeys(Application.Status.values, 0)
+        for pk in owned:
+            updated[status_of[pk]] += 1
+        owned_set = set(owned)
+        return Response(
+            {
+                "updated": updated,
+                "not_found": [pk for pk in status_of if pk not in owned_set],
+            }
+        )
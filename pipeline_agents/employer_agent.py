@@ -7,6 +7,9 @@ Employer-side assistant that can:
 • Create, update or delete internship listings
 • List applicants for a listing
 • Tell the front-end to change pages
+
+The tools are compiled once at import (registry.py); the employer's email
+reaches them per call through ``ctx.context``.
 """
 
 from __future__ import annotations
@@ -14,15 +17,17 @@ from __future__ import annotations
 import json
 from datetime import datetime
 
-from agents import Agent, function_tool, set_default_openai_client
+from agents import RunContextWrapper, function_tool, set_default_openai_client
 from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
 from django.db import transaction
 
 import employers.tools as _e
+from accounts.deletion import schedule_deletion
 from employers.models import Employer
 from internships.models import Internship
 from pipeline_agents.openai_client import client as async_client
+from pipeline_agents.registry import ToolContext, compile_agent
 
 User = get_user_model()
 
@@ -104,115 +109,110 @@ def _delete_listing_sync(user_email: str, listing_id: int) -> str:
     listing = Internship.objects.get(id=listing_id, employer=employer)
 
     snap = {"id": listing.id, "title": listing.title}
-    listing.delete()
+    # Hidden now; applications are removed in the background
+    schedule_deletion(listing, requested_by=user)
     return json.dumps(snap, default=str)
 
 
 # ─────────────────── FunctionTool: company-profile update ────────────────────
-def _company_fields_tool_for(user_email: str):
-    _KEY_MAP = {
-        "name": "company_name",
-        "companyName": "company_name",
-        "company_name": "company_name",
-        "mission": "mission",
-        "missionStatement": "mission",
-        "mission_statement": "mission",
-        "location": "location",
-        "website": "website",
-    }
-
-    @function_tool
-    async def set_company_fields_v1(*, payload_json: str | None = None) -> str:
-        if not payload_json or payload_json.strip() in ("{}", "null", ""):
-            return "no_changes"
-
-        raw = json.loads(payload_json)
-        data = {_KEY_MAP[k]: v for k, v in raw.items() if k in _KEY_MAP}
-        if not data:
-            return "no_changes"
-
-        saved = await sync_to_async(_save_company_sync, thread_sensitive=True)(
-            user_email, data
-        )
-        from django.conf import settings
-
-        result = "company_profile_updated"
-        if settings.DEBUG:
-            result += f" | saved={saved}"
-        return result
-
-    return _equip_openai_schema(set_company_fields_v1)
-
+_COMPANY_KEY_MAP = {
+    "name": "company_name",
+    "companyName": "company_name",
+    "company_name": "company_name",
+    "mission": "mission",
+    "missionStatement": "mission",
+    "mission_statement": "mission",
+    "location": "location",
+    "website": "website",
+}
+
+
+@function_tool
+async def set_company_fields_v1(
+    ctx: RunContextWrapper[ToolContext], *, payload_json: str | None = None
+) -> str:
+    if not payload_json or payload_json.strip() in ("{}", "null", ""):
+        return "no_changes"
+
+    raw = json.loads(payload_json)
+    data = {_COMPANY_KEY_MAP[k]: v for k, v in raw.items() if k in _COMPANY_KEY_MAP}
+    if not data:
+        return "no_changes"
+
+    saved = await sync_to_async(_save_company_sync, thread_sensitive=True)(
+        ctx.context.user_email, data
+    )
+    from django.conf import settings
 
-# ─────────────────── FunctionTool: listing create / update ───────────────────
-def _listing_fields_tool_for(user_email: str):
-    @function_tool
-    async def set_internship_fields_v1(*, payload_json: str | None = None) -> str:
-        if not payload_json or payload_json.strip() in ("{}", "null", ""):
-            return "no_changes"
+    result = "company_profile_updated"
+    if settings.DEBUG:
+        result += f" | saved={saved}"
+    return result
 
-        data = _e.InternshipPayload.model_validate_json(payload_json).model_dump(
-            exclude_none=True
-        )
-        listing_id = data.get("id")
-        if listing_id and len(data) == 1:
-            return "no_changes"
 
-        snap, created = await sync_to_async(_save_listing_sync, thread_sensitive=True)(
-            user_email, data, listing_id
-        )
-        from django.conf import settings
+# ─────────────────── FunctionTool: listing create / update ───────────────────
+@function_tool
+async def set_internship_fields_v1(
+    ctx: RunContextWrapper[ToolContext], *, payload_json: str | None = None
+) -> str:
+    if not payload_json or payload_json.strip() in ("{}", "null", ""):
+        return "no_changes"
+
+    data = _e.InternshipPayload.model_validate_json(payload_json).model_dump(
+        exclude_none=True
+    )
+    listing_id = data.get("id")
+    if listing_id and len(data) == 1:
+        return "no_changes"
 
-        result = "listing_created" if created else "listing_updated"
-        if settings.DEBUG:
-            result += f" | saved={snap}"
-        return result
+    snap, created = await sync_to_async(_save_listing_sync, thread_sensitive=True)(
+        ctx.context.user_email, data, listing_id
+    )
+    from django.conf import settings
 
-    return _equip_openai_schema(set_internship_fields_v1)
+    result = "listing_created" if created else "listing_updated"
+    if settings.DEBUG:
+        result += f" | saved={snap}"
+    return result
 
 
 # ─────────────────── FunctionTool: list applicants ───────────────────
-def _listing_applicants_tool_for(user_email: str):
-    @function_tool
-    async def list_applicants_v1(*, listing_id: int) -> str:
-        apps = await sync_to_async(_list_applicants_sync, thread_sensitive=True)(
-            user_email, listing_id
-        )
-        from django.conf import settings
-
-        result = "applicants_listed"
-        if settings.DEBUG:
-            result += f" | applications={apps}"
-        return result
+@function_tool
+async def list_applicants_v1(
+    ctx: RunContextWrapper[ToolContext], *, listing_id: int
+) -> str:
+    apps = await sync_to_async(_list_applicants_sync, thread_sensitive=True)(
+        ctx.context.user_email, listing_id
+    )
+    from django.conf import settings
 
-    return _equip_openai_schema(list_applicants_v1)
+    result = "applicants_listed"
+    if settings.DEBUG:
+        result += f" | applications={apps}"
+    return result
 
 
 # ─────────────────── FunctionTool: delete listing ───────────────────
-def _listing_delete_tool_for(user_email: str):
-    @function_tool
-    async def delete_internship_v1(*, listing_id: int) -> str:
-        snap = await sync_to_async(_delete_listing_sync, thread_sensitive=True)(
-            user_email, listing_id
-        )
-        from django.conf import settings
-
-        result = "listing_deleted"
-        if settings.DEBUG:
-            result += f" | deleted={snap}"
-        return result
+@function_tool
+async def delete_internship_v1(
+    ctx: RunContextWrapper[ToolContext], *, listing_id: int
+) -> str:
+    snap = await sync_to_async(_delete_listing_sync, thread_sensitive=True)(
+        ctx.context.user_email, listing_id
+    )
+    from django.conf import settings
 
-    return _equip_openai_schema(delete_internship_v1)
+    result = "listing_deleted"
+    if settings.DEBUG:
+        result += f" | deleted={snap}"
+    return result
 
 
 # ─────────────────── FunctionTool: front-end navigation ───────────────────
-def _navigate_tool():
-    @function_tool
-    async def navigate_to_v1(*, path: str) -> str:
-        print(f"[AGENT NAVIGATE] → {path}")
-        return "ok"
-
-    return _equip_openai_schema(navigate_to_v1)
+@function_tool
+async def navigate_to_v1(*, path: str) -> str:
+    print(f"[AGENT NAVIGATE] → {path}")
+    return "ok"
 
 
 # ───────────────────────────── system prompt ─────────────────────────────
@@ -280,18 +280,17 @@ Ready to assist!
 """
 
 
-# ───────────────────────────── Agent factory ─────────────────────────────
-def build_employer_agent(*, user_email: str) -> Agent:
-    set_default_openai_client(async_client)
-    return Agent(
-        name="Employer Assistant",
-        instructions=_SYSTEM_INSTRUCTIONS,
-        model="gpt-4o",
-        tools=[
-            _company_fields_tool_for(user_email),
-            _listing_fields_tool_for(user_email),
-            _listing_applicants_tool_for(user_email),
-            _listing_delete_tool_for(user_email),
-            _navigate_tool(),
-        ],
-    )
+# ───────────────── Agent (compiled once; user bound per call) ─────────────────
+set_default_openai_client(async_client)
+
+EMPLOYER_AGENT = compile_agent(
+    name="Employer Assistant",
+    instructions=_SYSTEM_INSTRUCTIONS,
+    tools=[
+        _equip_openai_schema(set_company_fields_v1),
+        _equip_openai_schema(set_internship_fields_v1),
+        _equip_openai_schema(list_applicants_v1),
+        _equip_openai_schema(delete_internship_v1),
+        _equip_openai_schema(navigate_to_v1),
+    ],
+)
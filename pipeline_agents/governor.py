@@ -0,0 +1,271 @@
+# pipeline_agents/governor.py
+"""
+Concurrency governor for upstream OpenAI calls.
+
+Every call to OpenAI (the shared AsyncOpenAI client in openai_client.py and
+the sync client behind voice.views._get_client) runs inside a *slot*:
+
+    async with governor.aslot(governor.INTERACTIVE):      # async callers
+        stream = await client.chat.completions.create(...)
+    with governor.slot(governor.TTS):                     # sync callers
+        speech = client.audio.speech.create(...)
+
+• Classes, highest priority first: INTERACTIVE (chat turns, speech-to-text
+  for a user who is waiting), TTS, BATCH (background / management work).
+• A call may start when its class is under its budget
+  (LLM_CLASS_CONCURRENCY), all classes together are under
+  LLM_MAX_CONCURRENCY, and no higher-priority class has a call waiting – so
+  a burst of TTS never takes a slot a chat turn is queued for.
+• A call that can't start waits (polling with backoff) until its class's
+  LLM_QUEUE_TIMEOUT, then raises `Overloaded` (views answer 503; a chat
+  turn's stage-2 stream, already inside its 200 response, ends with an
+  error line instead – see streaming.py).
+• Redis cache (prod): slots and waiters are sorted sets scored by expiry,
+  checked and taken in one Lua script, so the limits hold across every
+  worker and a crashed worker's slots lapse after LEASE_SECONDS. Any other
+  cache (dev / tests): the same bookkeeping in-process behind a lock.
+• Metrics (`GET /api/metrics/`): ``llm.<class>.queued`` / ``.running``
+  gauges, and ``.acquired`` / ``.wait_ms`` / ``.timeouts`` counters.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from typing import Dict, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.redis import RedisCache
+
+from backend import metrics
+
+INTERACTIVE = "interactive"
+TTS = "tts"
+BATCH = "batch"
+PRIORITY = (INTERACTIVE, TTS, BATCH)  # highest first
+
+LEASE_SECONDS = 300  # a slot outlives its holder by at most this long
+POLL_MIN, POLL_MAX = 0.05, 0.5
+
+
+class Overloaded(Exception):
+    """No slot freed up before the class's queue timeout."""
+
+
+def _budget(kind: str) -> int:
+    return settings.LLM_CLASS_CONCURRENCY[kind]
+
+
+def _higher(kind: str) -> Tuple[str, ...]:
+    return PRIORITY[: PRIORITY.index(kind)]
+
+
+# ───────────────────────── backends ─────────────────────────
+_ACQUIRE_LUA = """
+-- KEYS: all running, running[kind], waiting[kind], waiting[higher]...
+-- ARGV: token, now, lease_until, wait_until, budget, total
+local now = tonumber(ARGV[2])
+local function live(key)
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now)
+    return redis.call('ZCARD', key)
+end
+local free = live(KEYS[2]) < tonumber(ARGV[5])
+    and live(KEYS[1]) < tonumber(ARGV[6])
+for i = 4, #KEYS do
+    if live(KEYS[i]) > 0 then free = false end
+end
+if free then
+    redis.call('ZADD', KEYS[1], ARGV[3], ARGV[1])
+    redis.call('ZADD', KEYS[2], ARGV[3], ARGV[1])
+    redis.call('ZREM', KEYS[3], ARGV[1])
+    return 1
+end
+redis.call('ZADD', KEYS[3], ARGV[4], ARGV[1])
+return 0
+"""
+
+
+class _RedisBackend:
+    def __init__(self, client):
+        self.client = client
+        self.script = client.register_script(_ACQUIRE_LUA)
+
+    @staticmethod
+    def _key(*parts: str) -> str:
+        return cache.make_key(":".join(("llm", "governor", *parts)))
+
+    def try_acquire(self, kind, token, now, wait_until) -> bool:
+        keys = [
+            self._key("running"),
+            self._key("running", kind),
+            self._key("waiting", kind),
+            *(self._key("waiting", k) for k in _higher(kind)),
+        ]
+        args = [
+            token,
+            now,
+            now + LEASE_SECONDS,
+            wait_until,
+            _budget(kind),
+            settings.LLM_MAX_CONCURRENCY,
+        ]
+        return bool(self.script(keys=keys, args=args))
+
+    def release(self, kind, token) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        pipe.zrem(self._key("running"), token)
+        pipe.zrem(self._key("running", kind), token)
+        pipe.execute()
+
+    def forget(self, kind, token) -> None:
+        self.client.zrem(self._key("waiting", kind), token)
+
+    def count(self, state: str, kind: str) -> int:
+        return self.client.zcount(self._key(state, kind), time.time(), "+inf")
+
+
+class _LocalBackend:
+    def __init__(self):
+        self.lock = threading.Lock()
+        # state -> kind -> token -> expiry
+        self.sets: Dict[str, Dict[str, Dict[str, float]]] = {
+            state: {kind: {} for kind in PRIORITY} for state in ("running", "waiting")
+        }
+
+    def _live(self, state, kind, now) -> Dict[str, float]:
+        entries = self.sets[state][kind]
+        for token in [t for t, until in entries.items() if until <= now]:
+            del entries[token]
+        return entries
+
+    def try_acquire(self, kind, token, now, wait_until) -> bool:
+        with self.lock:
+            running = self._live("running", kind, now)
+            total = sum(len(self._live("running", k, now)) for k in PRIORITY)
+            free = (
+                len(running) < _budget(kind)
+                and total < settings.LLM_MAX_CONCURRENCY
+                and not any(self._live("waiting", k, now) for k in _higher(kind))
+            )
+            if free:
+                running[token] = now + LEASE_SECONDS
+                self.sets["waiting"][kind].pop(token, None)
+            else:
+                self.sets["waiting"][kind][token] = wait_until
+            return free
+
+    def release(self, kind, token) -> None:
+        with self.lock:
+            self.sets["running"][kind].pop(token, None)
+
+    def forget(self, kind, token) -> None:
+        with self.lock:
+            self.sets["waiting"][kind].pop(token, None)
+
+    def count(self, state: str, kind: str) -> int:
+        with self.lock:
+            return len(self._live(state, kind, time.time()))
+
+
+_local = _LocalBackend()
+_redis_backend: _RedisBackend | None = None
+
+
+def _backend():
+    global _redis_backend
+    backend = caches["default"]  # `cache` is a ConnectionProxy, never a RedisCache
+    if not isinstance(backend, RedisCache):
+        return _local
+    if _redis_backend is None:
+        _redis_backend = _RedisBackend(backend._cache.get_client(write=True))
+    return _redis_backend
+
+
+# ───────────────────────── slots ─────────────────────────
+def _begin(kind: str) -> Tuple[str, float, float]:
+    if kind not in PRIORITY:
+        raise ValueError(f"Unknown LLM call class {kind!r}")
+    started = time.monotonic()
+    return uuid.uuid4().hex, started, started + settings.LLM_QUEUE_TIMEOUT[kind]
+
+
+def _attempt(kind: str, token: str, deadline: float) -> bool:
+    now = time.time()
+    return _backend().try_acquire(kind, token, now, now + (deadline - time.monotonic()))
+
+
+def _acquired(kind: str, started: float) -> None:
+    metrics.incr(f"llm.{kind}.acquired")
+    metrics.incr(f"llm.{kind}.wait_ms", int((time.monotonic() - started) * 1000))
+
+
+def _give_up(kind: str, token: str, timed_out: bool) -> None:
+    # Leave the queue now, not when the entry expires: a stale waiter would
+    # keep holding back every lower-priority class.
+    _backend().forget(kind, token)
+    if timed_out:
+        metrics.incr(f"llm.{kind}.timeouts")
+
+
+def _overloaded(kind: str) -> Overloaded:
+    return Overloaded(f"No upstream capacity for {kind} calls, try again shortly.")
+
+
+@contextmanager
+def slot(kind: str):
+    """Hold one upstream slot of class ``kind`` (blocking; sync callers)."""
+    token, started, deadline = _begin(kind)
+    delay = POLL_MIN
+    try:
+        while not _attempt(kind, token, deadline):
+            if time.monotonic() + delay > deadline:
+                raise _overloaded(kind)
+            time.sleep(delay)
+            delay = min(delay * 2, POLL_MAX)
+    except BaseException as exc:
+        _give_up(kind, token, isinstance(exc, Overloaded))
+        raise
+    _acquired(kind, started)
+    try:
+        yield
+    finally:
+        _backend().release(kind, token)
+
+
+@asynccontextmanager
+async def aslot(kind: str):
+    """`slot` for coroutines: waiting yields to the event loop."""
+    token, started, deadline = _begin(kind)
+    attempt = sync_to_async(_attempt, thread_sensitive=False)
+    delay = POLL_MIN
+    try:
+        while not await attempt(kind, token, deadline):
+            if time.monotonic() + delay > deadline:
+                raise _overloaded(kind)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, POLL_MAX)
+    except BaseException as exc:  # incl. CancelledError (client went away)
+        await sync_to_async(_give_up, thread_sensitive=False)(
+            kind, token, isinstance(exc, Overloaded)
+        )
+        raise
+    await sync_to_async(_acquired, thread_sensitive=False)(kind, started)
+    try:
+        yield
+    finally:
+        await sync_to_async(_backend().release, thread_sensitive=False)(kind, token)
+
+
+for _kind in PRIORITY:
+    for _name in ("acquired", "wait_ms", "timeouts"):
+        metrics.register_counter(f"llm.{_kind}.{_name}")
+    for _state, _label in (("waiting", "queued"), ("running", "running")):
+        metrics.register_gauge(
+            f"llm.{_kind}.{_label}",
+            lambda state=_state, kind=_kind: _backend().count(state, kind),
+        )
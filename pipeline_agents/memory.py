@@ -0,0 +1,175 @@
+# pipeline_agents/memory.py
+"""
+Token-budgeted chat history for the agent endpoints.
+
+A turn's prompt is the stored rolling summary (ConversationSummary) of the
+user's chat with that agent, followed by their most recent messages with it
+verbatim, newest first until AGENT_HISTORY_TOKEN_BUDGET estimated tokens
+are used.
+
+• `load_window(user, agent_type, before_id=…)` reads the summary row and at
+  most AGENT_HISTORY_MAX_MESSAGES messages after its checkpoint – one range
+  scan of `agentmessage_history_idx` – whatever the length of the chat.
+• Messages past the checkpoint that are not in the window – over the
+  budget, or beyond the rows read – are *stale*. Only then – when the
+  window has slid – `fold(user, window)` pages through them from the
+  checkpoint forward, oldest first, FOLD_PAGE at a time: gpt-4o-mini merges
+  each page into the summary and the checkpoint moves past it, until it
+  reaches the window. The agent views run it detached, after the reply has
+  been streamed and the user's lock released, in a BATCH governor slot; if
+  it fails, the next turn simply tries again.
+• The checkpoint moves with a conditional UPDATE, so two folds racing on
+  the same window can't apply the same messages twice.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import List
+
+from django.conf import settings
+from django.db import IntegrityError
+from django.db.models import F
+from django.utils import timezone
+
+from pipeline_agents import governor
+from pipeline_agents.openai_client import client
+from profiles.models import AgentMessage, ConversationSummary
+
+log = logging.getLogger(__name__)
+
+SUMMARY_MODEL = "gpt-4o-mini"
+FOLD_PAGE = 50  # messages merged into the summary per call
+
+_SUMMARY_INSTRUCTIONS = """
+You maintain the running summary of a chat between a user and a career
+assistant. Merge the new messages into the current summary. Keep every fact
+the assistant may need later (names, preferences, decisions, data already
+saved, open questions); drop small talk. Reply with the updated summary
+only, at most 200 words.
+""".strip()
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token plus per-message overhead)."""
+    return len(text) // 4 + 4
+
+
+@dataclass
+class Window:
+    agent_type: str
+    summary: str = ""
+    through_id: int = 0  # checkpoint the summary was read at; 0 = none yet
+    messages: List[AgentMessage] = field(default_factory=list)  # verbatim
+    # Messages after the checkpoint and before this id are stale (in neither
+    # the summary nor the window); 0 = nothing to fold.
+    fold_before_id: int = 0
+
+
+async def load_window(user, agent_type: str, *, before_id: int) -> Window:
+    """History for a turn whose own message is ``before_id`` (oldest first)."""
+    checkpoint = await ConversationSummary.objects.filter(
+        user=user, agent_type=agent_type
+    ).afirst()
+    window = Window(agent_type=agent_type)
+    if checkpoint is not None:
+        window.summary = checkpoint.content
+        window.through_id = checkpoint.through_message_id
+
+    recent = [
+        m
+        async for m in AgentMessage.objects.filter(
+            user=user,
+            agent_type=agent_type,
+            id__gt=window.through_id,
+            id__lt=before_id,
+        ).order_by("-created_at", "-id")[: settings.AGENT_HISTORY_MAX_MESSAGES]
+    ]
+    budget, kept = settings.AGENT_HISTORY_TOKEN_BUDGET, 0
+    for message in recent:
+        budget -= estimate_tokens(message.content)
+        if budget < 0:
+            break
+        kept += 1
+    window.messages = recent[:kept][::-1]
+    if kept < len(recent) or len(recent) == settings.AGENT_HISTORY_MAX_MESSAGES:
+        window.fold_before_id = window.messages[0].id if kept else before_id
+    return window
+
+
+async def _summarise(summary: str, messages: List[AgentMessage]) -> str:
+    transcript = "\n".join(
+        f"{'User' if m.role == AgentMessage.Role.USER else 'Assistant'}: {m.content}"
+        for m in messages
+    )
+    async with governor.aslot(governor.BATCH):
+        response = await client.chat.completions.create(
+            model=SUMMARY_MODEL,
+            messages=[
+                {"role": "system", "content": _SUMMARY_INSTRUCTIONS},
+                {
+                    "role": "user",
+                    "content": f"Current summary:\n{summary or '(none)'}"
+                    f"\n\nNew messages:\n{transcript}",
+                },
+            ],
+        )
+    return (response.choices[0].message.content or "").strip()
+
+
+async def _advance(
+    user, agent_type: str, through_id: int, page: List[AgentMessage], content: str
+) -> bool:
+    """Move the checkpoint from ``through_id`` past ``page``; False if it had moved."""
+    if through_id:
+        return bool(
+            await ConversationSummary.objects.filter(
+                user=user, agent_type=agent_type, through_message_id=through_id
+            ).aupdate(
+                content=content,
+                through_message_id=page[-1].id,
+                messages_summarized=F("messages_summarized") + len(page),
+                updated_at=timezone.now(),
+            )
+        )
+    try:
+        await ConversationSummary.objects.acreate(
+            user=user,
+            agent_type=agent_type,
+            content=content,
+            through_message_id=page[-1].id,
+            messages_summarized=len(page),
+        )
+    except IntegrityError:  # another turn created the first summary meanwhile
+        return False
+    return True
+
+
+async def fold(user, window: Window) -> None:
+    """
+    Merge every stale message into the stored summary, oldest first, a page
+    at a time (best effort, never raises).
+    """
+    if not window.fold_before_id:
+        return
+    summary, through_id = window.summary, window.through_id
+    try:
+        while True:
+            page = [
+                m
+                async for m in AgentMessage.objects.filter(
+                    user=user,
+                    agent_type=window.agent_type,
+                    id__gt=through_id,
+                    id__lt=window.fold_before_id,
+                ).order_by("id")[:FOLD_PAGE]
+            ]
+            if not page:
+                return
+            content = await _summarise(summary, page)
+            if not await _advance(user, window.agent_type, through_id, page, content):
+                return  # a concurrent fold got there first
+            summary, through_id = content, page[-1].id
+    except Exception:
+        log.exception("Summarising chat history for %s failed", user.pk)
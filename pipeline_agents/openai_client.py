@@ -3,7 +3,9 @@
 Shared AsyncOpenAI client (singleton).
 
 Import `client` wherever you need OpenAI calls to avoid the 150-250 ms
-cold-init penalty on every request.
+cold-init penalty on every request. Make each call inside a
+`pipeline_agents.governor.aslot(...)` so it counts against the shared
+upstream concurrency budget.
 """
 
 from openai import AsyncOpenAI
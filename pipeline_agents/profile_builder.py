@@ -5,6 +5,8 @@ Profile-Builder agent (incremental save + live console prints).
 • Prints RAW / SAVED / ERROR for every tool call so you can watch changes
   live in the dev-server console.
 • Executes all Django ORM work inside `sync_to_async`, so no async-context errors.
+• Tools are module-level and compiled once (registry.py); the caller's email
+  arrives per call in ``ctx.context`` (a `ToolContext`).
 """
 
 from __future__ import annotations
@@ -12,7 +14,7 @@ from __future__ import annotations
 import json
 from typing import Any, Mapping
 
-from agents import Agent, function_tool, set_default_openai_client
+from agents import RunContextWrapper, function_tool, set_default_openai_client
 from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
 from django.db import transaction
@@ -22,6 +24,7 @@ import profiles.tools as _p  # headline/bio validators, Pydantic model, serializ
 
 # ── shared singleton AsyncOpenAI client ────────────────────────
 from pipeline_agents.openai_client import client as async_client
+from pipeline_agents.registry import ToolContext, compile_agent
 from profiles.models import Skill
 
 # ───────────────────────────────────────────────────────────────
@@ -91,61 +94,50 @@ def _save_profile_sync(user_email: str, data: dict) -> str:
 # ───────────────────────────────────────────────────────────────
 # FunctionTool: set_profile_fields_v1
 # ───────────────────────────────────────────────────────────────
-def _profile_fields_tool_for(user_email: str):
-    """Return the profile-saving FunctionTool, customised per user."""
-
-    @function_tool
-    async def set_profile_fields_v1(
-        *, payload_json: str | None = None
-    ) -> str:  # noqa: N802
-        # Ignore empty / no-op calls the model sometimes emits
-        if not payload_json or payload_json.strip() in ("{}", "null", ""):
-            return "no_changes"
-
-        print(
-            f"[AGENT TOOL - RAW   ] {user_email}: {payload_json.replace(chr(10), ' ')}"
-        )
+@function_tool
+async def set_profile_fields_v1(
+    ctx: RunContextWrapper[ToolContext], *, payload_json: str | None = None
+) -> str:  # noqa: N802
+    # Ignore empty / no-op calls the model sometimes emits
+    if not payload_json or payload_json.strip() in ("{}", "null", ""):
+        return "no_changes"
 
-        try:
-            data = ProfilePayload.model_validate_json(payload_json).model_dump(
-                exclude_none=True
-            )
-            saved_json = await sync_to_async(_save_profile_sync, thread_sensitive=True)(
-                user_email, data
-            )
-            print(f"[AGENT TOOL - SAVED ] {user_email}: {saved_json}")
+    user_email = ctx.context.user_email
+    print(f"[AGENT TOOL - RAW   ] {user_email}: {payload_json.replace(chr(10), ' ')}")
 
-            from django.conf import settings
+    try:
+        data = ProfilePayload.model_validate_json(payload_json).model_dump(
+            exclude_none=True
+        )
+        saved_json = await sync_to_async(_save_profile_sync, thread_sensitive=True)(
+            user_email, data
+        )
+        print(f"[AGENT TOOL - SAVED ] {user_email}: {saved_json}")
 
-            return (
-                f"profile_updated | saved={saved_json}"
-                if settings.DEBUG
-                else "profile_updated"
-            )
+        from django.conf import settings
 
-        except Exception as exc:  # pragma: no cover
-            print(f"[AGENT TOOL - ERROR ] {user_email}: {exc}")
-            raise
+        return (
+            f"profile_updated | saved={saved_json}"
+            if settings.DEBUG
+            else "profile_updated"
+        )
 
-    return _equip_openai_schema(set_profile_fields_v1)
+    except Exception as exc:  # pragma: no cover
+        print(f"[AGENT TOOL - ERROR ] {user_email}: {exc}")
+        raise
 
 
 # ───────────────────────────────────────────────────────────────
 # FunctionTool: navigate_to_v1   (UI page change)
 # ───────────────────────────────────────────────────────────────
-def _navigate_tool():
-    """Tool that instructs the front-end to navigate to another page."""
-
-    @function_tool
-    async def navigate_to_v1(*, path: str) -> str:  # noqa: N802
-        """
-        Tell the browser to change to a relative URL, e.g. "/profile".
-        """
-        print(f"[AGENT NAVIGATE     ] → {path}")
-        # The server just acknowledges; the client listens for the navigate packet.
-        return "ok"
-
-    return _equip_openai_schema(navigate_to_v1)
+@function_tool
+async def navigate_to_v1(*, path: str) -> str:  # noqa: N802
+    """
+    Tell the browser to change to a relative URL, e.g. "/profile".
+    """
+    print(f"[AGENT NAVIGATE     ] → {path}")
+    # The server just acknowledges; the client listens for the navigate packet.
+    return "ok"
 
 
 # ───────────────────────────────────────────────────────────────
@@ -240,18 +232,15 @@ Work through the five sections **in order**.
 
 
 # ───────────────────────────────────────────────────────────────
-# Factory
+# Agent (compiled once at import; the user is bound per call)
 # ───────────────────────────────────────────────────────────────
-def build_profile_builder_agent(*, user_email: str) -> Agent:
-    """Return a ready-to-run Agent that re-uses the shared AsyncOpenAI client."""
-    set_default_openai_client(async_client)
-
-    return Agent(
-        name="Profile Builder",
-        instructions=_SYSTEM_INSTRUCTIONS,
-        model="gpt-4o",
-        tools=[
-            _profile_fields_tool_for(user_email),
-            _navigate_tool(),
-        ],
-    )
+set_default_openai_client(async_client)
+
+PROFILE_BUILDER_AGENT = compile_agent(
+    name="Profile Builder",
+    instructions=_SYSTEM_INSTRUCTIONS,
+    tools=[
+        _equip_openai_schema(set_profile_fields_v1),
+        _equip_openai_schema(navigate_to_v1),
+    ],
+)
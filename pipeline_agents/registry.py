@@ -0,0 +1,154 @@
+# pipeline_agents/registry.py
+"""
+Agent tool registry, compiled once at import.
+
+• Tools are module-level `function_tool`s whose first parameter is
+  ``ctx: RunContextWrapper[ToolContext]``; per-user data (the caller's
+  email) arrives in ``ctx.context`` at call time instead of through a
+  closure, so nothing is re-decorated per request.
+• `compile_agent(...)` resolves every tool's OpenAI schema and invocation
+  adapter up front and returns a frozen `CompiledAgent`; a chat turn only
+  looks things up by name (pipeline_agents/streaming.py).
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Sequence
+
+from agents import RunContextWrapper
+
+
+@dataclass(frozen=True)
+class ToolContext:
+    """Per-turn data tools need; bound when the tool is invoked."""
+
+    user_email: str
+
+
+# ───────────────────────── schema ─────────────────────────
+def _maybe_call(attr):
+    if callable(attr):
+        try:
+            if len(inspect.signature(attr).parameters) == 0:
+                return attr()
+        except Exception:  # pragma: no cover
+            pass
+    return attr
+
+
+def extract_tool_schema(tool) -> Dict:
+    """Extract the OpenAI function schema from a FunctionTool (any SDK version)."""
+    for name in (
+        "openai_schema",
+        "schema",
+        "_schema",
+        "function_schema",
+        "to_openai_schema",
+        "to_openai",
+        "json_schema",
+        "as_openai_schema",
+    ):
+        if hasattr(tool, name):
+            obj = _maybe_call(getattr(tool, name))
+            if isinstance(obj, dict):
+                return obj
+
+    if hasattr(tool, "params_json_schema"):
+        return {
+            "type": "function",
+            "function": {
+                "name": getattr(tool, "name", "unnamed_tool"),
+                "description": getattr(tool, "description", "") or "",
+                "parameters": tool.params_json_schema,
+            },
+        }
+    if hasattr(tool, "model_dump"):
+        return tool.model_dump()
+
+    raise AttributeError("Unable to locate schema on FunctionTool")
+
+
+# ───────────────────────── invocation ─────────────────────────
+Invoker = Callable[[ToolContext, Dict | str], Awaitable[str]]
+
+
+def _invoker_for(tool) -> Invoker:
+    """Work out once how ``tool.on_invoke_tool`` wants to be called."""
+    fn = tool.on_invoke_tool
+    sig = inspect.signature(fn)
+
+    pos_params = [
+        p
+        for p in sig.parameters.values()
+        if p.kind
+        in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        )
+    ]
+
+    wants_ctx = len(pos_params) == 2 and pos_params[0].name in ("ctx", "context")
+    wants_input = (
+        len(pos_params) == 1 and pos_params[0].name in ("input", "payload_json")
+    ) or (len(pos_params) == 2 and pos_params[1].name in ("input", "payload_json"))
+    wraps_payload = "payload_json" in sig.parameters
+
+    def as_json(raw_args: Dict | str) -> str:
+        if isinstance(raw_args, str):
+            return raw_args
+        return json.dumps(raw_args, separators=(",", ":"))
+
+    if wants_input and wants_ctx:
+
+        async def invoke(context: ToolContext, raw_args: Dict | str) -> str:
+            return await fn(RunContextWrapper(context=context), as_json(raw_args))
+
+    elif wants_input:
+
+        async def invoke(context: ToolContext, raw_args: Dict | str) -> str:
+            return await fn(as_json(raw_args))
+
+    else:
+
+        async def invoke(context: ToolContext, raw_args: Dict | str) -> str:
+            if wraps_payload and "payload_json" not in raw_args:
+                raw_args = {"payload_json": as_json(raw_args)}
+            return await fn(**raw_args)
+
+    return invoke
+
+
+# ───────────────────────── agents ─────────────────────────
+@dataclass(frozen=True)
+class CompiledTool:
+    name: str
+    schema: Dict[str, Any]
+    invoke: Invoker
+
+
+@dataclass(frozen=True)
+class CompiledAgent:
+    name: str
+    instructions: str
+    tools: Dict[str, CompiledTool]
+    schemas: List[Dict[str, Any]]  # the `tools=` list for chat.completions
+
+
+def compile_agent(*, name: str, instructions: str, tools: Sequence) -> CompiledAgent:
+    compiled = {
+        tool.name: CompiledTool(
+            name=tool.name,
+            schema=extract_tool_schema(tool),
+            invoke=_invoker_for(tool),
+        )
+        for tool in tools
+    }
+    return CompiledAgent(
+        name=name,
+        instructions=instructions,
+        tools=compiled,
+        schemas=[t.schema for t in compiled.values()],
+    )
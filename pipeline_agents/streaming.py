@@ -0,0 +1,320 @@
+# pipeline_agents/streaming.py
+"""
+Async streaming of one agent chat turn (shared by the profile-builder and
+employer-assistant endpoints).
+
+• The endpoints are plain async Django views served by ``backend/asgi.py``
+  (uvicorn): a chat turn is a coroutine on the worker's one long-lived
+  event loop – no thread or `asyncio.run()` per request – so the shared
+  AsyncOpenAI client keeps its pooled connections across requests.
+• `authenticate(request)` – simplejwt bearer auth (DRF's APIView is
+  sync-only, so its authentication / throttling are applied by hand).
+• `first_slot()` – the view takes the INTERACTIVE governor slot for the
+  turn's first stream before answering, so `governor.Overloaded` is a 503
+  with Retry-After (`overloaded`), not an error line inside a 200 stream.
+• `stream_turn(...)` – NDJSON response: ``{"delta": …, "done": false}`` per
+  token, then one ``{"done": true, …}`` line with the TTS audio and any
+  view-specific extras. The per-user lock is released when the stream ends
+  or the client disconnects – only if it still holds this turn's token, so
+  a turn that outlived LOCK_TIMEOUT cannot free the next turn's lock.
+• The prompt is the token-budgeted history window from memory.py; when the
+  window has slid, the summary is updated by a detached task once the reply
+  has gone out and the lock is released, so neither waits on it.
+• Agents arrive pre-compiled (registry.py): a turn reuses their cached
+  tool schemas and binds the caller as the tools' context.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import logging
+import uuid
+from contextlib import AsyncExitStack
+from json import JSONDecodeError
+from typing import Any, AsyncIterator, Awaitable, Callable, Coroutine, Dict, List, Set
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.throttling import UserRateThrottle
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from pipeline_agents import governor, memory
+from pipeline_agents.openai_client import client
+from pipeline_agents.registry import CompiledAgent, ToolContext
+from profiles.models import AgentMessage
+
+log = logging.getLogger(__name__)
+
+CONTENT_TYPE = "application/x-ndjson"
+LOCK_TIMEOUT = 300  # well past the slowest turn: two streams, tools, TTS
+
+_detached: Set[asyncio.Task] = set()  # strong refs until each task finishes
+
+
+# ───────────────────────── request helpers ──────────────────────
+async def authenticate(request):
+    """Return the user for a valid ``Authorization: Bearer`` header, else None."""
+    try:
+        result = await sync_to_async(JWTAuthentication().authenticate)(request)
+    except AuthenticationFailed:
+        return None
+    if result is None:
+        return None
+    request.user = result[0]
+    return request.user
+
+
+async def throttled(request) -> bool:
+    """Apply the project-wide per-user rate limit (REST_FRAMEWORK throttles)."""
+    return not await sync_to_async(UserRateThrottle().allow_request)(request, None)
+
+
+def error(detail: str, status: int) -> JsonResponse:
+    return JsonResponse({"detail": detail}, status=status)
+
+
+def overloaded(exc: governor.Overloaded) -> JsonResponse:
+    """503 when the OpenAI concurrency governor had no slot in time."""
+    response = error(str(exc), 503)
+    response["Retry-After"] = "5"
+    return response
+
+
+def read_message(request) -> str:
+    try:
+        data = json.loads(request.body or b"{}")
+    except (JSONDecodeError, UnicodeDecodeError):
+        return ""
+    return (data.get("message") or "").strip() if isinstance(data, dict) else ""
+
+
+def make_prompt(window: memory.Window, latest: str) -> str:
+    """Summary of older turns, the recent messages verbatim, then ``latest``."""
+    lines = [
+        f"{'User' if m.role == 'user' else 'Assistant'}: {m.content}"
+        for m in window.messages
+    ]
+    if window.summary:
+        lines.insert(0, f"Summary of the earlier conversation: {window.summary}")
+    lines.append(f"User: {latest}")
+    return "\n".join(lines)
+
+
+# ───────────────────────── one chat turn ────────────────────────
+async def first_slot() -> AsyncExitStack:
+    """
+    Take the INTERACTIVE slot stage 1 of `run_turn` streams in; raises
+    `governor.Overloaded`. Closing the returned stack frees the slot.
+    """
+    held = AsyncExitStack()
+    await held.enter_async_context(governor.aslot(governor.INTERACTIVE))
+    return held
+
+
+async def run_turn(
+    agent: CompiledAgent, prompt: str, context: ToolContext, held: AsyncExitStack
+) -> AsyncIterator[str | dict]:
+    """
+    Yield reply tokens (str) as they arrive, then a final
+    ``{"reply": …, "had_tool_calls": …}`` dict.
+
+    Stage 1 streams gpt-4o-mini with the agent's tools; if it asks for tool
+    calls they are run and stage 2 streams the answer from gpt-4o. Each
+    stream holds an INTERACTIVE governor slot while it is being read:
+    stage 1 the one ``held`` from `first_slot`, stage 2 its own.
+    Tools get ``context`` (the caller) bound at invocation.
+    """
+    msgs: List[Dict] = [
+        {"role": "system", "content": agent.instructions},
+        {"role": "user", "content": prompt},
+    ]
+    collected: List[str] = []
+    tc_frag: dict[int, dict] = {}
+
+    async with held:
+        stream1 = await client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=msgs,
+            tools=agent.schemas,
+            stream=True,
+        )
+
+        async for chunk in stream1:
+            delta = chunk.choices[0].delta
+
+            if getattr(delta, "tool_calls", None):
+                for part in delta.tool_calls:
+                    entry = tc_frag.setdefault(
+                        part.index, {"id": part.id, "name": None, "arguments": ""}
+                    )
+                    if part.function.name:
+                        entry["name"] = part.function.name
+                    if part.function.arguments:
+                        entry["arguments"] += part.function.arguments
+                continue
+
+            if delta.content:
+                collected.append(delta.content)
+                yield delta.content
+
+    if tc_frag:
+        collected.clear()
+        tool_calls = [frag for _, frag in sorted(tc_frag.items()) if frag["name"]]
+
+        msgs.append(
+            {
+                "role": "assistant",
+                "tool_calls": [
+                    {
+                        "id": t["id"],
+                        "type": "function",
+                        "function": {"name": t["name"], "arguments": t["arguments"]},
+                    }
+                    for t in tool_calls
+                ],
+                "content": None,
+            }
+        )
+
+        for t in tool_calls:
+            fn_name = t["name"]
+            arg_json = t["arguments"] or "{}"
+            try:
+                kwargs = json.loads(arg_json)
+            except JSONDecodeError:
+                kwargs = {"payload_json": arg_json.strip()}
+
+            result = await agent.tools[fn_name].invoke(context, kwargs)
+
+            # ── navigation helper → send as **string token**
+            if fn_name == "navigate_to_v1" and isinstance(kwargs, dict):
+                yield json.dumps({"navigate": kwargs.get("path", "/")})
+
+            msgs.append(
+                {
+                    "role": "tool",
+                    "tool_call_id": t["id"],
+                    "type": "function",
+                    "content": result,
+                }
+            )
+
+        async with governor.aslot(governor.INTERACTIVE):
+            stream2 = await client.chat.completions.create(
+                model="gpt-4o",
+                messages=msgs,
+                stream=True,
+            )
+
+            async for chunk in stream2:
+                tok = chunk.choices[0].delta.content or ""
+                if tok:
+                    collected.append(tok)
+                    yield tok
+
+    yield {"reply": "".join(collected), "had_tool_calls": bool(tc_frag)}
+
+
+async def _speech(reply: str, model: str) -> str | None:
+    try:
+        async with governor.aslot(governor.TTS):
+            speech = await client.audio.speech.create(
+                model=model, voice="alloy", input=reply, response_format="mp3"
+            )
+    except Exception:  # pragma: no cover – incl. governor.Overloaded
+        return None
+    return base64.b64encode(speech.content).decode()
+
+
+def _line(obj: Dict[str, Any]) -> bytes:
+    return json.dumps(obj).encode() + b"\n"
+
+
+async def acquire_lock(lock_key: str) -> str | None:
+    """
+    One reply at a time per user (expires after LOCK_TIMEOUT regardless).
+    Return this turn's token for `release_lock`, or None if a turn is running.
+    """
+    token = uuid.uuid4().hex
+    return token if await cache.aadd(lock_key, token, LOCK_TIMEOUT) else None
+
+
+async def release_lock(lock_key: str, token: str) -> None:
+    """Free ``lock_key`` if it is still held by ``token``."""
+    if await cache.aget(lock_key) == token:
+        await cache.adelete(lock_key)
+
+
+def detach(coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+    """Run ``coro`` on the worker's loop without anyone awaiting it."""
+    task = asyncio.get_running_loop().create_task(coro)
+    _detached.add(task)
+    task.add_done_callback(_detached.discard)
+    return task
+
+
+def stream_turn(
+    *,
+    user,
+    agent: CompiledAgent,
+    window: memory.Window,
+    latest: str,
+    lock_key: str,
+    lock_token: str,
+    held: AsyncExitStack,
+    tts_model: str,
+    extras: Callable[[Any], Awaitable[Dict[str, Any]]] | None = None,
+) -> StreamingHttpResponse:
+    """
+    Stream ``agent``'s reply to ``latest`` (with ``window`` as history) as
+    NDJSON. The caller holds ``lock_key`` with ``lock_token`` (see
+    `acquire_lock`) and the stage-1 slot ``held`` (see `first_slot`); both
+    are released here. ``extras(user)`` is awaited after a turn that used tools
+    and merged into the final line.
+    """
+
+    async def event_stream() -> AsyncIterator[bytes]:
+        answered = False
+        try:
+            async for item in run_turn(
+                agent,
+                make_prompt(window, latest),
+                ToolContext(user_email=user.email),
+                held,
+            ):
+                if isinstance(item, str):
+                    yield _line({"delta": item, "done": False})
+                    continue
+
+                reply: str = item["reply"]
+                audio_b64 = await _speech(reply, tts_model)
+                await AgentMessage.objects.acreate(
+                    user=user,
+                    agent_type=window.agent_type,
+                    role="assistant",
+                    content=reply,
+                )
+
+                payload: Dict[str, object] = {"delta": "", "done": True}
+                if item["had_tool_calls"] and extras is not None:
+                    payload.update(await extras(user))
+                if audio_b64:
+                    payload["audio_base64"] = audio_b64
+                yield _line(payload)
+            answered = True
+        except Exception as exc:
+            log.exception("Agent turn failed: %s", exc)
+            yield _line({"error": str(exc)})
+        finally:
+            await held.aclose()  # no-op unless stage 1 never ran
+            await release_lock(lock_key, lock_token)
+        if answered:
+            # If the window slid, fold what dropped out of it into the
+            # summary – off the response and outside the lock.
+            detach(memory.fold(user, window))
+
+    return StreamingHttpResponse(event_stream(), content_type=CONTENT_TYPE)
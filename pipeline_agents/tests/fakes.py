@@ -0,0 +1,65 @@
+"""An in-memory stand-in for the AsyncOpenAI client the agents call."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from typing import List
+
+
+def text(token: str):
+    """One streamed chunk carrying reply text."""
+    delta = SimpleNamespace(content=token, tool_calls=None)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+def tool_call(name: str, arguments: dict, index: int = 0):
+    """One streamed chunk carrying a complete tool call."""
+    part = SimpleNamespace(
+        index=index,
+        id=f"call_{index}",
+        function=SimpleNamespace(name=name, arguments=json.dumps(arguments)),
+    )
+    delta = SimpleNamespace(content=None, tool_calls=[part])
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+class _Stream:
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self.chunks)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeOpenAI:
+    """
+    Answers chat.completions.create calls in order from ``responses``: a list
+    of chunks for a streamed call, a string for a plain one, an exception to
+    raise. Every call's kwargs are kept in ``calls``.
+    """
+
+    def __init__(self, *responses):
+        self.responses: List = list(responses)
+        self.calls: List[dict] = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self.audio = SimpleNamespace(speech=SimpleNamespace(create=self._speech))
+
+    async def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        if kwargs.get("stream"):
+            return _Stream(response)
+        message = SimpleNamespace(content=response)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    async def _speech(self, **kwargs):
+        return SimpleNamespace(content=b"mp3")
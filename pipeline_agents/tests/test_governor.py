@@ -0,0 +1,103 @@
+import asyncio
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from backend import metrics
+from pipeline_agents import governor
+
+
+@override_settings(
+    LLM_MAX_CONCURRENCY=3,
+    LLM_CLASS_CONCURRENCY={"interactive": 2, "tts": 1, "batch": 1},
+    LLM_QUEUE_TIMEOUT={"interactive": 0.2, "tts": 0.2, "batch": 0.2},
+)
+class GovernorTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        patcher = mock.patch.object(governor, "_local", governor._LocalBackend())
+        self.backend = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _gauges(self):
+        return metrics.snapshot()["gauges"]
+
+    def test_slots_are_counted_and_released(self):
+        with governor.slot(governor.TTS):
+            self.assertEqual(self._gauges()["llm.tts.running"], 1)
+        self.assertEqual(self._gauges()["llm.tts.running"], 0)
+        self.assertEqual(metrics.snapshot()["counters"]["llm.tts.acquired"], 1)
+
+    def test_a_full_class_times_out_with_overloaded(self):
+        with governor.slot(governor.TTS):
+            with self.assertRaises(governor.Overloaded):
+                with governor.slot(governor.TTS):
+                    pass  # pragma: no cover
+        self.assertEqual(metrics.snapshot()["counters"]["llm.tts.timeouts"], 1)
+        self.assertEqual(self._gauges()["llm.tts.queued"], 0)  # left the queue
+
+    def test_the_total_budget_caps_every_class(self):
+        with governor.slot(governor.INTERACTIVE), governor.slot(governor.INTERACTIVE):
+            with governor.slot(governor.TTS):
+                with self.assertRaises(governor.Overloaded):
+                    with governor.slot(governor.BATCH):
+                        pass  # pragma: no cover
+
+    def test_waiting_higher_priority_calls_go_first(self):
+        now = time.time()
+        self.backend.try_acquire(governor.INTERACTIVE, "a", now, now + 60)
+        self.backend.try_acquire(governor.INTERACTIVE, "b", now, now + 60)
+        # Interactive is full, so this one queues…
+        self.assertFalse(
+            self.backend.try_acquire(governor.INTERACTIVE, "c", now, now + 60)
+        )
+        # …and TTS may not overtake it although its own budget is free.
+        self.assertFalse(self.backend.try_acquire(governor.TTS, "d", now, now + 60))
+        self.backend.release(governor.INTERACTIVE, "a")
+        self.assertTrue(
+            self.backend.try_acquire(governor.INTERACTIVE, "c", now, now + 60)
+        )
+        self.assertTrue(self.backend.try_acquire(governor.TTS, "d", now, now + 60))
+
+    def test_async_slots_wait_without_blocking_the_loop(self):
+        async def scenario():
+            order = []
+
+            async def hold():
+                async with governor.aslot(governor.BATCH):
+                    order.append("first")
+                    await asyncio.sleep(0.1)
+
+            async def wait():
+                await asyncio.sleep(0.01)
+                async with governor.aslot(governor.BATCH):
+                    order.append("second")
+
+            await asyncio.gather(hold(), wait())
+            return order
+
+        self.assertEqual(asyncio.run(scenario()), ["first", "second"])
+
+    def test_unknown_class(self):
+        with self.assertRaises(ValueError):
+            with governor.slot("bulk"):
+                pass  # pragma: no cover
+
+
+class BackendSelectionTests(SimpleTestCase):
+    def test_local_cache_keeps_slots_in_process(self):
+        self.assertIs(governor._backend(), governor._local)
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "redis://localhost:6379",
+            }
+        }
+    )
+    @mock.patch.object(governor, "_redis_backend", None)
+    def test_redis_cache_shares_slots_across_workers(self):
+        self.assertIsInstance(governor._backend(), governor._RedisBackend)
@@ -0,0 +1,114 @@
+from unittest import mock
+
+from django.test import override_settings
+
+from internships.tests.utils import APITestCase, make_user
+from pipeline_agents import memory
+from pipeline_agents.tests.fakes import FakeOpenAI
+from profiles.models import AgentMessage, ConversationSummary
+
+INTERN = AgentMessage.AgentType.INTERN
+
+
+@override_settings(AGENT_HISTORY_MAX_MESSAGES=4, AGENT_HISTORY_TOKEN_BUDGET=1000)
+class MemoryTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = make_user("intern@example.com")
+        self.messages = [
+            AgentMessage.objects.create(
+                user=self.user,
+                agent_type=INTERN,
+                role="user" if i % 2 == 0 else "assistant",
+                content=f"message {i}",
+            )
+            for i in range(12)
+        ]
+        self.latest = self.messages[-1]
+
+    def _fake(self, *responses):
+        fake = FakeOpenAI(*responses)
+        patcher = mock.patch.object(memory, "client", fake)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return fake
+
+    async def _summarise_through(self, message, content="earlier"):
+        await ConversationSummary.objects.acreate(
+            user=self.user,
+            agent_type=INTERN,
+            content=content,
+            through_message_id=message.id,
+        )
+
+    async def _window(self):
+        return await memory.load_window(self.user, INTERN, before_id=self.latest.id)
+
+    async def test_window_is_the_newest_messages_after_the_checkpoint(self):
+        await self._summarise_through(self.messages[1])
+        window = await self._window()
+        self.assertEqual(window.summary, "earlier")
+        self.assertEqual(
+            [m.id for m in window.messages], [m.id for m in self.messages[7:11]]
+        )
+        self.assertEqual(window.fold_before_id, self.messages[7].id)
+
+    async def test_nothing_to_fold_when_everything_fits(self):
+        await self._summarise_through(self.messages[8])
+        window = await self._window()
+        self.assertEqual(len(window.messages), 2)
+        self.assertEqual(window.fold_before_id, 0)
+
+    async def test_over_budget_messages_are_stale(self):
+        await self._summarise_through(self.messages[8])
+        with override_settings(AGENT_HISTORY_TOKEN_BUDGET=10):
+            window = await self._window()
+        self.assertEqual([m.id for m in window.messages], [self.messages[10].id])
+        self.assertEqual(window.fold_before_id, self.messages[10].id)
+
+    async def test_fold_pages_through_the_whole_gap_oldest_first(self):
+        await self._summarise_through(self.messages[1])
+        fake = self._fake("summary 1", "summary 2")
+        with mock.patch.object(memory, "FOLD_PAGE", 3):
+            await memory.fold(self.user, await self._window())
+
+        # messages 2…6 sat between the checkpoint and the window
+        sent = [call["messages"][1]["content"] for call in fake.calls]
+        self.assertIn("Current summary:\nearlier", sent[0])
+        self.assertIn("message 2", sent[0])
+        self.assertIn("message 4", sent[0])
+        self.assertIn("Current summary:\nsummary 1", sent[1])
+        self.assertIn("message 6", sent[1])
+        self.assertNotIn("message 7", sent[1])
+        summary = await ConversationSummary.objects.aget(user=self.user)
+        self.assertEqual(summary.content, "summary 2")
+        self.assertEqual(summary.through_message_id, self.messages[6].id)
+        self.assertEqual(summary.messages_summarized, 5)
+
+    async def test_first_fold_creates_the_summary(self):
+        self._fake("summary")
+        await memory.fold(self.user, await self._window())
+        summary = await ConversationSummary.objects.aget(user=self.user)
+        self.assertEqual(summary.through_message_id, self.messages[6].id)
+        self.assertEqual(summary.messages_summarized, 7)
+
+    async def test_a_concurrent_fold_wins(self):
+        await self._summarise_through(self.messages[1])
+        window = await self._window()
+        await ConversationSummary.objects.aupdate(
+            through_message_id=self.messages[4].id
+        )
+        fake = self._fake("lost")
+        await memory.fold(self.user, window)
+        self.assertEqual(len(fake.calls), 1)
+        summary = await ConversationSummary.objects.aget(user=self.user)
+        self.assertEqual(summary.through_message_id, self.messages[4].id)
+        self.assertEqual(summary.content, "earlier")
+
+    async def test_failures_leave_the_checkpoint_alone(self):
+        await self._summarise_through(self.messages[1])
+        self._fake(RuntimeError("down"))
+        with self.assertLogs("pipeline_agents.memory", "ERROR"):
+            await memory.fold(self.user, await self._window())
+        summary = await ConversationSummary.objects.aget(user=self.user)
+        self.assertEqual(summary.through_message_id, self.messages[1].id)
@@ -0,0 +1,49 @@
+import json
+
+from accounts.models import User
+from internships.tests.utils import APITestCase
+from pipeline_agents.employer_agent import EMPLOYER_AGENT
+from pipeline_agents.profile_builder import PROFILE_BUILDER_AGENT
+from pipeline_agents.registry import ToolContext
+from profiles.models import Profile
+
+
+class RegistryTests(APITestCase):
+    def test_agents_are_compiled_with_their_schemas(self):
+        self.assertEqual(
+            set(PROFILE_BUILDER_AGENT.tools),
+            {"set_profile_fields_v1", "navigate_to_v1"},
+        )
+        self.assertEqual(len(EMPLOYER_AGENT.schemas), 5)
+        for agent in (PROFILE_BUILDER_AGENT, EMPLOYER_AGENT):
+            for name, tool in agent.tools.items():
+                self.assertIs(tool.schema, agent.schemas[list(agent.tools).index(name)])
+                self.assertEqual(tool.schema["function"]["name"], name)
+
+    async def test_tools_act_for_the_user_bound_at_call_time(self):
+        alice = await Profile.objects.acreate(user=await self._user("alice"))
+        bob = await Profile.objects.acreate(user=await self._user("bob"))
+        invoke = PROFILE_BUILDER_AGENT.tools["set_profile_fields_v1"].invoke
+        for profile, headline in ((alice, "Alice's"), (bob, "Bob's")):
+            result = await invoke(
+                ToolContext(user_email=profile.user.email),
+                {"payload_json": json.dumps({"headline": headline})},
+            )
+            self.assertTrue(result.startswith("profile_updated"))
+        await alice.arefresh_from_db()
+        await bob.arefresh_from_db()
+        self.assertEqual((alice.headline, bob.headline), ("Alice's", "Bob's"))
+
+    async def test_tools_without_context(self):
+        invoke = EMPLOYER_AGENT.tools["navigate_to_v1"].invoke
+        self.assertEqual(
+            await invoke(ToolContext("x@example.com"), {"path": "/"}), "ok"
+        )
+
+    async def test_empty_payloads_are_no_ops(self):
+        invoke = EMPLOYER_AGENT.tools["set_company_fields_v1"].invoke
+        self.assertEqual(await invoke(ToolContext("x@example.com"), {}), "no_changes")
+
+    @staticmethod
+    async def _user(name):
+        return await User.objects.acreate(email=f"{name}@example.com")
@@ -0,0 +1,47 @@
+# Generated by Django 5.2 on 2026-10-17 00:39
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles", "0003_agentmessage_agent_type"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ConversationSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("content", models.TextField(blank=True)),
+                ("through_message_id", models.PositiveBigIntegerField(default=0)),
+                ("messages_summarized", models.PositiveIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="agentmessage",
+            index=models.Index(fields=["user", "id"], name="agentmessage_user_id_idx"),
+        ),
+        migrations.AddField(
+            model_name="conversationsummary",
+            name="user",
+            field=models.OneToOneField(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="conversation_summary",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2 on 2026-10-17 00:42
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def tag_employer_transcripts(apps, schema_editor):
+    # Until now every message was saved as "intern"; employer accounts only
+    # ever talk to the employer assistant.
+    for name in ("AgentMessage", "ConversationSummary"):
+        apps.get_model("profiles", name).objects.filter(user__role="EMPLOYER").update(
+            agent_type="employer"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("profiles", "0004_conversation_summary"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="agentmessage",
+            name="agentmessage_user_id_idx",
+        ),
+        migrations.AddField(
+            model_name="conversationsummary",
+            name="agent_type",
+            field=models.CharField(
+                choices=[("intern", "Intern"), ("employer", "Employer")],
+                default="intern",
+                max_length=20,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="conversationsummary",
+            name="user",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="conversation_summaries",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="agentmessage",
+            index=models.Index(
+                fields=["user", "agent_type", "created_at", "id"],
+                name="agentmessage_history_idx",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="conversationsummary",
+            constraint=models.UniqueConstraint(
+                fields=("user", "agent_type"), name="conversationsummary_unique"
+            ),
+        ),
+        migrations.RunPython(tag_employer_transcripts, migrations.RunPython.noop),
+    ]
@@ -110,7 +110,8 @@ class AgentMessage(models.Model):
         related_name="agent_messages",
     )
     role = models.CharField(max_length=9, choices=Role.choices)
-    agent_type = models.CharField(  # 🔥 New field
+    # Which assistant the message belongs to; each keeps its own transcript
+    agent_type = models.CharField(
         max_length=20,
         choices=AgentType.choices,
         default=AgentType.INTERN,
@@ -120,7 +121,50 @@ class AgentMessage(models.Model):
 
     class Meta:
         ordering = ("created_at",)
+        indexes = [
+            # History pages and the prompt window: one transcript, newest first
+            models.Index(
+                fields=["user", "agent_type", "created_at", "id"],
+                name="agentmessage_history_idx",
+            ),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover
         preview = (self.content[:40] + "…") if len(self.content) > 40 else self.content
         return f"{self.user.email} [{self.agent_type} | {self.role}] {preview}"
+
+
+class ConversationSummary(models.Model):
+    """
+    Rolling summary of a user's chat with one agent up to (and including)
+    message ``through_message_id``; later messages go into the prompt
+    verbatim. Maintained by pipeline_agents/memory.py.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="conversation_summaries",
+    )
+    agent_type = models.CharField(
+        max_length=20,
+        choices=AgentMessage.AgentType.choices,
+        default=AgentMessage.AgentType.INTERN,
+    )
+    content = models.TextField(blank=True)
+    through_message_id = models.PositiveBigIntegerField(default=0)
+    messages_summarized = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "agent_type"], name="conversationsummary_unique"
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover
+        return (
+            f"{self.user.email} [{self.agent_type}] summary through "
+            f"#{self.through_message_id}"
+        )
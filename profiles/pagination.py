@@ -0,0 +1,11 @@
+from backend.pagination import KeysetPagination
+
+
+class AgentHistoryPagination(KeysetPagination):
+    """
+    One agent transcript, newest first (`next` = older turns); backed by
+    `agentmessage_history_idx`.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = 50
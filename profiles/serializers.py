@@ -130,3 +130,55 @@ class ProfileSerializer(serializers.ModelSerializer):
             self._sync_educations(instance, educations_data)
 
         return instance
+
+
+# ────────────────────────────────────────────────────────────────
+# Read-only profile card for employers (candidate discovery)
+# ────────────────────────────────────────────────────────────────
+class CandidateSerializer(serializers.ModelSerializer):
+    availability = AvailabilitySerializer(read_only=True)
+    skills = SkillSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Profile
+        fields = (
+            "id",
+            "headline",
+            "bio",
+            "city",
+            "state",
+            "country",
+            "availability",
+            "skills",
+        )
+        read_only_fields = fields
+
+
+class ApplicantProfileSerializer(serializers.ModelSerializer):
+    """
+    Compact profile embedded in an employer's applicant list. Expects
+    ``skills`` and ``educations`` prefetched and ``availability`` joined.
+    """
+
+    availability = AvailabilitySerializer(read_only=True)
+    skills = SkillSerializer(many=True, read_only=True)
+    latest_education = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Profile
+        fields = (
+            "id",
+            "headline",
+            "city",
+            "state",
+            "country",
+            "availability",
+            "skills",
+            "latest_education",
+        )
+        read_only_fields = fields
+
+    def get_latest_education(self, obj: Profile):
+        # .all() so the prefetch cache is used; Education orders by -start_date
+        educations = list(obj.educations.all())
+        return EducationSerializer(educations[0]).data if educations else None
@@ -0,0 +1,55 @@
+"""
+Signal handlers for the profiles app (connected in ProfilesConfig.ready).
+
+• Bumps the "skills" cache namespace (backend/caching.py) so the cached
+  skill list and internship listings pick up new or renamed skills.
+• Touches ``Profile.updated_at`` when nested data (availability, educations,
+  skills) changes, so it can serve as the /api/profile/me/ validator.
+• Bumps the "profiles" namespace on any of those changes; in-memory indexes
+  over profiles (internships.candidates) rebuild when it moves.
+"""
+
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from backend.caching import bump_version
+
+from .models import Availability, Education, Profile, Skill
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+def _invalidate_cache(sender, **kwargs):
+    bump_version("skills")
+
+
+# ───────────────────────── profile freshness ─────────────────────────
+def touch_profiles(*profile_ids) -> None:
+    Profile.objects.filter(pk__in=profile_ids).update(updated_at=timezone.now())
+    bump_version("profiles")
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def _profiles_changed(sender, **kwargs):
+    bump_version("profiles")
+
+
+@receiver(post_save, sender=Availability)
+@receiver(post_delete, sender=Availability)
+@receiver(post_save, sender=Education)
+@receiver(post_delete, sender=Education)
+def _touch_on_nested_change(sender, instance, raw=False, **kwargs):
+    if not raw:
+        touch_profiles(instance.profile_id)
+
+
+@receiver(m2m_changed, sender=Profile.skills.through)
+def _touch_on_skills_change(sender, instance, action, reverse, pk_set, **kwargs):
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        touch_profiles(instance.pk)
+    elif pk_set:
+        touch_profiles(*pk_set)
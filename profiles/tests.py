@@ -0,0 +1,157 @@
+import asyncio
+import json
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from internships.tests.utils import APITestCase, make_intern, make_user
+from pipeline_agents import governor, streaming
+from pipeline_agents.tests.fakes import FakeOpenAI, text, tool_call
+
+from .models import AgentMessage
+
+
+class ProfileBuilderAgentTests(APITestCase):
+    url = "/api/agent/profile-builder/"
+
+    def setUp(self):
+        super().setUp()
+        self.profile = make_intern()
+        self.user = self.profile.user
+        self.lock_key = f"profile-builder-lock-{self.user.id}"
+
+    def _fake(self, *responses):
+        fake = FakeOpenAI(*responses)
+        patcher = mock.patch("pipeline_agents.streaming.client", fake)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return fake
+
+    async def _post(self, body, auth=True):
+        headers = {}
+        if auth:
+            headers["Authorization"] = f"Bearer {AccessToken.for_user(self.user)}"
+        return await self.async_client.post(
+            self.url, body, content_type="application/json", headers=headers
+        )
+
+    async def _lines(self, body):
+        response = await self._post(body)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        raw = b"".join([chunk async for chunk in response.streaming_content])
+        return [json.loads(line) for line in raw.splitlines()]
+
+    async def test_streams_tokens_then_a_final_line(self):
+        self._fake([text("Hel"), text("lo")])
+        lines = await self._lines({"message": "Hi"})
+        self.assertEqual([line["delta"] for line in lines[:-1]], ["Hel", "lo"])
+        self.assertTrue(lines[-1]["done"])
+        self.assertIn("audio_base64", lines[-1])
+        self.assertNotIn("profile", lines[-1])
+        stored = [
+            (m.role, m.content)
+            async for m in AgentMessage.objects.filter(user=self.user).order_by("id")
+        ]
+        self.assertEqual(stored, [("user", "Hi"), ("assistant", "Hello")])
+        self.assertIsNone(await cache.aget(self.lock_key))
+
+    async def test_tool_calls_run_and_the_profile_comes_back(self):
+        fake = self._fake(
+            [tool_call("navigate_to_v1", {"path": "/profile"})], [text("Opened")]
+        )
+        lines = await self._lines({"message": "Open my profile"})
+        self.assertEqual(json.loads(lines[0]["delta"]), {"navigate": "/profile"})
+        self.assertEqual(lines[1]["delta"], "Opened")
+        self.assertEqual(lines[-1]["profile"]["headline"], "Student")
+        self.assertEqual(
+            [call["model"] for call in fake.calls], ["gpt-4o-mini", "gpt-4o"]
+        )
+        self.assertEqual(fake.calls[1]["messages"][-1]["role"], "tool")
+
+    async def test_summary_is_folded_after_the_lock_is_released(self):
+        self._fake([text("Hello")])
+        seen = []
+
+        async def fold(user, window):
+            seen.append(await cache.aget(self.lock_key))
+
+        with mock.patch("pipeline_agents.memory.fold", fold):
+            await self._lines({"message": "Hi"})
+            await asyncio.gather(*streaming._detached)
+        self.assertEqual(seen, [None])
+
+    async def test_upstream_failure_ends_with_an_error_line(self):
+        self._fake(RuntimeError("upstream down"))
+        with self.assertLogs("pipeline_agents.streaming", "ERROR"):
+            lines = await self._lines({"message": "Hi"})
+        self.assertEqual(lines, [{"error": "upstream down"}])
+        self.assertIsNone(await cache.aget(self.lock_key))
+
+    async def test_an_expired_turn_leaves_the_next_turns_lock(self):
+        self._fake([text("Hello")])
+        response = await self._post({"message": "Hi"})
+        await cache.aset(self.lock_key, "next-turn")  # ours expired, re-taken
+        [chunk async for chunk in response.streaming_content]
+        self.assertEqual(await cache.aget(self.lock_key), "next-turn")
+
+    @override_settings(
+        LLM_QUEUE_TIMEOUT={"interactive": 0.01, "tts": 0.01, "batch": 0.01}
+    )
+    async def test_no_upstream_capacity_is_a_503(self):
+        fake = self._fake([text("Hello")])
+        with mock.patch.object(governor, "_attempt", return_value=False):
+            response = await self._post({"message": "Hi"})
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "5")
+        self.assertEqual(fake.calls, [])
+        self.assertFalse(await AgentMessage.objects.filter(user=self.user).aexists())
+        self.assertIsNone(await cache.aget(self.lock_key))
+
+    async def test_rejects_bad_requests(self):
+        self.assertEqual(
+            (await self._post({"message": "Hi"}, auth=False)).status_code, 401
+        )
+        self.assertEqual((await self._post({"message": " "})).status_code, 400)
+        await cache.aset(self.lock_key, True)
+        self.assertEqual((await self._post({"message": "Hi"})).status_code, 429)
+
+
+class AgentHistoryTests(APITestCase):
+    url = "/api/agent/profile-builder/history/"
+
+    def setUp(self):
+        super().setUp()
+        self.user = make_user("intern@example.com")
+        for i in range(5):
+            self._message(self.user, AgentMessage.AgentType.INTERN, f"intern {i}")
+        self._message(self.user, AgentMessage.AgentType.EMPLOYER, "employer 0")
+        self._message(make_user("other@example.com"), "intern", "someone else")
+        self.client.force_authenticate(self.user)
+
+    @staticmethod
+    def _message(user, agent_type, content):
+        AgentMessage.objects.create(
+            user=user, agent_type=agent_type, role="user", content=content
+        )
+
+    def test_pages_newest_first_down_to_the_first_message(self):
+        contents, url = [], self.url + "?page_size=2"
+        while url:
+            page = self.client.get(url).data
+            self.assertLessEqual(len(page["results"]), 2)
+            contents += [row["content"] for row in page["results"]]
+            url = page["next"]
+        self.assertEqual(contents, [f"intern {i}" for i in reversed(range(5))])
+
+    def test_each_agent_has_its_own_history(self):
+        response = self.client.get("/api/agent/employer-assistant/history/")
+        self.assertEqual(
+            [row["content"] for row in response.data["results"]], ["employer 0"]
+        )
+
+    def test_requires_authentication(self):
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get(self.url).status_code, 401)
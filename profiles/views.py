@@ -3,11 +3,14 @@ from __future__ import annotations
 
 from rest_framework import generics, permissions
 
+from backend.caching import CachedResponseMixin
+from backend.conditional import ConditionalGetMixin
+
 from .models import Profile, Skill
 from .serializers import ProfileSerializer, SkillSerializer
 
 
-class ProfileMeView(generics.RetrieveUpdateAPIView):
+class ProfileMeView(ConditionalGetMixin, generics.RetrieveUpdateAPIView):
     """
     GET    /api/profile/me/   -> retrieve your profile
     PUT    /api/profile/me/   -> replace profile (nested payload)
@@ -16,6 +19,17 @@ class ProfileMeView(generics.RetrieveUpdateAPIView):
 
     serializer_class = ProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
+    conditional_per_user = True
+
+    def get_validator(self, request):
+        # Nested availability / education / skills edits touch updated_at
+        # too (profiles.signals), so it versions the whole payload.
+        updated_at = (
+            Profile.objects.filter(user=request.user)
+            .values_list("updated_at", flat=True)
+            .first()
+        )
+        return None if updated_at is None else ([updated_at], updated_at)
 
     def get_object(self):
         # Auto-create an empty profile on first access
@@ -23,7 +37,7 @@ class ProfileMeView(generics.RetrieveUpdateAPIView):
         return profile
 
 
-class SkillListView(generics.ListAPIView):
+class SkillListView(CachedResponseMixin, generics.ListAPIView):
     """
     Public list of all canonical skills (for front-end autocomplete).
     """
@@ -31,3 +45,4 @@ class SkillListView(generics.ListAPIView):
     queryset = Skill.objects.order_by("name")
     serializer_class = SkillSerializer
     permission_classes = [permissions.AllowAny]
+    cache_namespaces = ("skills",)
@@ -14,6 +14,8 @@ from rest_framework import parsers, permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from pipeline_agents import governor
+
 logger = logging.getLogger(__name__)
 
 # ------------------------------------------------------------------
@@ -76,6 +78,15 @@ def _transcode_to_wav(src: bytes, suffix: str | None) -> Optional[bytes]:
         return None
 
 
+def _overloaded(exc: Exception) -> Response:
+    """503 when the OpenAI concurrency governor had no slot in time."""
+    return Response(
+        {"detail": str(exc)},
+        status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": "5"},
+    )
+
+
 # ────────────────────────────────────────────────────────────────
 # Speech-to-Text
 # ────────────────────────────────────────────────────────────────
@@ -164,7 +175,10 @@ class SpeechToTextView(APIView):
 
         # 5 ► Call Whisper -------------------------------------------
         try:
-            tx = client.audio.transcriptions.create(model="whisper-1", file=bio)
+            with governor.slot(governor.INTERACTIVE):
+                tx = client.audio.transcriptions.create(model="whisper-1", file=bio)
+        except governor.Overloaded as exc:
+            return _overloaded(exc)
         except Exception as exc:  # noqa: BLE001
             logger.exception("Whisper transcription failed")
             return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
@@ -198,12 +212,15 @@ class TextToSpeechView(APIView):
         voice = request.data.get("voice", "alloy")
 
         try:
-            speech = client.audio.speech.create(
-                model="gpt-4o-mini-tts",
-                voice=voice,
-                input=text,
-                response_format="mp3",
-            )
+            with governor.slot(governor.TTS):
+                speech = client.audio.speech.create(
+                    model="gpt-4o-mini-tts",
+                    voice=voice,
+                    input=text,
+                    response_format="mp3",
+                )
+        except governor.Overloaded as exc:
+            return _overloaded(exc)
         except Exception as exc:  # noqa: BLE001
             logger.exception("TTS generation failed")
             return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)